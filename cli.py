@@ -24,6 +24,12 @@ from rich import box
 import threading
 import signal
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # プロジェクト内モジュール
 from main import InsectObserverSystem, setup_logging
 
@@ -218,7 +224,16 @@ def status(controller: CLIController, output_json, detailed, watch):
         status_data = controller.system.get_system_status()
         
         if output_json:
-            console.print_json(json.dumps(status_data, indent=2, ensure_ascii=False))
+            if ORJSON_AVAILABLE:
+                # モデルのクラス名（model_info.classes）はintキーの辞書
+                status_json = orjson.dumps(
+                    status_data,
+                    option=(orjson.OPT_INDENT_2 | orjson.OPT_NAIVE_UTC
+                            | orjson.OPT_NON_STR_KEYS)
+                ).decode('utf-8')
+            else:
+                status_json = json.dumps(status_data, indent=2, ensure_ascii=False)
+            console.print_json(status_json)
         else:
             _display_status_table(status_data, detailed)
     
@@ -13,6 +13,12 @@ import logging
 from typing import Dict, Any, List, Optional
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from models.system_models import SystemConfiguration
 
 
@@ -61,8 +67,12 @@ class ConfigManager:
             
             self.logger.info(f"Loading configuration from: {self.config_path}")
             
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            # orjson.JSONDecodeError は json.JSONDecodeError のサブクラス
+            if ORJSON_AVAILABLE:
+                config_data = orjson.loads(self.config_path.read_bytes())
+            else:
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    config_data = json.load(f)
             
             self.config = SystemConfiguration.from_dict(config_data)
             
@@ -11,7 +11,7 @@
 
 import logging
 import csv
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, TextIO
 import numpy as np
 import pandas as pd
 from dataclasses import dataclass, asdict
@@ -102,6 +102,10 @@ class DetectionProcessor:
             'max_confidence', 'processing_time_ms', 'x_center', 'y_center',
             'width', 'height', 'confidence', 'class_id', 'quality_score'
         ]
+        # 当日分CSVの追記ハンドル（日付が変わるまで開いたまま保持）
+        self._csv_file: Optional[TextIO] = None
+        self._csv_writer = None
+        self._csv_date = ""
         
         self.logger.info("Detection processor initialized")
     
@@ -330,54 +334,74 @@ class DetectionProcessor:
             return detection.confidence
     
     def _write_to_csv(self, record: DetectionRecord) -> None:
-        """CSV形式でデータ出力"""
+        """CSV形式でデータ出力（1記録分の行をまとめて1回の書き込みで追記）"""
         try:
-            # ファイルパス生成
-            date_str = datetime.fromisoformat(record.timestamp).strftime('%Y%m%d')
-            csv_filename = f"detection_log_{date_str}.csv"
-            csv_path = self.output_dir / csv_filename
+            # 検出がない場合も1行記録
+            if len(record.detections) == 0:
+                rows = [[
+                    record.timestamp, 0, 0.0, 0.0, 0.0, record.processing_time_ms,
+                    '', '', '', '', '', '', 0.0
+                ]]
+            else:
+                # 各検出結果を個別に記録
+                total_confidence = sum(d.confidence for d in record.detections)
+                avg_confidence = total_confidence / len(record.detections)
+                max_confidence = max(d.confidence for d in record.detections)
+                
+                rows = [[
+                    record.timestamp, record.detection_count, total_confidence,
+                    avg_confidence, max_confidence, record.processing_time_ms,
+                    detection.x_center, detection.y_center, detection.width,
+                    detection.height, detection.confidence, detection.class_id,
+                    self._calculate_quality_score(detection)
+                ] for detection in record.detections]
             
-            # ファイル存在確認とヘッダ書き込み
-            file_exists = csv_path.exists()
+            date_str = datetime.fromisoformat(record.timestamp).strftime('%Y%m%d')
+            writer = self._get_csv_writer(date_str)
+            writer.writerows(rows)
+            self._csv_file.flush()
+            self.stats.csv_records_written += len(rows)
             
-            with open(csv_path, 'a', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
-                
-                # ヘッダ書き込み（新規ファイルの場合）
-                if not file_exists:
-                    writer.writerow(self.csv_headers)
-                
-                # 検出がない場合も1行記録
-                if len(record.detections) == 0:
-                    writer.writerow([
-                        record.timestamp, 0, 0.0, 0.0, 0.0, record.processing_time_ms,
-                        '', '', '', '', '', '', 0.0
-                    ])
-                    self.stats.csv_records_written += 1
-                else:
-                    # 各検出結果を個別に記録
-                    total_confidence = sum(d.confidence for d in record.detections)
-                    avg_confidence = total_confidence / len(record.detections)
-                    max_confidence = max(d.confidence for d in record.detections)
-                    
-                    for detection in record.detections:
-                        quality_score = self._calculate_quality_score(detection)
-                        
-                        writer.writerow([
-                            record.timestamp, record.detection_count, total_confidence,
-                            avg_confidence, max_confidence, record.processing_time_ms,
-                            detection.x_center, detection.y_center, detection.width,
-                            detection.height, detection.confidence, detection.class_id,
-                            quality_score
-                        ])
-                        
-                        self.stats.csv_records_written += 1
-            
-            self.logger.debug(f"Data written to CSV: {csv_path}")
+            self.logger.debug("Data written to CSV: %s", self._csv_file.name)
             
         except Exception as e:
             self.logger.error(f"CSV writing failed: {e}")
     
+    def _get_csv_writer(self, date_str: str):
+        """
+        指定日のCSV追記用writer取得（日付が変わった場合のみファイルを開き直す）
+        
+        Args:
+            date_str: 日付（YYYYMMDD）
+            
+        Returns:
+            csv.writer: 追記用writer
+        """
+        if self._csv_file is not None and self._csv_date == date_str:
+            return self._csv_writer
+        
+        self._close_csv()
+        
+        # ファイルパス生成
+        csv_path = self.output_dir / f"detection_log_{date_str}.csv"
+        self._csv_file = open(csv_path, 'a', newline='', encoding='utf-8')
+        self._csv_writer = csv.writer(self._csv_file)
+        self._csv_date = date_str
+        
+        # ヘッダ書き込み（新規ファイルの場合）
+        if self._csv_file.tell() == 0:
+            self._csv_writer.writerow(self.csv_headers)
+        
+        return self._csv_writer
+    
+    def _close_csv(self) -> None:
+        """CSV追記ハンドルを閉じる"""
+        if self._csv_file is not None:
+            self._csv_file.close()
+            self._csv_file = None
+            self._csv_writer = None
+            self._csv_date = ""
+    
     def _update_history(self, record: DetectionRecord) -> None:
         """履歴データ更新"""
         try:
@@ -595,6 +619,7 @@ class DetectionProcessor:
         """リソース解放"""
         try:
             # 最終データ保存
+            self._close_csv()
             if self.detection_history:
                 self.export_data("json")
             
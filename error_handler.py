@@ -10,9 +10,11 @@
 """
 
 import logging
+import logging.handlers
 import traceback
 import json
-import time
+import queue
+import sys
 from typing import Dict, Any, Optional, List, Callable, Union
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
@@ -20,7 +22,20 @@ from enum import Enum
 from pathlib import Path
 import threading
 from collections import deque, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import functools
+import itertools
+
+import numpy as np
+
+
+def _write_text(path: Path, payload: str) -> None:
+    """テキストをファイルへ書き込む（I/Oスレッドで実行）"""
+    try:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(payload)
+    except Exception as e:
+        logging.getLogger(__name__).error(f"エラーファイル書き込み失敗: {path}: {e}")
 
 
 class ErrorSeverity(Enum):
@@ -46,6 +61,16 @@ class ErrorCategory(Enum):
     UNKNOWN = "unknown"          # 不明なエラー
 
 
+# 重要度からloggingレベルへの対応表
+_SEVERITY_LOG_LEVELS = {
+    ErrorSeverity.DEBUG: logging.DEBUG,
+    ErrorSeverity.INFO: logging.INFO,
+    ErrorSeverity.WARNING: logging.WARNING,
+    ErrorSeverity.ERROR: logging.ERROR,
+    ErrorSeverity.CRITICAL: logging.CRITICAL,
+}
+
+
 @dataclass
 class ErrorContext:
     """エラーコンテキスト情報"""
@@ -57,6 +82,10 @@ class ErrorContext:
     max_retries: int = 3
     recovery_attempted: bool = False
     recovery_successful: bool = False
+    
+    def __post_init__(self):
+        """モジュール名をインターンし、集計キーのハッシュ・メモリを共有"""
+        self.module_name = sys.intern(self.module_name)
 
 
 @dataclass
@@ -78,15 +107,115 @@ class ErrorRecord:
 
 @dataclass
 class ErrorStatistics:
-    """エラー統計情報"""
+    """
+    エラー統計情報
+    
+    件数・エラー率は起動からの累計、最頻出エラー・リカバリー成功率は
+    保持中のエラー履歴（最新1000件）が対象。
+    """
     total_errors: int = 0
-    errors_by_severity: Dict[str, int] = field(default_factory=dict)
-    errors_by_category: Dict[str, int] = field(default_factory=dict)
+    errors_by_severity: Dict[ErrorSeverity, int] = field(default_factory=dict)
+    errors_by_category: Dict[ErrorCategory, int] = field(default_factory=dict)
     errors_by_module: Dict[str, int] = field(default_factory=dict)
     error_rate_per_hour: float = 0.0
     most_frequent_errors: List[Dict[str, Any]] = field(default_factory=list)
     recovery_success_rate: float = 0.0
     average_recovery_time_seconds: float = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """辞書形式に変換 - JSONシリアライゼーション用（Enumキーを文字列化）"""
+        data = asdict(self)
+        data['errors_by_severity'] = {
+            k.value: v for k, v in self.errors_by_severity.items()
+        }
+        data['errors_by_category'] = {
+            k.value: v for k, v in self.errors_by_category.items()
+        }
+        return data
+
+
+class _StringCodes:
+    """文字列 ⇔ 整数コードの対応表"""
+    
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+    
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+class ErrorColumnStore:
+    """
+    エラー履歴の列指向ストア
+    
+    統計集計で走査する項目（メッセージ・リカバリー結果）を整数コードの
+    固定長リングバッファで保持し、レコードオブジェクトを辿らずに
+    np.bincount で集計する。
+    """
+    
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self.message = np.zeros(capacity, dtype=np.uint32)
+        self.recovery_attempted = np.zeros(capacity, dtype=bool)
+        self.recovery_successful = np.zeros(capacity, dtype=bool)
+        self._messages = _StringCodes()
+        self.size = 0
+        self._next = 0
+    
+    def append(self, error: ErrorRecord) -> None:
+        """レコードを追加（満杯時は最古のスロットを上書き）"""
+        # 履歴から消えたメッセージで対応表が膨らみ続けないよう定期的に詰め直す
+        if len(self._messages.values) >= 4 * self.capacity:
+            self._compact_messages()
+        
+        i = self._next
+        self.message[i] = self._messages.encode(error.error_message)
+        self.recovery_attempted[i] = error.context.recovery_attempted
+        self.recovery_successful[i] = error.context.recovery_successful
+        self._next = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+    
+    def update_last_recovery(self, error: ErrorRecord) -> None:
+        """直近に追加したレコードのリカバリー結果を反映"""
+        i = (self._next - 1) % self.capacity
+        self.recovery_attempted[i] = error.context.recovery_attempted
+        self.recovery_successful[i] = error.context.recovery_successful
+    
+    def rebuild(self, errors) -> None:
+        """レコード列から再構築"""
+        self._messages = _StringCodes()
+        self.size = 0
+        self._next = 0
+        for error in errors:
+            self.append(error)
+    
+    def _compact_messages(self) -> None:
+        """保持中のレコードが参照するメッセージのみで対応表を作り直す"""
+        n = self.size
+        used, remapped = np.unique(self.message[:n], return_inverse=True)
+        messages = _StringCodes()
+        for code in used:
+            messages.encode(self._messages.values[code])
+        self.message[:n] = remapped
+        self._messages = messages
+    
+    def most_common_messages(self, limit: int = 10) -> List[tuple]:
+        """件数の多いエラーメッセージ（メッセージ, 件数）"""
+        counts = np.bincount(self.message[:self.size])
+        top = np.argsort(counts, kind='stable')[::-1][:limit]
+        messages = self._messages.values
+        return [(messages[i], int(counts[i])) for i in top if counts[i] > 0]
+    
+    def recovery_counts(self) -> tuple:
+        """(リカバリー試行数, 成功数)"""
+        n = self.size
+        return (int(np.count_nonzero(self.recovery_attempted[:n])),
+                int(np.count_nonzero(self.recovery_successful[:n])))
 
 
 class RecoveryStrategy:
@@ -102,9 +231,14 @@ class RecoveryStrategy:
 
 class RetryStrategy(RecoveryStrategy):
     """リトライベースのリカバリー戦略"""
-    def __init__(self, max_retries: int = 3, backoff_seconds: float = 1.0):
+    def __init__(self, max_retries: int = 3, backoff_seconds: float = 1.0,
+                 shutdown_event: Optional[threading.Event] = None):
         self.max_retries = max_retries
         self.backoff_seconds = backoff_seconds
+        # 待機中にシャットダウンで中断できるようEvent.waitで待機する
+        self._shutdown_event = shutdown_event or threading.Event()
+        # 指数バックオフの待機時間を事前計算
+        self._waits = [backoff_seconds * (1 << i) for i in range(max_retries + 1)]
     
     def can_handle(self, error: ErrorRecord) -> bool:
         """一時的なエラーに対してリトライ可能か判定"""
@@ -113,8 +247,9 @@ class RetryStrategy(RecoveryStrategy):
     
     def recover(self, error: ErrorRecord) -> bool:
         """指数バックオフでリトライ"""
-        wait_time = self.backoff_seconds * (2 ** error.context.retry_count)
-        time.sleep(wait_time)
+        retry_count = min(error.context.retry_count, self.max_retries)
+        if self._shutdown_event.wait(self._waits[retry_count]):
+            return False  # シャットダウン要求によりリトライ中止
         return True  # リトライ実行を示す
 
 
@@ -139,12 +274,16 @@ class ErrorHandler:
         
         # エラー記録
         self.error_history: deque = deque(maxlen=1000)  # 最新1000件を保持
+        self._error_columns = ErrorColumnStore(self.error_history.maxlen)
         self.error_counts = defaultdict(int)
-        self.module_errors = defaultdict(list)
+        
+        # エラーID採番（next()はGIL下でアトミックなためロック不要）
+        self._id_counter = itertools.count(1)
         
         # リカバリー戦略
+        self._shutdown_event = threading.Event()
         self.recovery_strategies: List[RecoveryStrategy] = [
-            RetryStrategy(),
+            RetryStrategy(shutdown_event=self._shutdown_event),
             RestartStrategy()
         ]
         
@@ -162,19 +301,31 @@ class ErrorHandler:
         self.error_log_path = Path("logs/errors")
         self.error_log_path.mkdir(parents=True, exist_ok=True)
         
+        # ファイル書き込みは専用スレッドで実行（SDカード等での呼び出し元ブロックを回避）
+        self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="error-io")
+        self._log_listener: Optional[logging.handlers.QueueListener] = None
+        
         self._setup_error_logging()
     
     def _setup_error_logging(self):
         """エラー専用ロギング設定"""
-        error_handler = logging.FileHandler(
+        file_handler = logging.FileHandler(
             self.error_log_path / f"errors_{datetime.now().strftime('%Y%m%d')}.log"
         )
-        error_handler.setLevel(logging.WARNING)
         formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
-        error_handler.setFormatter(formatter)
-        self.logger.addHandler(error_handler)
+        file_handler.setFormatter(formatter)
+        
+        # QueueHandler経由でリスナースレッドにファイル出力を委譲
+        log_queue: queue.Queue = queue.Queue(-1)
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(logging.WARNING)
+        self.logger.addHandler(queue_handler)
+        self._log_handler = queue_handler
+        
+        self._log_listener = logging.handlers.QueueListener(log_queue, file_handler)
+        self._log_listener.start()
     
     def handle_error(self, 
                     exception: Exception,
@@ -182,10 +333,12 @@ class ErrorHandler:
                     severity: ErrorSeverity = ErrorSeverity.ERROR,
                     category: ErrorCategory = ErrorCategory.UNKNOWN) -> ErrorRecord:
         """エラーを処理し記録する"""
+        error_id = self._generate_error_id()
+        
         with self.lock:
             # エラーレコード作成
             error_record = ErrorRecord(
-                error_id=self._generate_error_id(),
+                error_id=error_id,
                 timestamp=datetime.now().isoformat(),
                 severity=severity,
                 category=category,
@@ -201,6 +354,7 @@ class ErrorHandler:
             # リカバリー処理
             if severity in [ErrorSeverity.ERROR, ErrorSeverity.CRITICAL]:
                 self._attempt_recovery(error_record)
+                self._error_columns.update_last_recovery(error_record)
             
             # アラート通知（必要に応じて）
             if severity == ErrorSeverity.CRITICAL:
@@ -211,15 +365,15 @@ class ErrorHandler:
     def _generate_error_id(self) -> str:
         """一意のエラーIDを生成"""
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        count = len(self.error_history)
-        return f"ERR-{timestamp}-{count:04d}"
+        count = next(self._id_counter)
+        return f"ERR-{timestamp}-{count:08d}"
     
     def _record_error(self, error: ErrorRecord):
         """エラーを記録"""
         # メモリ内記録
         self.error_history.append(error)
-        self.error_counts[error.severity.value] += 1
-        self.module_errors[error.context.module_name].append(error)
+        self._error_columns.append(error)
+        self.error_counts[error.severity] += 1
         
         # 統計更新
         self._update_statistics(error)
@@ -227,34 +381,26 @@ class ErrorHandler:
         # ファイル記録
         self._save_error_to_file(error)
         
-        # ログ出力
-        log_method = getattr(self.logger, error.severity.value)
-        log_method(
-            f"[{error.category.value}] {error.error_message} "
-            f"(Module: {error.context.module_name})"
+        # ログ出力（%形式の引数でフォーマットをハンドラー側へ遅延）
+        self.logger.log(
+            _SEVERITY_LOG_LEVELS[error.severity],
+            "[%s] %s (Module: %s)",
+            error.category.value, error.error_message, error.context.module_name
         )
     
     def _update_statistics(self, error: ErrorRecord):
         """統計情報を更新"""
-        self.statistics.total_errors += 1
-        
-        # 重要度別カウント
-        severity_key = error.severity.value
-        if severity_key not in self.statistics.errors_by_severity:
-            self.statistics.errors_by_severity[severity_key] = 0
-        self.statistics.errors_by_severity[severity_key] += 1
+        statistics = self.statistics
+        statistics.total_errors += 1
         
-        # カテゴリー別カウント
-        category_key = error.category.value
-        if category_key not in self.statistics.errors_by_category:
-            self.statistics.errors_by_category[category_key] = 0
-        self.statistics.errors_by_category[category_key] += 1
-        
-        # モジュール別カウント
+        # 重要度別・カテゴリー別・モジュール別カウント（起動からの累計）
+        by_severity = statistics.errors_by_severity
+        by_severity[error.severity] = by_severity.get(error.severity, 0) + 1
+        by_category = statistics.errors_by_category
+        by_category[error.category] = by_category.get(error.category, 0) + 1
         module_key = error.context.module_name
-        if module_key not in self.statistics.errors_by_module:
-            self.statistics.errors_by_module[module_key] = 0
-        self.statistics.errors_by_module[module_key] += 1
+        by_module = statistics.errors_by_module
+        by_module[module_key] = by_module.get(module_key, 0) + 1
         
         # エラー率計算
         uptime_hours = (datetime.now() - self.start_time).total_seconds() / 3600
@@ -264,8 +410,20 @@ class ErrorHandler:
     def _save_error_to_file(self, error: ErrorRecord):
         """エラーをファイルに保存"""
         error_file = self.error_log_path / f"error_{error.error_id}.json"
-        with open(error_file, 'w', encoding='utf-8') as f:
-            json.dump(asdict(error), f, ensure_ascii=False, indent=2, default=str)
+        # 記録時点の内容でシリアライズし、書き込みのみI/Oスレッドへ委譲
+        payload = json.dumps(asdict(error), ensure_ascii=False, indent=2, default=str)
+        if self._shutdown_event.is_set():
+            # cleanup後はI/Oスレッドが停止しているため呼び出し元で書き込む
+            _write_text(error_file, payload)
+            return
+        self._io_pool.submit(_write_text, error_file, payload)
+    
+    def flush(self) -> None:
+        """保留中のファイル書き込みの完了を待機"""
+        if self._shutdown_event.is_set():
+            return  # cleanupで書き込み完了まで待機済み
+        # ワーカーは1本のため、空タスクの完了で先行タスクの完了が保証される
+        self._io_pool.submit(lambda: None).result()
     
     def _attempt_recovery(self, error: ErrorRecord):
         """エラーリカバリーを試行"""
@@ -302,27 +460,16 @@ class ErrorHandler:
     def get_statistics(self) -> ErrorStatistics:
         """エラー統計情報を取得"""
         with self.lock:
-            # 最頻出エラーの計算
-            error_messages = defaultdict(int)
-            for error in self.error_history:
-                error_messages[error.error_message] += 1
+            columns = self._error_columns
             
+            # 最頻出エラーの計算
             self.statistics.most_frequent_errors = [
                 {"message": msg, "count": count}
-                for msg, count in sorted(
-                    error_messages.items(),
-                    key=lambda x: x[1],
-                    reverse=True
-                )[:10]
+                for msg, count in columns.most_common_messages(10)
             ]
             
             # リカバリー成功率の計算
-            recovery_attempts = sum(
-                1 for e in self.error_history if e.context.recovery_attempted
-            )
-            recovery_successes = sum(
-                1 for e in self.error_history if e.context.recovery_successful
-            )
+            recovery_attempts, recovery_successes = columns.recovery_counts()
             if recovery_attempts > 0:
                 self.statistics.recovery_success_rate = (
                     recovery_successes / recovery_attempts * 100
@@ -338,7 +485,10 @@ class ErrorHandler:
     def get_errors_by_module(self, module_name: str) -> List[ErrorRecord]:
         """モジュール別のエラーを取得"""
         with self.lock:
-            return self.module_errors.get(module_name, [])
+            return [
+                e for e in self.error_history
+                if e.context.module_name == module_name
+            ]
     
     def clear_resolved_errors(self):
         """解決済みエラーをクリア"""
@@ -347,12 +497,15 @@ class ErrorHandler:
                 (e for e in self.error_history if not e.resolved),
                 maxlen=1000
             )
+            self._error_columns.rebuild(self.error_history)
     
     def export_error_report(self, output_path: Path) -> Path:
         """エラーレポートをエクスポート"""
+        self.flush()
+        
         report = {
             "report_time": datetime.now().isoformat(),
-            "statistics": asdict(self.get_statistics()),
+            "statistics": self.get_statistics().to_dict(),
             "recent_errors": [
                 asdict(e) for e in self.get_recent_errors(50)
             ],
@@ -367,6 +520,24 @@ class ErrorHandler:
             json.dump(report, f, ensure_ascii=False, indent=2, default=str)
         
         return report_file
+    
+    def cleanup(self) -> None:
+        """リソース解放（保留中の書き込みを完了させて停止、2回目以降は何もしない）"""
+        if self._shutdown_event.is_set():
+            return
+        try:
+            # リトライ待機を中断させてからロックを取り、記録中の書き込み依頼を出し切らせる
+            # （以降の記録は _save_error_to_file が同期書き込みに切り替える）
+            self._shutdown_event.set()
+            with self.lock:
+                pass
+            self._io_pool.shutdown(wait=True)
+            if self._log_listener:
+                self._log_listener.stop()
+                self._log_listener = None
+                self.logger.removeHandler(self._log_handler)
+        except Exception as e:
+            self.logger.error(f"Error handler cleanup failed: {e}")
 
 
 def error_handler_decorator(
@@ -444,4 +615,6 @@ if __name__ == "__main__":
     
     # エラーレポートのエクスポート
     report_path = error_handler.export_error_report(Path("logs"))
-    print(f"エラーレポート出力: {report_path}")
\ No newline at end of file
+    print(f"エラーレポート出力: {report_path}")
+    
+    error_handler.cleanup()
\ No newline at end of file
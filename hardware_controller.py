@@ -9,16 +9,22 @@
 - リソース管理
 """
 
+import asyncio
 import logging
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, Tuple
 import numpy as np
-from dataclasses import dataclass
-from pathlib import Path
+from dataclasses import dataclass, fields
+from datetime import datetime
+
+import image_kernels
+from pigpio_pwm import PIGPIO_AVAILABLE, PigpioPWM
 
 # Raspberry Pi関連ライブラリ
 try:
-    from picamera2 import Picamera2
+    from picamera2 import Picamera2, MappedArray
     from picamera2.controls import Controls
     PICAMERA2_AVAILABLE = True
 except ImportError:
@@ -32,8 +38,26 @@ except ImportError:
     GPIO_AVAILABLE = False
     logging.warning("RPi.GPIO not available. GPIO functionality will be disabled.")
 
+# CPU温度（sysfs）
+THERMAL_ZONE_PATH = '/sys/class/thermal/thermal_zone0/temp'
+
+# 状態情報のキャッシュ期間（秒）
+STATUS_CACHE_SECONDS = 1.0
+
+# カメラ安定化待機の上限（秒）
+CAMERA_WARMUP_TIMEOUT = 2.0
+
+# LED明度（256段階）→ PWMデューティ比(0.0-1.0)の変換テーブル
+DUTY_TABLE_SIZE = 256
+_DUTY_TABLE = tuple(i / (DUTY_TABLE_SIZE - 1) for i in range(DUTY_TABLE_SIZE))
 
-@dataclass
+# クラス別ロガー（インスタンス毎のgetLogger呼び出しを避けモジュールで一度だけ取得）
+_camera_logger = logging.getLogger(__name__ + '.CameraController')
+_led_logger = logging.getLogger(__name__ + '.LEDController')
+_hardware_logger = logging.getLogger(__name__ + '.HardwareController')
+
+
+@dataclass(slots=True)
 class HardwareStatus:
     """ハードウェア状態情報"""
     camera_available: bool = False
@@ -46,14 +70,33 @@ class HardwareStatus:
     last_updated: str = ""
 
 
+# 詳細状態に含めるHardwareStatusのフィールド名
+_HARDWARE_STATUS_FIELDS = tuple(f.name for f in fields(HardwareStatus))
+
+
 class CameraController:
     """カメラ専用制御クラス"""
     
+    # シーン明度の閾値と対応する (露出時間[us], アナログゲイン)
+    # 閾値ちょうど(0.3, 0.7)は中間設定に含める
+    _EXPOSURE_THRESHOLDS = np.array([0.3, np.nextafter(0.7, np.inf)])
+    _EXPOSURE_TABLE = (
+        (50000, 2.0),  # 暗いシーン - 露出時間を長く(50ms)
+        (25000, 1.5),  # 中間 - 標準設定(25ms)
+        (10000, 1.0),  # 明るいシーン - 露出時間を短く(10ms)
+    )
+    
     def __init__(self):
         self.picam2: Optional[Picamera2] = None
         self.config: Optional[Dict[str, Any]] = None
-        self.logger = logging.getLogger(__name__ + '.CameraController')
+        self.logger = _camera_logger
         self.is_initialized = False
+        # BGR変換結果の再利用バッファ（C連続配列）
+        self._bgr_buf: Optional[np.ndarray] = None
+        # 最後に適用した (露出時間, アナログゲイン)
+        self._last_controls: Tuple[int, float] = (-1, -1.0)
+        # カメラ情報（構成後は不変のためセットアップ時に一度だけ構築）
+        self._camera_info: Optional[Dict[str, Any]] = None
         
     def setup_camera(self, config: Dict[str, Any]) -> bool:
         """
@@ -72,15 +115,23 @@ class CameraController:
         try:
             self.picam2 = Picamera2()
             
-            # カメラ設定の作成
-            camera_config = self.picam2.create_still_configuration(
-                main={"size": tuple(config.get('resolution', (1920, 1080)))},
-                lores={"size": (640, 480)},
-                display="lores"
-            )
+            # カメラ設定の作成（プレビュー未使用時はloresストリームを確保しない）
+            main_config = {"size": tuple(config.get('resolution', (1920, 1080)))}
+            if config.get('enable_preview', False):
+                camera_config = self.picam2.create_still_configuration(
+                    main=main_config,
+                    lores={"size": (640, 480)},
+                    display="lores"
+                )
+            else:
+                camera_config = self.picam2.create_still_configuration(main=main_config)
             
             self.picam2.configure(camera_config)
             
+            # 撮影結果の受け皿を事前確保（撮影毎の数MB確保を回避）
+            width, height = camera_config["main"]["size"]
+            self._bgr_buf = np.empty((height, width, 3), dtype=np.uint8)
+            
             # カメラ制御設定
             controls = {}
             if 'exposure_time' in config:
@@ -92,11 +143,20 @@ class CameraController:
                 
             if controls:
                 self.picam2.set_controls(controls)
+            self._last_controls = (config.get('exposure_time', -1),
+                                   config.get('analogue_gain', -1.0))
             
             self.picam2.start()
-            time.sleep(2)  # カメラ安定化待機
+            self._wait_for_stable_frame(manual_exposure='exposure_time' in config)
             
             self.config = config
+            camera_properties = self.picam2.camera_properties
+            self._camera_info = {
+                "status": "initialized",
+                "model": camera_properties.get('Model', 'Unknown'),
+                "resolution": config.get('resolution', 'Unknown'),
+                "pixel_array_size": camera_properties.get('PixelArraySize', 'Unknown')
+            }
             self.is_initialized = True
             self.logger.info("Camera initialized successfully")
             return True
@@ -105,34 +165,85 @@ class CameraController:
             self.logger.error(f"Camera setup failed: {e}")
             return False
     
-    def capture_still(self, save_path: Optional[str] = None) -> Optional[np.ndarray]:
+    async def setup_camera_async(self, config: Dict[str, Any]) -> bool:
+        """
+        カメラセットアップ（asyncio版）
+        
+        安定化待機を含むsetup_cameraをワーカースレッドで実行し、
+        呼び出し元のイベントループをブロックしない。
+        
+        Args:
+            config: カメラ設定
+            
+        Returns:
+            bool: セットアップ成功可否
+        """
+        return await asyncio.to_thread(self.setup_camera, config)
+    
+    def _wait_for_stable_frame(self, manual_exposure: bool,
+                               timeout: float = CAMERA_WARMUP_TIMEOUT) -> bool:
+        """
+        カメラ安定化待機
+        
+        固定時間待機せず、フレームのメタデータを見て安定した時点で戻る。
+        手動露出時は最初のフレーム到着、自動露出時はAE収束(AeLocked)まで待つ。
+        
+        Args:
+            manual_exposure: 手動露出設定かどうか
+            timeout: 最大待機時間（秒）
+            
+        Returns:
+            bool: タイムアウト前に安定したか
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            metadata = self.picam2.capture_metadata()
+            if manual_exposure or metadata.get('AeLocked'):
+                return True
+        
+        self.logger.debug("Camera warm-up timed out after %.1fs", timeout)
+        return False
+    
+    def capture_still(self, save_path: Optional[str] = None,
+                      out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
         """
         静止画撮影
         
         Args:
             save_path: 保存パス（指定時はファイル保存も実行）
+            out: 出力先配列（指定時は撮影画像を直接書き込み、その配列を返す）
             
         Returns:
             Optional[np.ndarray]: 撮影画像（BGR形式）
+            
+        Note:
+            outを指定しない場合、返却配列は内部バッファを再利用するため
+            次回撮影時に上書きされる。保持が必要な場合はoutを渡すかコピーすること。
         """
         if not self.is_initialized or self.picam2 is None:
             self.logger.error("Camera not initialized")
             return None
             
         try:
-            # 画像撮影
-            image_array = self.picam2.capture_array("main")
-            
-            # RGB → BGR変換（OpenCV互換）
-            if len(image_array.shape) == 3 and image_array.shape[2] == 3:
-                image_bgr = image_array[:, :, ::-1]  # RGB to BGR
-            else:
-                image_bgr = image_array
-            
-            # ファイル保存（指定された場合）
-            if save_path:
-                self.picam2.capture_file(save_path)
-                self.logger.debug(f"Image saved to: {save_path}")
+            # 画像撮影（リクエストバッファを直接マップし、中間配列を確保しない）
+            with self.picam2.captured_request() as request:
+                with MappedArray(request, "main") as mapped:
+                    image_array = mapped.array
+                    
+                    # RGB → BGR変換（OpenCV互換）
+                    if len(image_array.shape) == 3 and image_array.shape[2] == 3:
+                        image_bgr = self._convert_to_bgr(image_array, out)
+                    elif out is not None:
+                        np.copyto(out, image_array)
+                        image_bgr = out
+                    else:
+                        # マップ解除後も参照できるようコピー
+                        image_bgr = image_array.copy()
+                
+                # ファイル保存（指定された場合、同一フレームをエンコード）
+                if save_path:
+                    request.save("main", save_path)
+                    self.logger.debug("Image saved to: %s", save_path)
             
             self.logger.debug("Image captured successfully")
             return image_bgr
@@ -141,6 +252,21 @@ class CameraController:
             self.logger.error(f"Image capture failed: {e}")
             return None
     
+    def _convert_to_bgr(self, image_array: np.ndarray,
+                        out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        RGB → BGR変換（再利用バッファまたは指定配列へ書き込み）
+        
+        負ストライドのビューではなくC連続配列を返し、下流での再コピーを防ぐ。
+        """
+        if out is not None:
+            return image_kernels.swap_rb_channels(image_array, out)
+        
+        if self._bgr_buf is None or self._bgr_buf.shape != image_array.shape:
+            self._bgr_buf = np.empty(image_array.shape, dtype=image_array.dtype)
+        
+        return image_kernels.swap_rb_channels(image_array, self._bgr_buf)
+    
     def adjust_exposure(self, scene_brightness: float) -> None:
         """
         露出調整
@@ -153,26 +279,22 @@ class CameraController:
             return
             
         try:
-            # シーンの明度に基づいて露出時間を調整
-            if scene_brightness < 0.3:
-                # 暗いシーン - 露出時間を長く
-                exposure_time = 50000  # 50ms
-                analogue_gain = 2.0
-            elif scene_brightness > 0.7:
-                # 明るいシーン - 露出時間を短く
-                exposure_time = 10000  # 10ms
-                analogue_gain = 1.0
-            else:
-                # 中間 - 標準設定
-                exposure_time = 25000  # 25ms
-                analogue_gain = 1.5
+            # シーンの明度に基づいて露出時間を調整（閾値テーブルを二分探索）
+            index = int(np.searchsorted(self._EXPOSURE_THRESHOLDS, scene_brightness,
+                                        side='right'))
+            exposure_time, analogue_gain = self._EXPOSURE_TABLE[index]
+            
+            # 前回と同じ設定であればlibcameraへの再設定を省略
+            if (exposure_time, analogue_gain) == self._last_controls:
+                return
             
             self.picam2.set_controls({
                 Controls.ExposureTime: exposure_time,
                 Controls.AnalogueGain: analogue_gain
             })
+            self._last_controls = (exposure_time, analogue_gain)
             
-            self.logger.debug(f"Exposure adjusted for brightness: {scene_brightness}")
+            self.logger.debug("Exposure adjusted for brightness: %s", scene_brightness)
             
         except Exception as e:
             self.logger.error(f"Exposure adjustment failed: {e}")
@@ -182,22 +304,12 @@ class CameraController:
         カメラ情報取得
         
         Returns:
-            Dict[str, Any]: カメラ情報
+            Dict[str, Any]: カメラ情報（セットアップ時に構築した内容の複製）
         """
-        if not self.is_initialized or self.picam2 is None:
+        if not self.is_initialized or self._camera_info is None:
             return {"status": "not_initialized"}
-            
-        try:
-            camera_properties = self.picam2.camera_properties
-            return {
-                "status": "initialized",
-                "model": camera_properties.get('Model', 'Unknown'),
-                "resolution": self.config.get('resolution', 'Unknown'),
-                "pixel_array_size": camera_properties.get('PixelArraySize', 'Unknown')
-            }
-        except Exception as e:
-            self.logger.error(f"Failed to get camera info: {e}")
-            return {"status": "error", "error": str(e)}
+        
+        return dict(self._camera_info)
     
     def cleanup(self) -> None:
         """リソース解放"""
@@ -211,16 +323,41 @@ class CameraController:
             finally:
                 self.picam2 = None
                 self.is_initialized = False
+                self._last_controls = (-1, -1.0)
+                self._camera_info = None
+
+
+class _RPiGPIOBackend:
+    """RPi.GPIOのソフトウェアPWM出力（pigpio_pwm.PigpioPWMと同じインターフェース）"""
+    
+    name = "RPi.GPIO"
+    
+    def __init__(self, pin: int, frequency: int):
+        self.pin = pin
+        GPIO.setmode(GPIO.BCM)
+        GPIO.setup(pin, GPIO.OUT)
+        self.pwm = GPIO.PWM(pin, frequency)
+        self.pwm.start(0)  # 0%でスタート
+    
+    def set_brightness(self, brightness: float) -> None:
+        """デューティ比設定（0.0-1.0）"""
+        self.pwm.ChangeDutyCycle(brightness * 100.0)
+    
+    def close(self) -> None:
+        """PWM停止とピン解放"""
+        self.pwm.stop()
+        GPIO.cleanup(self.pin)
 
 
 class LEDController:
     """LED制御クラス（HAT使用想定）"""
     
     def __init__(self):
-        self.logger = logging.getLogger(__name__ + '.LEDController')
+        self.logger = _led_logger
         self.is_initialized = False
         self.current_brightness = 0.0
         self.led_pin = None
+        self.backend = None
         
     def setup_led(self, config: Dict[str, Any]) -> bool:
         """
@@ -234,13 +371,22 @@ class LEDController:
         """
         try:
             # HAT使用時は専用ライブラリを使用
-            # 現在はGPIOによる基本制御として実装
-            if GPIO_AVAILABLE:
-                self.led_pin = config.get('led_pin', 18)
-                GPIO.setmode(GPIO.BCM)
-                GPIO.setup(self.led_pin, GPIO.OUT)
-                GPIO.output(self.led_pin, GPIO.LOW)
-                self.logger.info(f"LED controller initialized (GPIO pin: {self.led_pin})")
+            # 現在はPWMによる基本制御として実装（pigpio優先、RPi.GPIOにフォールバック）
+            led_pin = config.get('led_pin', 18)
+            pwm_frequency = config.get('pwm_frequency', 1000)
+            
+            if PIGPIO_AVAILABLE:
+                self.backend = PigpioPWM.connect(led_pin, pwm_frequency)
+                if self.backend is None:
+                    self.logger.warning("pigpiod not running, falling back to RPi.GPIO")
+            
+            if self.backend is None and GPIO_AVAILABLE:
+                self.backend = _RPiGPIOBackend(led_pin, pwm_frequency)
+            
+            if self.backend is not None:
+                self.led_pin = led_pin
+                self.logger.info(f"LED controller initialized (GPIO pin: {self.led_pin}, "
+                               f"PWM: {pwm_frequency}Hz, backend: {self.backend.name})")
             else:
                 self.logger.warning("GPIO not available, LED control disabled")
                 
@@ -262,22 +408,24 @@ class LEDController:
             self.logger.warning("LED controller not initialized")
             return
             
-        try:
-            # 明度を0-1の範囲にクランプ
-            brightness = max(0.0, min(1.0, brightness))
-            
-            if GPIO_AVAILABLE and self.led_pin is not None:
-                # シンプルなオン/オフ制御（HAT使用時は専用API使用）
-                if brightness > 0:
-                    GPIO.output(self.led_pin, GPIO.HIGH)
-                else:
-                    GPIO.output(self.led_pin, GPIO.LOW)
-            
-            self.current_brightness = brightness
-            self.logger.debug(f"LED brightness set to: {brightness}")
-            
-        except Exception as e:
-            self.logger.error(f"LED brightness control failed: {e}")
+        # 明度を0-1の範囲にクランプし、デューティ比テーブルの添字へ変換
+        if brightness <= 0.0:
+            brightness, index = 0.0, 0
+        elif brightness >= 1.0:
+            brightness, index = 1.0, DUTY_TABLE_SIZE - 1
+        else:
+            index = int(brightness * (DUTY_TABLE_SIZE - 1))
+        
+        if self.backend is not None:
+            # PWMデューティ比で調光（HAT使用時は専用API使用）
+            try:
+                self.backend.set_brightness(_DUTY_TABLE[index])
+            except Exception as e:
+                self.logger.error(f"LED brightness control failed: {e}")
+                return
+        
+        self.current_brightness = brightness
+        self.logger.debug("LED brightness set to: %s", brightness)
     
     def get_status(self) -> Dict[str, Any]:
         """
@@ -294,13 +442,14 @@ class LEDController:
     
     def cleanup(self) -> None:
         """リソース解放"""
-        if self.is_initialized and GPIO_AVAILABLE and self.led_pin is not None:
+        if self.is_initialized and self.backend is not None:
             try:
-                GPIO.output(self.led_pin, GPIO.LOW)
-                GPIO.cleanup(self.led_pin)
+                self.backend.close()
                 self.logger.info("LED controller cleaned up successfully")
             except Exception as e:
                 self.logger.error(f"LED cleanup failed: {e}")
+            finally:
+                self.backend = None
         
         self.is_initialized = False
         self.current_brightness = 0.0
@@ -317,7 +466,7 @@ class HardwareController:
             config: ハードウェア設定
         """
         self.config = config
-        self.logger = logging.getLogger(__name__ + '.HardwareController')
+        self.logger = _hardware_logger
         
         # サブコントローラー初期化
         self.camera_controller = CameraController()
@@ -327,6 +476,22 @@ class HardwareController:
         self.status = HardwareStatus()
         self.is_initialized = False
         
+        # 詳細状態のシステム情報（ライブラリ有無は実行中に変化しない）
+        self._system_info: Dict[str, Any] = {
+            "picamera2_available": PICAMERA2_AVAILABLE,
+            "gpio_available": GPIO_AVAILABLE
+        }
+        
+        # 温度センサーの有無は初期化時に一度だけ判定し、以降は再確認しない
+        # （利用可能な場合はディスクリプタを開いたまま保持しpreadで再読込）
+        self._temp_fd: Optional[int] = None
+        self._status_time = float('-inf')
+        try:
+            self._temp_fd = os.open(THERMAL_ZONE_PATH, os.O_RDONLY)
+        except OSError:
+            self.logger.info("Thermal sensor not available (%s), temperature disabled",
+                             THERMAL_ZONE_PATH)
+        
     def initialize_hardware(self) -> bool:
         """
         ハードウェア初期化
@@ -336,11 +501,53 @@ class HardwareController:
         """
         self.logger.info("Starting hardware initialization...")
         
+        # カメラ・LEDは独立したデバイスのため並行して初期化
+        # （LEDのGPIO設定をカメラの安定化待機中に済ませる）
+        camera_config = self.config.get('camera', {})
+        led_config = self.config.get('led', {})
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            camera_future = executor.submit(self.camera_controller.setup_camera,
+                                            camera_config)
+            led_future = executor.submit(self.led_controller.setup_led, led_config)
+            camera_ok = camera_future.result()
+            led_ok = led_future.result()
+        
+        return self._apply_initialization_results(camera_ok, led_ok)
+    
+    async def initialize_hardware_async(self) -> bool:
+        """
+        ハードウェア初期化（asyncio版）
+        
+        カメラ安定化待機などのブロッキング処理をワーカースレッドで実行し、
+        イベントループを停止させない。
+        
+        Returns:
+            bool: 初期化成功可否
+        """
+        self.logger.info("Starting hardware initialization...")
+        
+        camera_ok, led_ok = await asyncio.gather(
+            self.camera_controller.setup_camera_async(self.config.get('camera', {})),
+            asyncio.to_thread(self.led_controller.setup_led, self.config.get('led', {}))
+        )
+        
+        return self._apply_initialization_results(camera_ok, led_ok)
+    
+    def _apply_initialization_results(self, camera_ok: bool, led_ok: bool) -> bool:
+        """
+        初期化結果の状態反映
+        
+        Args:
+            camera_ok: カメラ初期化成功可否
+            led_ok: LED初期化成功可否
+            
+        Returns:
+            bool: 初期化成功可否
+        """
         success = True
         
-        # カメラ初期化
-        camera_config = self.config.get('camera', {})
-        if self.camera_controller.setup_camera(camera_config):
+        # カメラ初期化結果
+        if camera_ok:
             self.status.camera_available = True
             self.status.camera_initialized = True
             self.logger.info("Camera initialization successful")
@@ -348,9 +555,8 @@ class HardwareController:
             self.logger.error("Camera initialization failed")
             success = False
         
-        # LED初期化
-        led_config = self.config.get('led', {})
-        if self.led_controller.setup_led(led_config):
+        # LED初期化結果
+        if led_ok:
             self.status.led_available = True
             self.logger.info("LED initialization successful")
         else:
@@ -362,7 +568,7 @@ class HardwareController:
         self.status.gpio_initialized = GPIO_AVAILABLE
         
         self.is_initialized = success
-        self.update_status()
+        self.update_status(force=True)
         
         if success:
             self.logger.info("Hardware initialization completed successfully")
@@ -373,22 +579,25 @@ class HardwareController:
     
     def capture_image(self, 
                      resolution: Optional[Tuple[int, int]] = None,
-                     save_path: Optional[str] = None) -> Optional[np.ndarray]:
+                     save_path: Optional[str] = None,
+                     out: Optional[np.ndarray] = None) -> Optional[np.ndarray]:
         """
         画像撮影
         
         Args:
             resolution: 撮影解像度（未使用、設定で固定）
             save_path: 保存パス
+            out: 出力先配列（呼び出し側で確保したH x W x 3 uint8配列を再利用する場合）
             
         Returns:
-            Optional[np.ndarray]: 撮影画像
+            Optional[np.ndarray]: 撮影画像（out指定時はout自身、未指定時は
+                次回撮影まで有効な内部バッファ）
         """
         if not self.is_initialized:
             self.logger.error("Hardware not initialized")
             return None
             
-        return self.camera_controller.capture_still(save_path)
+        return self.camera_controller.capture_still(save_path, out=out)
     
     def control_ir_led(self, brightness: float) -> None:
         """
@@ -402,8 +611,9 @@ class HardwareController:
             return
             
         self.led_controller.set_brightness(brightness)
-        self.status.led_brightness = brightness
-        self.update_status()
+        # 温度はLED状態に依存しないため、sysfsの再読込は行わない
+        # （書き込み失敗時は更新されないクランプ済みの明度を反映）
+        self.status.led_brightness = self.led_controller.current_brightness
     
     def adjust_camera_exposure(self, scene_brightness: float) -> None:
         """
@@ -428,19 +638,26 @@ class HardwareController:
         self.update_status()
         return self.status
     
-    def update_status(self) -> None:
-        """状態情報更新"""
+    def update_status(self, force: bool = False) -> None:
+        """
+        状態情報更新
+        
+        Args:
+            force: キャッシュ期間内でも再取得するかどうか
+        """
+        now = time.monotonic()
+        if not force and now - self._status_time < STATUS_CACHE_SECONDS:
+            return
+        
         try:
             # 温度情報取得（Raspberry Pi）
-            temp_path = Path('/sys/class/thermal/thermal_zone0/temp')
-            if temp_path.exists():
-                with open(temp_path, 'r') as f:
-                    temp_millicelsius = int(f.read().strip())
-                    self.status.temperature = temp_millicelsius / 1000.0
+            if self._temp_fd is not None:
+                temp_millicelsius = int(os.pread(self._temp_fd, 16, 0))
+                self.status.temperature = temp_millicelsius / 1000.0
             
             # 最終更新時刻
-            from datetime import datetime
             self.status.last_updated = datetime.now().isoformat()
+            self._status_time = now
             
         except Exception as e:
             self.logger.error(f"Status update failed: {e}")
@@ -450,28 +667,17 @@ class HardwareController:
         詳細状態情報取得
         
         Returns:
-            Dict[str, Any]: 詳細状態情報
+            Dict[str, Any]: 詳細状態情報（呼び出し毎に新しい辞書）
         """
         self.update_status()
         
         return {
             "hardware_status": {
-                "camera_available": self.status.camera_available,
-                "camera_initialized": self.status.camera_initialized,
-                "gpio_available": self.status.gpio_available,
-                "gpio_initialized": self.status.gpio_initialized,
-                "led_available": self.status.led_available,
-                "led_brightness": self.status.led_brightness,
-                "temperature": self.status.temperature,
-                "last_updated": self.status.last_updated
+                name: getattr(self.status, name) for name in _HARDWARE_STATUS_FIELDS
             },
             "camera_info": self.camera_controller.get_camera_info(),
             "led_status": self.led_controller.get_status(),
-            "system_info": {
-                "picamera2_available": PICAMERA2_AVAILABLE,
-                "gpio_available": GPIO_AVAILABLE,
-                "initialized": self.is_initialized
-            }
+            "system_info": {**self._system_info, "initialized": self.is_initialized}
         }
     
     def cleanup_resources(self) -> None:
@@ -490,6 +696,14 @@ class HardwareController:
         # LED制御停止
         self.led_controller.cleanup()
         
+        # 温度読み取り用ディスクリプタを閉じる
+        if self._temp_fd is not None:
+            try:
+                os.close(self._temp_fd)
+            except OSError as e:
+                self.logger.error(f"Thermal fd close failed: {e}")
+            self._temp_fd = None
+        
         # GPIO全体クリーンアップ
         if GPIO_AVAILABLE:
             try:
@@ -0,0 +1,63 @@
+"""
+画像変換カーネルモジュール
+
+撮影フレームのチャンネル入れ替え（RGB ⇔ BGR）をパイプライン全体で共有する。
+- 出力先バッファへの書き込み（フレーム毎のメモリ確保なし）
+- C連続配列を出力（負ストライドのビューを下流に渡さない）
+- OpenCV（必須依存）で変換し、未導入の環境のみNumPyで代替
+
+検出結果描画用の座標・色計算（NumPyのベクトル演算）も提供する。
+"""
+
+import logging
+from typing import Tuple
+
+import numpy as np
+
+try:
+    import cv2
+    OPENCV_AVAILABLE = True
+except ImportError:
+    OPENCV_AVAILABLE = False
+    logging.warning("OpenCV not available. Install with: pip install opencv-python")
+
+
+# 信頼度別の枠色（BGR）: 赤（低）/ 黄（中）/ 緑（高）
+_BOX_COLORS = np.array([[0, 0, 255], [0, 255, 255], [0, 255, 0]], dtype=np.uint8)
+
+
+def swap_rb_channels(src: np.ndarray, dst: np.ndarray) -> np.ndarray:
+    """
+    RGB ⇔ BGR チャンネル入れ替え
+
+    Args:
+        src: 入力画像（H x W x 3）
+        dst: 出力先バッファ（srcと同形状・同dtype、srcとは別領域）
+
+    Returns:
+        np.ndarray: dst
+    """
+    if OPENCV_AVAILABLE:
+        cv2.cvtColor(src, cv2.COLOR_RGB2BGR, dst=dst)
+    else:
+        np.copyto(dst, src[:, :, ::-1])
+    return dst
+
+
+def boxes_to_draw(boxes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    検出枠の描画座標・色計算
+
+    Args:
+        boxes: N x 5 配列 [x_center, y_center, width, height, confidence]
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: 角座標（N x 4 int32: x1, y1, x2, y2）と
+            枠色（N x 3 uint8, BGR）
+    """
+    half_sizes = boxes[:, 2:4] / 2
+    coords = np.hstack((boxes[:, 0:2] - half_sizes,
+                        boxes[:, 0:2] + half_sizes)).astype(np.int32)
+    levels = (boxes[:, 4] > 0.6).astype(np.intp) + (boxes[:, 4] > 0.8)
+    return coords, _BOX_COLORS[levels]
+
@@ -9,18 +9,26 @@ YOLOv8を使用した昆虫検出処理の実行と制御を行う。
 - バッチ処理対応
 """
 
+import copy
+import json
 import logging
+import queue
 import time
 from typing import Dict, Any, Optional, List, Tuple
 import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime
 import threading
+from collections import deque
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 
 # 機械学習・画像処理ライブラリ
 try:
     from ultralytics import YOLO
+    from ultralytics.cfg import get_cfg
+    from ultralytics.models.yolo.detect import DetectionPredictor
     import torch
     YOLO_AVAILABLE = True
 except ImportError:
@@ -34,7 +42,15 @@ except ImportError:
     OPENCV_AVAILABLE = False
     logging.warning("OpenCV not available. Install with: pip install opencv-python")
 
+# JPEG縮小デコード（任意: pip install PyTurboJPEG）
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR
+    TURBOJPEG_AVAILABLE = True
+except ImportError:
+    TURBOJPEG_AVAILABLE = False
+
 # プロジェクト内モジュール
+import image_kernels
 from models.detection_models import DetectionResult, DetectionRecord
 from models.system_models import SystemLogRecord
 from hardware_controller import HardwareController
@@ -43,6 +59,58 @@ from utils.file_naming import generate_detection_image_name, generate_log_filena
 from error_handler import ErrorHandler, ErrorSeverity, ErrorCategory, ErrorContext, error_handler_decorator
 
 
+# 変換済みモデルで推論するデバイス → Ultralyticsエクスポート形式
+# （OpenVINO変換に失敗した場合はONNXへフォールバック）
+_EXPORT_FORMATS = {
+    "cpu": ("torchscript",),
+    "cuda": ("engine",),
+    "openvino": ("openvino", "onnx"),
+    "onnx": ("onnx",),
+}
+
+# 変換済みモデルの推論に使うtorchデバイス
+_BACKEND_DEVICES = {"openvino": "cpu", "onnx": "cpu"}
+
+# 読み込み済みモデルの共有キャッシュ（同一設定の検出器間で重みを共有）
+# キー: (モデル絶対パス, デバイス, 半精度, TensorRT, INT8, 入力サイズ)
+_MODEL_CACHE: Dict[tuple, Dict[str, Any]] = {}
+_MODEL_LOCK = threading.Lock()
+
+# IR LED点灯後の安定化時間・ストリーミング時の安定化通知の待機上限（秒）
+_IR_LED_SETTLE_TIME = 0.1
+_IR_LED_STABLE_TIMEOUT = 1.0
+
+# レターボックスの余白画素値（Ultralyticsの前処理と同じ）
+_LETTERBOX_PAD_VALUE = 114
+
+# 検出ラベル描画設定
+_LABEL_FONT = cv2.FONT_HERSHEY_SIMPLEX if OPENCV_AVAILABLE else None
+_LABEL_FONT_SCALE = 0.5
+_LABEL_THICKNESS = 2
+_LABEL_TEXT_COLOR = (255, 255, 255)
+
+
+def _letterbox_geometry(image_shape: Tuple[int, int], input_size: Tuple[int, int]
+                        ) -> Tuple[float, Tuple[int, int], Tuple[int, int]]:
+    """
+    レターボックス配置の計算（UltralyticsのLetterBox(auto=False)と同じ配置）
+    
+    Args:
+        image_shape: 元画像の (高さ, 幅)
+        input_size: 推論入力の (高さ, 幅)
+        
+    Returns:
+        Tuple: 縮小率、縮小後の (幅, 高さ)、余白の (左, 上)
+    """
+    height, width = image_shape
+    input_h, input_w = input_size
+    ratio = min(input_h / height, input_w / width)
+    new_w, new_h = int(round(width * ratio)), int(round(height * ratio))
+    left = int(round((input_w - new_w) / 2 - 0.1))
+    top = int(round((input_h - new_h) / 2 - 0.1))
+    return ratio, (new_w, new_h), (left, top)
+
+
 @dataclass
 class DetectionSettings:
     """検出設定データクラス"""
@@ -50,9 +118,15 @@ class DetectionSettings:
     confidence_threshold: float = 0.5
     nms_threshold: float = 0.4
     max_detections: int = 10
+    batch_size: int = 16  # detect_batchで1回の推論に渡す画像数
     input_size: Tuple[int, int] = (640, 640)
-    device: str = "cpu"  # "cpu" or "cuda"
+    device: str = "cpu"  # "cpu", "cuda", "openvino" or "onnx"
     half_precision: bool = False
+    use_tensorrt: bool = True  # CUDA時にTensorRTエンジンへ変換して推論
+    use_torchscript: bool = True  # CPU時にTorchScriptへ変換して推論
+    int8: bool = False  # openvino/onnx変換時にINT8量子化
+    calibration_data: str = "datasets/data.yaml"  # INT8校正・精度検証用データセット
+    engine_path: Optional[str] = None  # 変換済みモデルのパス（None = 未変換）
     save_detection_images: bool = True
     save_confidence_maps: bool = False
     detection_classes: List[int] = None  # None = all classes
@@ -71,6 +145,96 @@ class DetectionStats:
     model_load_time: float = 0.0
 
 
+@dataclass(eq=False)
+class DetectionBatch(Sequence):
+    """
+    1画像分の検出結果（配列形式）
+    
+    座標・信頼度・クラスを並列配列で保持し、DetectionResultは要素アクセス時に
+    初めて生成する（統計・描画は配列のまま処理）。DetectionRecord.detectionsに
+    そのまま格納でき、従来のList[DetectionResult]と同様に反復・len()・copy()できる。
+    """
+    coords: np.ndarray  # N x 4 float32 [x_center, y_center, width, height]
+    confs: np.ndarray  # N float32
+    cls: np.ndarray  # N int32
+    timestamp: str
+    _results: Optional[List[DetectionResult]] = field(default=None, init=False, repr=False)
+    
+    @classmethod
+    def empty(cls, timestamp: str) -> 'DetectionBatch':
+        """検出なし"""
+        return cls(np.empty((0, 4), dtype=np.float32), np.empty(0, dtype=np.float32),
+                   np.empty(0, dtype=np.int32), timestamp)
+    
+    def valid_mask(self) -> np.ndarray:
+        """DetectionResult.validate()と同じ条件の妥当性マスク"""
+        return ((self.coords[:, 0] >= 0) & (self.coords[:, 1] >= 0) &
+                (self.coords[:, 2] > 0) & (self.coords[:, 3] > 0) &
+                (self.confs >= 0) & (self.confs <= 1) & (self.cls >= 0))
+    
+    def select(self, mask: np.ndarray) -> 'DetectionBatch':
+        """マスクで絞り込んだ検出結果"""
+        return DetectionBatch(self.coords[mask], self.confs[mask], self.cls[mask],
+                              self.timestamp)
+    
+    def results(self) -> List[DetectionResult]:
+        """DetectionResultリスト（初回呼び出し時に生成してキャッシュ）"""
+        if self._results is None:
+            self._results = [
+                DetectionResult(
+                    x_center=x_center,
+                    y_center=y_center,
+                    width=width,
+                    height=height,
+                    confidence=conf,
+                    class_id=class_id,
+                    timestamp=self.timestamp
+                )
+                for (x_center, y_center, width, height), conf, class_id in zip(
+                    self.coords.tolist(), self.confs.tolist(), self.cls.tolist()
+                )
+            ]
+        return self._results
+    
+    def copy(self) -> List[DetectionResult]:
+        return list(self.results())
+    
+    def __getitem__(self, index):
+        return self.results()[index]
+    
+    def __iter__(self):
+        return iter(self.results())
+    
+    def __len__(self) -> int:
+        return len(self.confs)
+
+
+class _RollingWindow:
+    """直近N件の値と合計を保持する固定長バッファ（平均をO(1)で取得）"""
+    
+    __slots__ = ('values', 'total')
+    
+    def __init__(self, maxlen: int):
+        self.values = deque(maxlen=maxlen)
+        self.total = 0.0
+    
+    def append(self, value: float) -> None:
+        if len(self.values) == self.values.maxlen:
+            self.total -= self.values[0]
+        self.values.append(value)
+        self.total += value
+    
+    def extend(self, values) -> None:
+        for value in values:
+            self.append(value)
+    
+    def mean(self) -> float:
+        return self.total / len(self.values) if self.values else 0.0
+    
+    def __len__(self) -> int:
+        return len(self.values)
+
+
 class InsectDetector:
     """
     昆虫検出処理クラス
@@ -105,16 +269,63 @@ class InsectDetector:
         # YOLOモデル
         self.model: Optional[YOLO] = None
         self.model_loaded = False
+        self.backend = "pytorch"  # 推論バックエンド（pytorch/torchscript/engine/openvino/onnx）
+        self.predictor = None  # 生成済みUltralytics Predictor（パラメータ固定）
+        self._model_key: Optional[tuple] = None  # _MODEL_CACHEのキー
+        self.int8_map50_delta: Optional[float] = None  # INT8化によるmAP50変化
+        self._torch_device = None  # 前処理テンソルの転送先
+        
+        # 推論入力バッファ（フレーム毎の確保を避けて再利用）
+        self._resize_buf: Optional[np.ndarray] = None  # 縮小後（余白なし）の画像
+        self._letterbox_shape: Optional[Tuple[int, int]] = None  # 配置計算済みの元画像サイズ
+        self._letterbox: Optional[Tuple[float, Tuple[int, int], Tuple[int, int]]] = None
+        self._host_buf = None  # uint8 1x3xHxW（CUDA時はピン留めメモリ）
+        self._dev_u8_buf = None  # デバイス上のuint8コピー先（CUDA時のみ）
+        self._dev_buf = None  # 正規化済み入力（float16/float32）
         
         # 統計・状態管理
         self.stats = DetectionStats()
         self.is_initialized = False
-        self.inference_times = []
-        self.confidences = []
+        self.inference_times = _RollingWindow(100)  # 直近100回
+        self.confidences = _RollingWindow(1000)  # 直近1000検出
+        self.images_with_detections = 0
+        
+        # IR LEDストリーミング状態（点灯維持・安定化完了通知）
+        self._ir_streaming = False
+        self._ir_led_stable = threading.Event()
+        self._ir_stable_timer: Optional[threading.Timer] = None
         
         # データ検証器
         self.validator = DataValidator()
         
+        # JPEGデコーダ（libturbojpeg未導入時はcv2.imreadを使用）
+        self._tj = None
+        if TURBOJPEG_AVAILABLE:
+            try:
+                self._tj = TurboJPEG()
+            except Exception as e:
+                self.logger.info(f"TurboJPEG unavailable, using cv2.imread: {e}")
+        
+        # OpenCL（T-API）が使える場合は描画をUMat上で行う
+        self._use_umat = OPENCV_AVAILABLE and cv2.ocl.haveOpenCL()
+        if self._use_umat:
+            cv2.ocl.setUseOpenCL(True)
+        
+        # ラベル文字列サイズ表（信頼度"0.00"〜"1.00"毎、描画時のgetTextSizeを省略）
+        self._text_size_lut: Dict[str, Tuple[int, int]] = {}
+        if OPENCV_AVAILABLE:
+            for c in range(101):
+                conf_text = f"{c / 100:.2f}"
+                self._text_size_lut[conf_text] = cv2.getTextSize(
+                    f"Insect {conf_text}", _LABEL_FONT, _LABEL_FONT_SCALE, _LABEL_THICKNESS
+                )[0]
+        
+        # 検出画像の書き込みスレッド（推論ループをディスクI/Oで止めない）
+        self._save_queue: queue.Queue = queue.Queue(maxsize=32)
+        self._save_worker = threading.Thread(target=self._drain_saves,
+                                             name="detection-writer", daemon=True)
+        self._save_worker.start()
+        
         # 可用性チェック
         self.available = YOLO_AVAILABLE and OPENCV_AVAILABLE
         if not self.available:
@@ -163,21 +374,40 @@ class InsectDetector:
             self.logger.info(f"Loading YOLO model: {model_path}")
             start_time = time.time()
             
-            # モデル読み込み
-            self.model = YOLO(str(model_path))
-            
-            # デバイス設定
-            if torch.cuda.is_available() and self.settings.device == "cuda":
-                self.model.to('cuda')
-                self.logger.info("Model loaded on CUDA")
-            else:
-                self.model.to('cpu')
-                self.logger.info("Model loaded on CPU")
+            # モデル読み込み（同一設定の読み込み済みモデルがあれば共有）
+            self._release_model()
+            key = (str(model_path.resolve()), self.settings.device,
+                   self.settings.half_precision, self.settings.use_tensorrt,
+                   self.settings.int8, tuple(self.settings.input_size))
+            with _MODEL_LOCK:
+                entry = _MODEL_CACHE.get(key)
+                if entry is None:
+                    self._build_model(model_path)
+                    entry = _MODEL_CACHE[key] = {
+                        "model": self.model,
+                        "backend": self.backend,
+                        "engine_path": self.settings.engine_path,
+                        "int8_map50_delta": self.int8_map50_delta,
+                        "predictor": None,  # 推論用モデル読み込み済みのPredictor（初回生成時）
+                        "refs": 0,
+                    }
+                else:
+                    self.logger.info("Reusing loaded model shared with another detector")
+                    self.model = entry["model"]
+                    self.backend = entry["backend"]
+                    self.settings.engine_path = entry["engine_path"]
+                    self.int8_map50_delta = entry["int8_map50_delta"]
+                entry["refs"] += 1
+                self._model_key = key
             
-            # 半精度設定
-            if self.settings.half_precision and self.settings.device == "cuda":
-                self.model.half()
-                self.logger.info("Model set to half precision")
+            use_cuda = torch.cuda.is_available() and self.settings.device == "cuda"
+            self._torch_device = torch.device('cuda' if use_cuda else 'cpu')
+            if use_cuda:
+                # 入力サイズ固定のため最速の畳み込みアルゴリズムを選択・保持
+                torch.backends.cudnn.benchmark = True
+                torch.set_float32_matmul_precision('high')
+            self._allocate_input_buffers()
+            self._setup_predictor()
             
             load_time = time.time() - start_time
             self.stats.model_load_time = load_time
@@ -195,6 +425,215 @@ class InsectDetector:
             self.logger.error(f"Model loading failed: {e}")
             return False
     
+    def _build_model(self, model_path: Path) -> None:
+        """モデル生成・変換・デバイス配置"""
+        self.model = YOLO(str(model_path))
+        
+        # デバイス設定（変換済みモデルは変換時に配置が確定済み）
+        self.backend = self._load_exported_model(model_path) or "pytorch"
+        if self.backend != "pytorch":
+            self.logger.info(f"Model loaded as {self.backend} export")
+        elif torch.cuda.is_available() and self.settings.device == "cuda":
+            self.model.to('cuda')
+            self.logger.info("Model loaded on CUDA")
+        else:
+            self.model.to('cpu')
+            self.logger.info("Model loaded on CPU")
+        
+        # 半精度設定（変換済みモデルは変換時に精度が確定済み）
+        if (self.settings.half_precision and self.settings.device == "cuda"
+                and self.settings.engine_path is None):
+            self.model.half()
+            self.logger.info("Model set to half precision")
+    
+    def _release_model(self) -> None:
+        """共有モデルの参照解放（最後の参照ならキャッシュから削除）"""
+        if self._model_key is not None:
+            with _MODEL_LOCK:
+                entry = _MODEL_CACHE.get(self._model_key)
+                if entry is not None:
+                    entry["refs"] -= 1
+                    if entry["refs"] <= 0:
+                        del _MODEL_CACHE[self._model_key]
+            self._model_key = None
+        
+        self.model = None
+        self.predictor = None
+        self.model_loaded = False
+    
+    def _load_exported_model(self, model_path: Path) -> Optional[str]:
+        """
+        変換済みモデル読み込み
+        
+        デバイスに応じた形式（CPU: TorchScript、CUDA: TensorRT、openvino: OpenVINO IR、
+        onnx: ONNX）を
+        モデルと同じ場所から再利用し、無ければUltralyticsのエクスポーターで生成する
+        （初回のみ数分かかる）。
+        
+        Args:
+            model_path: PyTorchモデル（.pt）パス
+            
+        Returns:
+            Optional[str]: 読み込んだ形式（None = PyTorchモデルを継続使用）
+        """
+        self.settings.engine_path = None
+        self.int8_map50_delta = None
+        device = self.settings.device
+        if device == "cuda" and not (self.settings.use_tensorrt and torch.cuda.is_available()):
+            return None
+        if device == "cpu" and not self.settings.use_torchscript:
+            return None
+        
+        for export_format in _EXPORT_FORMATS.get(device, ()):
+            try:
+                export_path = self._export_path(model_path, export_format)
+                exported = not export_path.exists()
+                if exported:
+                    self.logger.info(f"Exporting {export_format} model: {export_path}")
+                    export_path = self._export(model_path, export_format, export_path)
+                
+                self.model = YOLO(str(export_path), task=self.model.task)
+                self.settings.engine_path = str(export_path)
+                
+                if self._is_int8(export_format):
+                    self._load_int8_accuracy(model_path, export_path, measure=exported)
+                return export_format
+                
+            except Exception as e:
+                self.logger.warning(f"{export_format} export unavailable: {e}")
+        
+        return None
+    
+    def _is_int8(self, export_format: str) -> bool:
+        """INT8量子化対象の形式か"""
+        return self.settings.int8 and export_format in ("openvino", "onnx")
+    
+    def _export_path(self, model_path: Path, export_format: str) -> Path:
+        """Ultralyticsエクスポーターの出力先パス"""
+        int8_suffix = "_int8" if self._is_int8(export_format) else ""
+        if export_format == "openvino":
+            return model_path.parent / f"{model_path.stem}{int8_suffix}_openvino_model"
+        return model_path.parent / f"{model_path.stem}{int8_suffix}.{export_format}"
+    
+    def _export_options(self, export_format: str) -> Dict[str, Any]:
+        """エクスポート形式別オプション"""
+        # TorchScriptはトレース時にバッチ次元を固定しないため指定不要
+        # TensorRTのbatchは動的バッチの最大値（ONNX/OpenVINOはメタデータに記録される）
+        options = {"imgsz": self.settings.input_size}
+        batch_options = dict(dynamic=True, batch=max(1, self.settings.batch_size))
+        if export_format == "engine":
+            options.update(half=self.settings.half_precision, device=0, workspace=4,
+                           **batch_options)
+        elif export_format == "onnx":
+            options.update(**batch_options)
+        elif export_format == "openvino":
+            options.update(half=False, int8=self.settings.int8, **batch_options)
+            if self.settings.int8:
+                options["data"] = self.settings.calibration_data  # NNCFによる校正
+        return options
+    
+    def _export(self, model_path: Path, export_format: str, export_path: Path) -> Path:
+        """モデル変換（戻り値は変換後のパス）"""
+        if export_format == "onnx" and self.settings.int8:
+            # UltralyticsのONNX変換はINT8非対応のためONNX Runtimeで静的量子化
+            fp32_path = model_path.with_suffix('.onnx')
+            if not fp32_path.exists():
+                fp32_path = Path(self.model.export(format="onnx",
+                                                   **self._export_options("onnx")))
+            self._quantize_onnx(fp32_path, export_path)
+            return export_path
+        
+        return Path(self.model.export(format=export_format,
+                                      **self._export_options(export_format)))
+    
+    def _quantize_onnx(self, fp32_path: Path, int8_path: Path) -> None:
+        """
+        ONNXモデルのINT8静的量子化
+        
+        校正データセットの検証画像（最大100枚）を推論時と同じ前処理で流し、
+        活性値のレンジを決めてQDQ形式で保存する。
+        
+        Args:
+            fp32_path: 量子化前ONNXモデル
+            int8_path: 量子化後の保存先
+        """
+        from onnxruntime.quantization import (CalibrationDataReader, QuantFormat,
+                                              QuantType, quantize_static)
+        from ultralytics.data.utils import check_det_dataset
+        
+        val_dirs = check_det_dataset(self.settings.calibration_data)['val']
+        if isinstance(val_dirs, (str, Path)):
+            val_dirs = [val_dirs]
+        image_paths = sorted(p for val_dir in val_dirs for p in Path(val_dir).rglob('*')
+                             if p.suffix.lower() in ('.jpg', '.jpeg', '.png'))[:100]
+        if not image_paths:
+            raise ValueError(f"No calibration images in {self.settings.calibration_data}")
+        
+        input_size = self.settings.input_size
+        
+        class _CalibrationReader(CalibrationDataReader):
+            def __init__(self):
+                self._paths = iter(image_paths)
+            
+            def get_next(self):
+                for path in self._paths:
+                    image = cv2.imread(str(path))
+                    if image is None:
+                        continue
+                    # 推論時と同じレターボックス配置
+                    _, (new_w, new_h), (left, top) = _letterbox_geometry(
+                        image.shape[:2], input_size)
+                    canvas = np.full((*input_size, 3), _LETTERBOX_PAD_VALUE,
+                                     dtype=np.uint8)
+                    canvas[top:top + new_h, left:left + new_w] = cv2.resize(
+                        image, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+                    rgb = canvas[..., ::-1]
+                    chw = rgb.transpose(2, 0, 1)[None].astype(np.float32) / 255.0
+                    return {"images": chw}
+                return None
+        
+        self.logger.info(f"Quantizing ONNX model with {len(image_paths)} calibration images")
+        quantize_static(str(fp32_path), str(int8_path), _CalibrationReader(),
+                        quant_format=QuantFormat.QDQ, activation_type=QuantType.QUInt8,
+                        weight_type=QuantType.QInt8, per_channel=True)
+    
+    def _load_int8_accuracy(self, model_path: Path, export_path: Path, measure: bool) -> None:
+        """
+        INT8モデルの精度低下（mAP50差分）読み込み
+        
+        変換直後のみ校正データセットで元モデルと比較し、結果を変換済みモデルの
+        隣に保存する（以降の起動では保存値を読むだけ）。
+        """
+        metrics_path = export_path.with_name(f"{export_path.name}_metrics.json")
+        
+        try:
+            if measure:
+                val_args = dict(data=self.settings.calibration_data,
+                                imgsz=self.settings.input_size, device="cpu",
+                                batch=1, plots=False, verbose=False)
+                fp32_map50 = YOLO(str(model_path)).val(**val_args).box.map50
+                int8_map50 = self.model.val(**val_args).box.map50
+                metrics = {"fp32_map50": float(fp32_map50), "int8_map50": float(int8_map50)}
+                with open(metrics_path, 'w', encoding='utf-8') as f:
+                    json.dump(metrics, f, indent=2)
+            elif metrics_path.exists():
+                with open(metrics_path, 'r', encoding='utf-8') as f:
+                    metrics = json.load(f)
+            else:
+                return
+            
+            self.int8_map50_delta = metrics["int8_map50"] - metrics["fp32_map50"]
+            self.logger.info(f"INT8 mAP50: {metrics['int8_map50']:.4f} "
+                             f"(FP32 {metrics['fp32_map50']:.4f}, "
+                             f"delta {self.int8_map50_delta:+.4f})")
+            
+        except Exception as e:
+            self.logger.warning(f"INT8 accuracy check skipped: {e}")
+    
+    def _inference_device(self) -> str:
+        """推論時にUltralyticsへ渡すデバイス"""
+        return _BACKEND_DEVICES.get(self.settings.device, self.settings.device)
+    
     def _get_model_info(self) -> Dict[str, Any]:
         """モデル情報取得"""
         if not self.model_loaded or self.model is None:
@@ -206,6 +645,9 @@ class InsectDetector:
                 "model_type": "YOLOv8",
                 "task": getattr(self.model, 'task', 'unknown'),
                 "device": str(self.model.device) if hasattr(self.model, 'device') else 'unknown',
+                "backend": self.backend,
+                "int8": self.settings.int8,
+                "int8_map50_delta": self.int8_map50_delta,
                 "input_size": self.settings.input_size,
                 "confidence_threshold": self.settings.confidence_threshold,
                 "nms_threshold": self.settings.nms_threshold
@@ -226,7 +668,10 @@ class InsectDetector:
                            image: Optional[np.ndarray] = None,
                            image_path: Optional[str] = None,
                            use_ir_led: bool = True,
-                           save_result: bool = True) -> Optional[DetectionRecord]:
+                           save_result: bool = True,
+                           streaming: bool = False,
+                           cancel_event: Optional[threading.Event] = None
+                           ) -> Optional[DetectionRecord]:
         """
         単一画像の昆虫検出
         
@@ -235,6 +680,10 @@ class InsectDetector:
             image_path: 画像ファイルパス
             use_ir_led: IR LED使用可否
             save_result: 結果保存可否
+            streaming: 連続撮影モード（IR LEDを点灯したまま維持し、
+                安定化待ちを初回のみにする。消灯はstop_ir_streaming()/cleanup()）
+            cancel_event: 中止要求イベント（撮影後・推論前に確認し、
+                セット済みなら推論せずNoneを返す）
             
         Returns:
             Optional[DetectionRecord]: 検出記録
@@ -251,7 +700,7 @@ class InsectDetector:
                 if image_path is not None:
                     image = cv2.imread(image_path)
                 elif self.hardware_controller is not None:
-                    image = self._capture_with_ir_led(use_ir_led)
+                    image = self._capture_with_ir_led(use_ir_led, streaming)
                 else:
                     self.logger.error("No image source available")
                     return None
@@ -265,13 +714,18 @@ class InsectDetector:
                 self.logger.error("Invalid image format")
                 return None
             
+            # 終了要求時は推論を省略
+            if cancel_event is not None and cancel_event.is_set():
+                self.logger.debug("Detection cancelled before inference")
+                return None
+            
             # YOLOv8推論実行
-            detection_results = self._run_inference(image)
+            detected_at = datetime.now()
+            detection_results = self._run_inference(image, detected_at)
             
             # 検出記録作成
-            timestamp = datetime.now().isoformat()
             record = DetectionRecord(
-                timestamp=timestamp,
+                timestamp=detected_at.isoformat(),
                 image_path=image_path or "",
                 detection_count=len(detection_results),
                 detections=detection_results,
@@ -282,13 +736,13 @@ class InsectDetector:
             
             # 結果保存
             if save_result and len(detection_results) > 0:
-                self._save_detection_result(image, record)
+                self._save_detection_result(image, record, detected_at)
             
             # 統計更新
             self._update_stats(record, time.time() - start_time)
             
-            self.logger.debug(f"Detection completed: {len(detection_results)} insects found "
-                            f"in {record.processing_time_ms}ms")
+            self.logger.debug("Detection completed: %d insects found in %dms",
+                              len(detection_results), record.processing_time_ms)
             
             return record
             
@@ -297,7 +751,8 @@ class InsectDetector:
             self.stats.error_count += 1
             return None
     
-    def _capture_with_ir_led(self, use_ir_led: bool = True) -> Optional[np.ndarray]:
+    def _capture_with_ir_led(self, use_ir_led: bool = True,
+                             streaming: bool = False) -> Optional[np.ndarray]:
         """IR LED制御付き画像撮影"""
         if self.hardware_controller is None:
             self.logger.error("Hardware controller not available")
@@ -305,15 +760,22 @@ class InsectDetector:
         
         try:
             # IR LED点灯
-            if use_ir_led:
+            if use_ir_led and streaming:
+                self.start_ir_streaming()
+                # 初回のみ安定化待ち（通知が来ない場合は安定化時間だけ待って撮影）
+                if not self._ir_led_stable.wait(_IR_LED_STABLE_TIMEOUT):
+                    self.logger.warning("IR LED stabilization not signalled, "
+                                        "continuing after fixed delay")
+                    time.sleep(_IR_LED_SETTLE_TIME)
+            elif use_ir_led:
                 self.hardware_controller.control_ir_led(0.8)
-                time.sleep(0.1)  # LED安定化待機
+                time.sleep(_IR_LED_SETTLE_TIME)  # LED安定化待機
             
             # 画像撮影
             image = self.hardware_controller.capture_image()
             
-            # IR LED消灯
-            if use_ir_led:
+            # IR LED消灯（ストリーミング時は点灯維持）
+            if use_ir_led and not streaming:
                 self.hardware_controller.control_ir_led(0.0)
             
             return image
@@ -322,85 +784,268 @@ class InsectDetector:
             self.logger.error(f"IR LED capture failed: {e}")
             # エラー時はLED消灯を保証
             if use_ir_led and self.hardware_controller is not None:
+                self.stop_ir_streaming()
                 try:
                     self.hardware_controller.control_ir_led(0.0)
                 except:
                     pass
             return None
     
-    def _run_inference(self, image: np.ndarray) -> List[DetectionResult]:
-        """YOLOv8推論実行"""
+    def start_ir_streaming(self) -> None:
+        """
+        IR LEDストリーミング開始
+        
+        LEDを点灯し、安定化時間（100ms）経過後にバックグラウンドで
+        安定化完了を通知する。撮影前に呼んでおけば初回の待ちも撮影準備と重なる。
+        """
+        if self._ir_streaming or self.hardware_controller is None:
+            return
+        
+        self.hardware_controller.control_ir_led(0.8)
+        self._ir_streaming = True
+        self._ir_stable_timer = threading.Timer(_IR_LED_SETTLE_TIME,
+                                                self._ir_led_stable.set)
+        self._ir_stable_timer.daemon = True
+        self._ir_stable_timer.start()
+    
+    def stop_ir_streaming(self) -> None:
+        """IR LEDストリーミング終了（LED消灯）"""
+        if not self._ir_streaming:
+            return
+        
+        if self._ir_stable_timer is not None:
+            self._ir_stable_timer.cancel()
+            self._ir_stable_timer = None
+        self._ir_led_stable.clear()
+        self._ir_streaming = False
+        
+        if self.hardware_controller is not None:
+            try:
+                self.hardware_controller.control_ir_led(0.0)
+            except Exception as e:
+                self.logger.warning(f"Failed to turn off IR LED: {e}")
+    
+    def _run_inference(self, image: np.ndarray,
+                       detected_at: Optional[datetime] = None) -> DetectionBatch:
+        """
+        YOLOv8推論実行
+        
+        Args:
+            image: 入力画像
+            detected_at: 検出時刻（検出記録と共有する。None = 現在時刻）
+        """
+        timestamp = (detected_at or datetime.now()).isoformat()
         if not self.model_loaded or self.model is None:
             self.logger.error("Model not loaded")
-            return []
+            return DetectionBatch.empty(timestamp)
         
         try:
             inference_start = time.time()
             
-            # 推論実行
-            results = self.model(
-                image,
-                conf=self.settings.confidence_threshold,
-                iou=self.settings.nms_threshold,
-                max_det=self.settings.max_detections,
-                imgsz=self.settings.input_size,
-                device=self.settings.device,
-                half=self.settings.half_precision,
-                verbose=False
-            )
+            # 前処理・推論実行
+            input_tensor, (ratio, _, offset) = self._preprocess(image)
+            results = self._predict(input_tensor)
             
             inference_time = time.time() - inference_start
             self.inference_times.append(inference_time)
             
-            # 結果変換
-            detection_results = []
-            timestamp = datetime.now().isoformat()
+            # 結果変換（レターボックス座標 → 元画像座標、1画像入力のため結果は1件）
+            detection_results = self._decode_result(
+                results[0], timestamp, scale=(1 / ratio, 1 / ratio), offset=offset,
+                image_shape=image.shape[:2])
             
-            for result in results:
-                if result.boxes is not None:
-                    boxes = result.boxes
-                    
-                    for i in range(len(boxes)):
-                        # バウンディングボックス情報
-                        box = boxes.xyxy[i].cpu().numpy()  # x1, y1, x2, y2
-                        conf = float(boxes.conf[i].cpu().numpy())
-                        cls = int(boxes.cls[i].cpu().numpy())
-                        
-                        # 中心座標・サイズ変換
-                        x_center = (box[0] + box[2]) / 2
-                        y_center = (box[1] + box[3]) / 2
-                        width = box[2] - box[0]
-                        height = box[3] - box[1]
-                        
-                        # DetectionResult作成
-                        detection = DetectionResult(
-                            x_center=float(x_center),
-                            y_center=float(y_center),
-                            width=float(width),
-                            height=float(height),
-                            confidence=conf,
-                            class_id=cls,
-                            timestamp=timestamp
-                        )
-                        
-                        # 検証
-                        if self.validator.validate_detection_result(detection):
-                            detection_results.append(detection)
-                            self.confidences.append(conf)
-                        else:
-                            self.logger.warning(f"Invalid detection result: {detection}")
-            
-            self.logger.debug(f"Inference completed in {inference_time:.3f}s, "
-                            f"found {len(detection_results)} valid detections")
+            self.logger.debug("Inference completed in %.3fs, found %d valid detections",
+                              inference_time, len(detection_results))
             
             return detection_results
             
         except Exception as e:
             self.logger.error(f"Inference failed: {e}")
-            return []
+            return DetectionBatch.empty(timestamp)
+    
+    def _preprocess(self, image: np.ndarray) -> Tuple['torch.Tensor', tuple]:
+        """
+        推論入力テンソル作成
+        
+        縦横比を保って縮小し、余白を埋めたレターボックス画像にする（バッチ推論時の
+        Ultralytics前処理と同じ配置）。リサイズ・BGR→RGB・HWC→CHWをuint8のまま行い、
+        転送後にデバイス上で正規化する。Ultralytics側の前処理はテンソル入力時に省略される。
+        
+        Args:
+            image: 入力画像（BGR, H x W x 3）
+            
+        Returns:
+            Tuple: 1 x 3 x H x W テンソル（0〜1正規化済み、次回呼び出しで上書きされる）と
+                レターボックス配置（縮小率、縮小後の (幅, 高さ)、余白の (左, 上)）
+        """
+        input_h, input_w = self.settings.input_size
+        if self._host_buf is None or self._host_buf.shape[2:] != (input_h, input_w):
+            self._allocate_input_buffers()
+        
+        # 配置計算・余白の塗りつぶしは元画像サイズが変わった時のみ
+        image_shape = image.shape[:2]
+        if image_shape != self._letterbox_shape:
+            self._letterbox = _letterbox_geometry(image_shape, self.settings.input_size)
+            _, (new_w, new_h), _ = self._letterbox
+            self._resize_buf = np.empty((new_h, new_w, 3), dtype=np.uint8)
+            self._host_buf.fill_(_LETTERBOX_PAD_VALUE)
+            self._letterbox_shape = image_shape
+        _, (new_w, new_h), (left, top) = self._letterbox
+        
+        cv2.resize(image, (new_w, new_h), dst=self._resize_buf,
+                   interpolation=cv2.INTER_LINEAR)
+        # BGR→RGB・HWC→CHWは余白の内側への1回のコピーで行う
+        self._host_buf.numpy()[0, :, top:top + new_h, left:left + new_w] = (
+            self._resize_buf.transpose(2, 0, 1)[::-1])
+        
+        if self._dev_u8_buf is not None:
+            # ピン留めメモリからの非同期転送 → デバイス上で型変換
+            self._dev_u8_buf.copy_(self._host_buf, non_blocking=True)
+            self._dev_buf.copy_(self._dev_u8_buf)
+        else:
+            self._dev_buf.copy_(self._host_buf)
+        return self._dev_buf.div_(255.0), self._letterbox
+    
+    def _allocate_input_buffers(self) -> None:
+        """推論入力バッファ確保（input_size・デバイス・精度に合わせる）"""
+        input_h, input_w = self.settings.input_size
+        use_cuda = self._torch_device.type == 'cuda'
+        dtype = torch.float16 if self.settings.half_precision and use_cuda else torch.float32
+        
+        self._letterbox_shape = None  # 次回の前処理で余白を塗り直す
+        self._host_buf = torch.empty((1, 3, input_h, input_w), dtype=torch.uint8,
+                                     pin_memory=use_cuda)
+        self._dev_u8_buf = (torch.empty_like(self._host_buf, device=self._torch_device)
+                            if use_cuda else None)
+        self._dev_buf = torch.empty((1, 3, input_h, input_w), dtype=dtype,
+                                    device=self._torch_device)
+    
+    def _predict(self, source: Any) -> List[Any]:
+        """
+        YOLOv8推論呼び出し
+        
+        Args:
+            source: 画像、または画像のリスト（リスト時は1回の推論でまとめて処理）
+            
+        Returns:
+            List[Any]: 画像毎のUltralytics推論結果
+        """
+        with torch.inference_mode():
+            if self.predictor is not None:
+                return self.predictor(source)
+            return self.model(source, **self._predict_overrides())
+    
+    def _predict_overrides(self) -> Dict[str, Any]:
+        """Ultralytics推論パラメータ"""
+        return dict(
+            conf=self.settings.confidence_threshold,
+            iou=self.settings.nms_threshold,
+            max_det=self.settings.max_detections,
+            imgsz=self.settings.input_size,
+            device=self._inference_device(),
+            half=self.settings.half_precision,
+            verbose=False
+        )
+    
+    def _setup_predictor(self) -> None:
+        """
+        推論器の生成・ウォームアップ
+        
+        検出器専用のUltralytics Predictorを生成してダミー画像で1回推論し、以降は
+        パラメータ解析・モデル準備を省いてPredictorを直接呼び出す。
+        初回推論時のCUDA初期化・カーネル選択もここで済ませる。
+        推論用モデル（AutoBackend）を読み込んだPredictorは共有キャッシュに保持し、
+        検出器毎のPredictorはその複製にパラメータを設定したもの（YOLO.predict()が
+        既存Predictorの引数を更新する手順と同じ）とするため、閾値は検出器毎に設定でき、
+        他の検出器・設定更新でモデルを再読み込みしない（変換済みモデルは
+        ファイルからの再読み込みになるため）。
+        複製は推論ロックを共有するため、同じモデルでの推論は検出器間で直列化される。
+        """
+        overrides = {**self.model.overrides, **self._predict_overrides(), "mode": "predict"}
+        
+        with _MODEL_LOCK:
+            entry = _MODEL_CACHE.get(self._model_key)
+            base = entry["predictor"] if entry is not None else None
+            if base is None:
+                base = DetectionPredictor(overrides=overrides, _callbacks=self.model.callbacks)
+                base.setup_model(model=self.model.model, verbose=False)
+                if entry is not None:
+                    entry["predictor"] = base
+        
+        predictor = copy.copy(base)
+        predictor.args = get_cfg(base.args, overrides)
+        
+        input_h, input_w = self.settings.input_size
+        predictor(np.zeros((input_h, input_w, 3), dtype=np.uint8))
+        self.predictor = predictor
+    
+    def _decode_result(self, result: Any, timestamp: str,
+                       scale: Optional[Tuple[float, float]] = None,
+                       offset: Optional[Tuple[int, int]] = None,
+                       image_shape: Optional[Tuple[int, int]] = None) -> DetectionBatch:
+        """
+        推論結果1画像分をDetectionBatchへ変換
+        
+        Args:
+            result: Ultralytics推論結果
+            timestamp: 検出時刻（ISO形式）
+            scale: 座標倍率 (x, y)（縮小入力の座標を元画像座標へ戻す）
+            offset: 倍率適用前に差し引く余白 (左, 上)（レターボックス入力時）
+            image_shape: 元画像の (高さ, 幅)（指定時は座標を画像内に収める）
+            
+        Returns:
+            DetectionBatch: 検証済み検出結果
+        """
+        if result.boxes is None:
+            return DetectionBatch.empty(timestamp)
+        
+        boxes = result.boxes
+        
+        # バウンディングボックス情報（GPU→CPU転送は各テンソル1回のみ）
+        xyxy = boxes.xyxy.cpu().numpy().astype(np.float32, copy=False)  # x1, y1, x2, y2
+        if offset is not None:
+            xyxy = xyxy - np.array([offset[0], offset[1], offset[0], offset[1]],
+                                   dtype=np.float32)
+        if scale is not None:
+            xyxy = xyxy * np.array([scale[0], scale[1], scale[0], scale[1]],
+                                   dtype=np.float32)
+        if image_shape is not None:
+            xyxy[:, 0::2] = np.clip(xyxy[:, 0::2], 0, image_shape[1])
+            xyxy[:, 1::2] = np.clip(xyxy[:, 1::2], 0, image_shape[0])
+        confs = boxes.conf.cpu().numpy().astype(np.float32, copy=False)
+        clss = boxes.cls.cpu().numpy().astype(np.int32)
+        
+        # 中心座標・サイズ変換（ベクトル演算）
+        coords = np.empty_like(xyxy)
+        coords[:, 0:2] = (xyxy[:, 0:2] + xyxy[:, 2:4]) * 0.5
+        coords[:, 2:4] = xyxy[:, 2:4] - xyxy[:, 0:2]
+        batch = DetectionBatch(coords, confs, clss, timestamp)
+        
+        # 検証
+        valid = batch.valid_mask()
+        if not valid.all():
+            if self.logger.isEnabledFor(logging.WARNING):
+                for index in np.flatnonzero(~valid).tolist():
+                    self.logger.warning("Invalid detection result: coords=%s, "
+                                        "confidence=%s, class_id=%s",
+                                        coords[index], confs[index], clss[index])
+            batch = batch.select(valid)
+        
+        return batch
     
-    def _save_detection_result(self, image: np.ndarray, record: DetectionRecord) -> None:
-        """検出結果保存"""
+    def _save_detection_result(self, image: np.ndarray, record: DetectionRecord,
+                               detected_at: Optional[datetime] = None,
+                               owns_image: bool = False) -> None:
+        """
+        検出結果保存
+        
+        Args:
+            image: 元画像
+            record: 検出記録（image_pathを保存先に更新）
+            detected_at: 検出時刻（指定時はrecord.timestampの再解析を省略）
+            owns_image: 呼び出し側が以後imageを使わない場合True
+                （複製せずに直接描画して書き込みキューへ渡す）
+        """
         if not self.settings.save_detection_images:
             return
         
@@ -411,56 +1056,77 @@ class InsectDetector:
             
             # ファイル名生成
             filename = generate_detection_image_name(
-                datetime.fromisoformat(record.timestamp),
+                detected_at or datetime.fromisoformat(record.timestamp),
                 record.detection_count
             )
             
             image_path = output_dir / filename
             
-            # 検出結果描画
-            annotated_image = self._draw_detections(image.copy(), record.detections)
+            # 検出結果描画（描画不要なら複製も省略）
+            if not owns_image:
+                image = image.copy()
+            if len(record.detections) > 0:
+                image = self._draw_detections(image, record.detections)
+            annotated_image = image
             
-            # 画像保存
-            cv2.imwrite(str(image_path), annotated_image)
+            # 画像保存（書き込みスレッドへ委譲）
+            self._save_queue.put((str(image_path), annotated_image))
             
             # 記録更新
             record.image_path = str(image_path)
             
-            self.logger.debug(f"Detection result saved: {image_path}")
-            
         except Exception as e:
             self.logger.error(f"Failed to save detection result: {e}")
     
-    def _draw_detections(self, image: np.ndarray, detections: List[DetectionResult]) -> np.ndarray:
-        """検出結果を画像に描画"""
-        try:
-            for detection in detections:
-                # バウンディングボックス座標計算
-                x1 = int(detection.x_center - detection.width / 2)
-                y1 = int(detection.y_center - detection.height / 2)
-                x2 = int(detection.x_center + detection.width / 2)
-                y2 = int(detection.y_center + detection.height / 2)
-                
-                # 色設定（信頼度に応じて）
-                if detection.confidence > 0.8:
-                    color = (0, 255, 0)  # 緑（高信頼度）
-                elif detection.confidence > 0.6:
-                    color = (0, 255, 255)  # 黄（中信頼度）
+    def _drain_saves(self) -> None:
+        """検出画像書き込みループ（Noneで終了）"""
+        while True:
+            item = self._save_queue.get()
+            try:
+                if item is None:
+                    return
+                image_path, image = item
+                if cv2.imwrite(image_path, image, [cv2.IMWRITE_JPEG_QUALITY, 85]):
+                    self.logger.debug("Detection result saved: %s", image_path)
                 else:
-                    color = (0, 0, 255)  # 赤（低信頼度）
+                    self.logger.error(f"Failed to write detection image: {image_path}")
+            except Exception as e:
+                self.logger.error(f"Failed to write detection image: {e}")
+            finally:
+                self._save_queue.task_done()
+    
+    def _draw_detections(self, image: np.ndarray, detections: DetectionBatch) -> np.ndarray:
+        """検出結果を画像に描画（OpenCL対応環境ではUMat経由でGPU描画）"""
+        try:
+            if len(detections) == 0:
+                return image
+            
+            canvas = cv2.UMat(image) if self._use_umat else image
+            
+            # バウンディングボックス座標・色計算（一括）
+            boxes = np.column_stack((detections.coords, detections.confs)).astype(np.float64)
+            coords, colors = image_kernels.boxes_to_draw(boxes)
+            
+            for confidence, (x1, y1, x2, y2), color in zip(detections.confs.tolist(),
+                                                          coords.tolist(), colors.tolist()):
+                color = tuple(color)
                 
                 # バウンディングボックス描画
-                cv2.rectangle(image, (x1, y1), (x2, y2), color, 2)
+                cv2.rectangle(canvas, (x1, y1), (x2, y2), color, 2)
                 
                 # ラベル描画
-                label = f"Insect {detection.confidence:.2f}"
-                label_size = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 2)[0]
-                cv2.rectangle(image, (x1, y1 - label_size[1] - 10), 
+                conf_text = f"{confidence:.2f}"
+                label = "Insect " + conf_text
+                label_size = self._text_size_lut.get(conf_text)
+                if label_size is None:
+                    label_size = cv2.getTextSize(label, _LABEL_FONT, _LABEL_FONT_SCALE,
+                                                 _LABEL_THICKNESS)[0]
+                cv2.rectangle(canvas, (x1, y1 - label_size[1] - 10), 
                             (x1 + label_size[0], y1), color, -1)
-                cv2.putText(image, label, (x1, y1 - 5), 
-                          cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 2)
+                cv2.putText(canvas, label, (x1, y1 - 5), 
+                          _LABEL_FONT, _LABEL_FONT_SCALE, _LABEL_TEXT_COLOR, _LABEL_THICKNESS)
             
-            return image
+            return canvas.get() if self._use_umat else image
             
         except Exception as e:
             self.logger.error(f"Failed to draw detections: {e}")
@@ -474,17 +1140,18 @@ class InsectDetector:
             
             # 平均推論時間更新
             if self.inference_times:
-                self.stats.average_inference_time = np.mean(self.inference_times[-100:])  # 直近100回
+                self.stats.average_inference_time = self.inference_times.mean()
             
             # 平均信頼度更新
+            self.confidences.extend(record.detections.confs.tolist())
             if self.confidences:
-                self.stats.average_confidence = np.mean(self.confidences[-1000:])  # 直近1000検出
+                self.stats.average_confidence = self.confidences.mean()
             
             # 検出成功率更新
-            if self.stats.total_images_processed > 0:
-                images_with_detections = sum(1 for _ in range(self.stats.total_images_processed) 
-                                           if record.detection_count > 0)
-                self.stats.detection_rate = images_with_detections / self.stats.total_images_processed
+            if record.detection_count > 0:
+                self.images_with_detections += 1
+            self.stats.detection_rate = (self.images_with_detections /
+                                         self.stats.total_images_processed)
             
             # 最後の検出時刻更新
             if record.detection_count > 0:
@@ -514,29 +1181,151 @@ class InsectDetector:
         
         self.logger.info(f"Starting batch detection: {len(image_paths)} images")
         
+        batch_size = self._max_batch_size()
+        
+        chunks = [image_paths[start:start + batch_size]
+                  for start in range(0, len(image_paths), batch_size)]
+        
         results = []
-        for i, image_path in enumerate(image_paths):
-            try:
-                self.logger.debug(f"Processing image {i+1}/{len(image_paths)}: {image_path}")
-                
-                record = self.detect_single_image(
-                    image_path=image_path,
-                    use_ir_led=use_ir_led,
-                    save_result=save_results
-                )
-                
-                if record is not None:
-                    results.append(record)
-                else:
-                    self.logger.warning(f"Failed to process: {image_path}")
-                
-            except Exception as e:
-                self.logger.error(f"Batch processing error for {image_path}: {e}")
-                continue
+        with ThreadPoolExecutor(max_workers=min(4, batch_size),
+                                thread_name_prefix="batch-imread") as pool:
+            # 画像読み込みは1ミニバッチ先行させ、推論中に次のデコードを行う
+            pending = [pool.submit(self._read_image, path) for path in chunks[0]] if chunks else []
+            for index, chunk_paths in enumerate(chunks):
+                self.logger.debug("Processing images %d-%d/%d", index * batch_size + 1,
+                                  index * batch_size + len(chunk_paths), len(image_paths))
+                try:
+                    images = [future.result() for future in pending]
+                    pending = ([pool.submit(self._read_image, path) for path in chunks[index + 1]]
+                               if index + 1 < len(chunks) else [])
+                    results.extend(self._detect_chunk(chunk_paths, images, save_results))
+                except Exception as e:
+                    self.logger.error(f"Batch processing error for {chunk_paths}: {e}")
+                    self.stats.error_count += 1
+                    continue
         
         self.logger.info(f"Batch detection completed: {len(results)}/{len(image_paths)} successful")
         return results
     
+    def _max_batch_size(self) -> int:
+        """
+        1回の推論に渡す最大画像数
+        
+        PyTorch・TorchScriptは設定値まで、ONNX/OpenVINO/TensorRTは変換時の
+        バッチ数（モデルのメタデータ）までとする（旧設定で固定バッチ1に変換した
+        モデルは1枚ずつ推論）。
+        """
+        batch_size = max(1, self.settings.batch_size)
+        autobackend = getattr(self.predictor, "model", None)
+        if (autobackend is None or autobackend.pt or autobackend.nn_module
+                or autobackend.jit):
+            return batch_size
+        return max(1, min(batch_size, int(getattr(autobackend, "batch", 1))))
+    
+    def _read_image(self, image_path: str) -> Tuple[Optional[np.ndarray],
+                                                   Optional[Tuple[float, float]]]:
+        """
+        バッチ処理用画像読み込み
+        
+        JPEGはTurboJPEGの縮小デコード（1/2〜1/8）で、推論入力サイズを下回らない
+        範囲で最も小さく読み込む（縮小分のIDCTを省略）。
+        
+        Args:
+            image_path: 画像ファイルパス
+            
+        Returns:
+            Tuple: 画像（失敗時None）と元画像座標への倍率 (x, y)（等倍時None）
+        """
+        try:
+            if self._tj is not None and image_path.lower().endswith(('.jpg', '.jpeg')):
+                with open(image_path, 'rb') as f:
+                    data = f.read()
+                width, height, _, _ = self._tj.decode_header(data)
+                factor = self._jpeg_scaling_factor(width, height)
+                image = self._tj.decode(data, pixel_format=TJPF_BGR, scaling_factor=factor)
+                if factor == (1, 1):
+                    return image, None
+                return image, (width / image.shape[1], height / image.shape[0])
+            
+            return cv2.imread(image_path), None
+            
+        except Exception as e:
+            self.logger.warning(f"Failed to read image {image_path}: {e}")
+            return None, None
+    
+    def _jpeg_scaling_factor(self, width: int, height: int) -> Tuple[int, int]:
+        """レターボックス時に拡大とならない最小の縮小率"""
+        input_h, input_w = self.settings.input_size
+        for factor in ((1, 8), (1, 4), (1, 2)):
+            scaled_w = width * factor[0] // factor[1]
+            scaled_h = height * factor[0] // factor[1]
+            if scaled_w >= input_w or scaled_h >= input_h:
+                return factor
+        return (1, 1)
+    
+    def _detect_chunk(self,
+                      image_paths: List[str],
+                      images: List[Tuple[Optional[np.ndarray], Optional[Tuple[float, float]]]],
+                      save_results: bool) -> List[DetectionRecord]:
+        """
+        ミニバッチ1回分の検出処理
+        
+        Args:
+            image_paths: 画像ファイルパスリスト
+            images: _read_image()の結果（画像・座標倍率）
+            save_results: 結果保存可否
+            
+        Returns:
+            List[DetectionRecord]: 検出記録リスト
+        """
+        valid_paths = []
+        valid_images = []
+        valid_scales = []
+        for image_path, (image, scale) in zip(image_paths, images):
+            if image is None or not self.validator.validate_image(image):
+                self.logger.warning(f"Failed to process: {image_path}")
+                continue
+            valid_paths.append(image_path)
+            valid_images.append(image)
+            valid_scales.append(scale)
+        
+        if not valid_images:
+            return []
+        
+        # まとめて1回推論（レターボックス処理後に1つのテンソルへ積まれる）
+        start_time = time.time()
+        batch_results = self._predict(valid_images)
+        per_image_time = (time.time() - start_time) / len(valid_images)
+        self.inference_times.extend([per_image_time] * len(valid_images))
+        
+        detected_at = datetime.now()
+        timestamp = detected_at.isoformat()
+        records = []
+        for image_path, image, scale, result in zip(valid_paths, valid_images, valid_scales,
+                                                    batch_results):
+            detection_results = self._decode_result(result, timestamp, scale)
+            record = DetectionRecord(
+                timestamp=timestamp,
+                image_path=image_path,
+                detection_count=len(detection_results),
+                detections=detection_results,
+                processing_time_ms=int(per_image_time * 1000),
+                confidence_threshold=self.settings.confidence_threshold,
+                model_version="YOLOv8"
+            )
+            
+            if save_results and len(detection_results) > 0:
+                # 縮小デコードした画像は元解像度で読み直して描画
+                if scale is not None:
+                    image = cv2.imread(image_path)
+                if image is not None:
+                    self._save_detection_result(image, record, detected_at, owns_image=True)
+            
+            self._update_stats(record, per_image_time)
+            records.append(record)
+        
+        return records
+    
     def get_detection_stats(self) -> DetectionStats:
         """検出統計取得"""
         return self.stats
@@ -568,7 +1357,8 @@ class InsectDetector:
                 "nms_threshold": self.settings.nms_threshold,
                 "max_detections": self.settings.max_detections,
                 "device": self.settings.device,
-                "input_size": self.settings.input_size
+                "input_size": self.settings.input_size,
+                "engine_path": self.settings.engine_path
             }
         }
     
@@ -588,7 +1378,13 @@ class InsectDetector:
                 self.settings = new_settings
                 return self._load_model()
             
+            new_settings.engine_path = self.settings.engine_path
             self.settings = new_settings
+            
+            # Predictorのパラメータを新しい設定で更新
+            if self.model_loaded:
+                self._setup_predictor()
+            
             self.logger.info("Detection settings updated")
             return True
             
@@ -599,11 +1395,16 @@ class InsectDetector:
     def cleanup(self) -> None:
         """リソース解放"""
         try:
-            # モデル解放
-            if self.model is not None:
-                del self.model
-                self.model = None
-                self.model_loaded = False
+            # IR LED消灯
+            self.stop_ir_streaming()
+            
+            # 未書き込みの検出画像を保存して書き込みスレッド終了
+            if self._save_worker.is_alive():
+                self._save_queue.put(None)
+                self._save_worker.join()
+            
+            # モデル解放（他の検出器と共有中の場合は参照のみ解放）
+            self._release_model()
             
             # GPU メモリクリア
             if torch.cuda.is_available():
@@ -7,32 +7,94 @@ HAT使用時の専用制御とGPIOによる基本制御の両方に対応。
 - 温度監視
 - 自動調光機能
 - エラー検出・保護機能
+
+PWM出力・点灯時間の状態更新はロックで保護しており、点灯効果ループや
+他スレッドから同時に呼び出してもよい（スレッドセーフ）。
 """
 
+import asyncio
+import concurrent.futures
+import importlib
+import importlib.util
 import logging
+import mmap
+import os
+import struct
 import time
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 from datetime import datetime
 import threading
 
+import numpy as np
+
+from pigpio_pwm import PIGPIO_AVAILABLE, PIGPIO_PWM_RANGE, PigpioPWM, pigpio
+
+
+def _load_optional(name: str) -> Optional[Any]:
+    """
+    任意モジュールの読み込み
+    
+    find_specで有無を判定し、未導入の環境ではImportErrorを発生させずにNoneを返す。
+    導入済みでも実行環境外で読み込みに失敗するもの（Raspberry Pi以外でのRPi.GPIO等）は
+    Noneとして扱う。
+    """
+    package = name.partition('.')[0]
+    if (importlib.util.find_spec(package) is None
+            or importlib.util.find_spec(name) is None):
+        return None
+    try:
+        return importlib.import_module(name)
+    except (ImportError, RuntimeError) as e:
+        logging.warning(f"{name} could not be loaded: {e}")
+        return None
+
+
 # GPIO制御ライブラリ
-try:
-    import RPi.GPIO as GPIO
-    GPIO_AVAILABLE = True
-except ImportError:
-    GPIO_AVAILABLE = False
+GPIO = _load_optional("RPi.GPIO")
+GPIO_AVAILABLE = GPIO is not None
+if not GPIO_AVAILABLE:
     logging.warning("RPi.GPIO not available. LED functionality will be limited.")
 
+# pigpiod_if2 直接書き込みカーネル（任意ビルド: cythonize -i led_controller_cy.pyx）
+led_controller_cy = _load_optional("led_controller_cy")
+FAST_PWM_AVAILABLE = led_controller_cy is not None
+
+# BCM283x/BCM2711 PWMレジスタ（ペリフェラルベースからのオフセット）
+SOC_RANGES_PATH = '/proc/device-tree/soc/ranges'
+PWM_BLOCK_OFFSET = 0x20C000
+# チャンネル別（RNG, DAT）レジスタオフセット: PWM0 = GPIO12/18, PWM1 = GPIO13/19
+PWM_CHANNEL_REGS = {
+    12: (0x10, 0x14), 18: (0x10, 0x14),
+    13: (0x20, 0x24), 19: (0x20, 0x24),
+}
+
+# 1秒あたりのナノ秒（時間計測はperf_counter_nsの整数値で行う）
+_NS = 1_000_000_000
+
+# LED温度の再計算間隔（熱時定数は秒単位のため0.5秒以内の値は再利用）
+_TEMP_CACHE_TTL_NS = 500_000_000
+# 熱保護用の温度取得間隔（秒、バックグラウンドで更新）
+TEMP_POLL_INTERVAL = 0.5
+
+# フェードの知覚補正（明るさ知覚 ≒ デューティ比^(1/2.2)）
+FADE_GAMMA = 2.2
+# 知覚明度256段階 → 明度（デューティ比）の対応表
+_GAMMA_LUT = (np.arange(256, dtype=np.float32) / 255.0) ** np.float32(FADE_GAMMA)
+# pigpio波形フェードの段階数上限（1段階 = 波形1個 + チェーン7バイト、
+# pigpioの上限は波形約250個・チェーン600バイト）
+WAVE_FADE_MAX_STEPS = 50
+
+# 温度センサー（Raspberry Pi SoC）
+THERMAL_ZONE_PATH = '/sys/class/thermal/thermal_zone0/temp'
+
 # HAT専用ライブラリの例（実際のHATに応じて変更）
-try:
-    # 例: from your_hat_library import LEDController as HATController
-    HAT_AVAILABLE = False  # 実際のHATライブラリが利用可能な場合はTrue
-except ImportError:
-    HAT_AVAILABLE = False
+# 例: hat_library = _load_optional("your_hat_library")
+#     HAT_AVAILABLE = hat_library is not None
+HAT_AVAILABLE = False  # 実際のHATライブラリが利用可能な場合はTrue
 
 
-@dataclass
+@dataclass(slots=True)
 class LEDSettings:
     """LED設定データクラス"""
     pin: int = 18                    # GPIO pin number
@@ -44,9 +106,10 @@ class LEDSettings:
     thermal_protection: bool = True  # 熱保護機能
     max_temperature: float = 70.0    # 最大動作温度（℃）
     auto_brightness: bool = False    # 自動明度調整
+    direct_register_pwm: bool = False  # PWMレジスタ直接書き込み（要root、/dev/mem）
 
 
-@dataclass
+@dataclass(slots=True)
 class LEDStatus:
     """LED状態情報"""
     is_available: bool = False
@@ -62,6 +125,38 @@ class LEDStatus:
     thermal_protection_active: bool = False
 
 
+def _pulse_schedule(min_brightness: float, max_brightness: float,
+                    half_steps: int) -> np.ndarray:
+    """
+    パルス（呼吸効果）1周期分の明度列作成
+    
+    前半は余弦カーブで最小→最大、後半は前半を逆順にたどる。
+    
+    Args:
+        min_brightness: 最小明度
+        max_brightness: 最大明度
+        half_steps: 半周期の段階数
+        
+    Returns:
+        np.ndarray: half_steps * 2 個の明度列
+    """
+    rise = (min_brightness + (max_brightness - min_brightness) * 0.5
+            * (1.0 - np.cos(np.pi * np.arange(half_steps) / half_steps)))
+    return np.concatenate((rise, rise[::-1]))
+
+
+# 制御方式別のシステム情報（実行中は変化しない、返却時は複製）
+_SYSTEM_INFO = {
+    method: {
+        "gpio_available": GPIO_AVAILABLE,
+        "pigpio_available": PIGPIO_AVAILABLE,
+        "hat_available": HAT_AVAILABLE,
+        "control_method": method
+    }
+    for method in ("HAT", "pigpio-hardware", "pigpio", "GPIO")
+}
+
+
 class LEDController:
     """
     IR LED Ring Light 制御クラス
@@ -86,24 +181,92 @@ class LEDController:
         
         # 設定
         self.settings = settings or LEDSettings()
+        self._bind_settings()
         
         # 状態管理
         self.status = LEDStatus()
-        self.status.is_available = GPIO_AVAILABLE or HAT_AVAILABLE
+        self.status.is_available = GPIO_AVAILABLE or PIGPIO_AVAILABLE or HAT_AVAILABLE
         
         # PWM制御オブジェクト
         self.pwm = None
+        self._pigpio_pwm: Optional[PigpioPWM] = None  # pigpio PWM出力（利用時はself.pwmの代わり）
+        self.pi = None  # pigpio接続（波形出力用、self._pigpio_pwm.pi）
+        self._hardware_pwm = False  # pigpioハードウェアPWM使用中か
+        self._fast_pwm = None  # led_controller_cy.FastPWM（ビルド済みの場合）
+        self._gpio_setup_done = False  # RPi.GPIOでピン設定済みか
+        self._pwm_started = False  # RPi.GPIO PWM出力中か
+        self._pwm_regs: Optional[mmap.mmap] = None  # PWMレジスタ領域（/dev/mem）
+        self._pwm_dat_offset = 0
+        self._pwm_reg_range = 0
+        self._pwm_released = False  # 波形出力のためPWMを停止中か
         self.hat_controller = None
+        self._pulse_wave_id = None  # pigpio呼吸波形（繰り返し送出中のみ）
+        
+        # 統計・監視（単調時計のナノ秒整数、秒への変換は参照時のみ）
+        self._start_ns: Optional[int] = None
+        self._total_on_ns = 0
+        self._temp_cache = (-_TEMP_CACHE_TTL_NS, 0.0)  # (取得時刻ns, 温度)
         
-        # 統計・監視
-        self.start_time = None
-        self.fade_thread = None
+        # 温度センサーは開いたまま保持しpreadで再読込（無い環境では推定値を使用）
+        self._temp_fd: Optional[int] = None
+        try:
+            self._temp_fd = os.open(THERMAL_ZONE_PATH, os.O_RDONLY)
+        except OSError:
+            self.logger.info("Thermal sensor not available (%s), "
+                             "using estimated temperature", THERMAL_ZONE_PATH)
         self.monitoring_active = False
         
+        # PWM出力・状態更新の排他制御
+        self._lock = threading.Lock()
+        
+        # 点灯効果（フェード・パルス・点滅）専用イベントループ（常駐1スレッド）
+        # 初回の効果投入時に開始し、実行中の効果は新しい効果の投入時にキャンセルされる
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._effect_task: Optional[asyncio.Task] = None
+        
+        # 熱保護用温度（常駐スレッドで定期更新、set_brightnessは値の比較のみ）
+        self._temp_cached = 0.0
+        self._temp_thread: Optional[threading.Thread] = None
+        self._temp_stop = threading.Event()
+        self._start_temp_polling()
+        
         # 初期化チェック
         if not self.status.is_available:
             self.logger.error("No LED control method available (GPIO or HAT)")
     
+    def _bind_settings(self) -> None:
+        """明度設定・熱保護・状態出力で毎回参照する設定値をインスタンス属性に展開"""
+        self._min_b = self.settings.min_brightness
+        self._max_b = self.settings.max_brightness
+        self._thermal_protection = self.settings.thermal_protection
+        self._max_temperature = self.settings.max_temperature
+        self._dbg = self.logger.isEnabledFor(logging.DEBUG)  # 明度変更毎のデバッグログ
+        # フェード段階数（50 FPS）と段階間隔（秒）
+        self._fade_steps = max(1, int(self.settings.fade_duration * 50))
+        self._fade_dt = self.settings.fade_duration / self._fade_steps
+        self._settings_dict = {
+            "pin": self.settings.pin,
+            "pwm_frequency": self.settings.pwm_frequency,
+            "max_brightness": self.settings.max_brightness,
+            "thermal_protection": self.settings.thermal_protection,
+            "max_temperature": self.settings.max_temperature
+        }
+    
+    def update_settings(self, settings: LEDSettings) -> None:
+        """
+        設定更新
+        
+        明度範囲・フェード時間・熱保護は即時反映、ピン・PWM周波数は再初期化後に反映。
+        
+        Args:
+            settings: 新しいLED設定
+        """
+        self.settings = settings
+        self._bind_settings()
+        self._start_temp_polling()
+    
     def initialize(self) -> bool:
         """
         LED制御初期化
@@ -127,7 +290,7 @@ class LEDController:
                     return True
             
             # GPIO制御にフォールバック
-            if GPIO_AVAILABLE:
+            if GPIO_AVAILABLE or PIGPIO_AVAILABLE:
                 success = self._initialize_gpio()
                 if success:
                     self.logger.info("LED initialized with GPIO controller")
@@ -159,27 +322,94 @@ class LEDController:
             return False
     
     def _initialize_gpio(self) -> bool:
-        """GPIO制御初期化"""
+        """GPIO制御初期化（pigpio優先、RPi.GPIOにフォールバック）"""
         try:
+            if PIGPIO_AVAILABLE:
+                # 対応ピンではハードウェアPWM（デューティ変更は周期境界で反映、グリッチなし）
+                pin = self.settings.pin
+                pigpio_pwm = PigpioPWM.connect(pin, self.settings.pwm_frequency)
+                if pigpio_pwm is not None:
+                    self._pigpio_pwm = pigpio_pwm
+                    self.pi = pigpio_pwm.pi
+                    self._hardware_pwm = pigpio_pwm.hardware_pwm
+                    self.status.pwm_frequency = pigpio_pwm.frequency
+                    if self._hardware_pwm and self.settings.direct_register_pwm:
+                        self._map_pwm_registers()
+                    if FAST_PWM_AVAILABLE:
+                        try:
+                            self._fast_pwm = led_controller_cy.FastPWM(
+                                pin, PIGPIO_PWM_RANGE, self.status.pwm_frequency,
+                                self._hardware_pwm)
+                        except RuntimeError as e:
+                            self.logger.warning(f"Fast PWM path unavailable: {e}")
+                    self.logger.info("pigpio %s PWM initialized: pin=%d, freq=%dHz",
+                                     "hardware" if self._hardware_pwm else "DMA",
+                                     pin, self.status.pwm_frequency)
+                    return True
+                self.logger.warning("pigpiod not running, falling back to RPi.GPIO")
+            
+            if not GPIO_AVAILABLE:
+                return False
+            
             # GPIO設定
             GPIO.setmode(GPIO.BCM)
             GPIO.setup(self.settings.pin, GPIO.OUT)
+            self._gpio_setup_done = True
             
             # PWM初期化
             self.pwm = GPIO.PWM(self.settings.pin, self.settings.pwm_frequency)
             self.pwm.start(0)  # 0%でスタート
+            self._pwm_started = True
             
             # 状態更新
             self.status.pwm_frequency = self.settings.pwm_frequency
             
-            self.logger.info(f"GPIO PWM initialized: pin={self.settings.pin}, "
-                           f"freq={self.settings.pwm_frequency}Hz")
+            self.logger.info("GPIO PWM initialized: pin=%d, freq=%dHz",
+                             self.settings.pin, self.settings.pwm_frequency)
             return True
             
         except Exception as e:
             self.logger.error(f"GPIO initialization failed: {e}")
             return False
     
+    def _map_pwm_registers(self) -> None:
+        """
+        PWMレジスタ領域のマッピング（direct_register_pwm 有効時）
+        
+        クロック・CTL・RNGの設定はpigpioのhardware_PWMで済ませ、以降の
+        デューティ変更はDATレジスタへの32bit書き込み1回で行う。
+        /dev/memへのアクセスにroot権限が必要で、レジスタ配置の異なる
+        Raspberry Pi 5（RP1）では使用できない。失敗時はpigpio経由で制御する。
+        """
+        try:
+            with open(SOC_RANGES_PATH, 'rb') as f:
+                ranges = f.read(12)
+            # ペリフェラルベース（Pi 4は親アドレスが2セル）
+            base = (int.from_bytes(ranges[4:8], 'big')
+                    or int.from_bytes(ranges[8:12], 'big'))
+            rng_offset, dat_offset = PWM_CHANNEL_REGS[self.settings.pin]
+            
+            fd = os.open('/dev/mem', os.O_RDWR | os.O_SYNC)
+            try:
+                regs = mmap.mmap(fd, mmap.PAGESIZE, offset=base + PWM_BLOCK_OFFSET)
+            finally:
+                os.close(fd)
+            
+            reg_range = struct.unpack_from("<I", regs, rng_offset)[0]
+            if reg_range == 0:
+                regs.close()
+                self.logger.warning("PWM range register not configured, "
+                                    "direct register PWM disabled")
+                return
+            
+            self._pwm_regs = regs
+            self._pwm_dat_offset = dat_offset
+            self._pwm_reg_range = reg_range
+            self.logger.info(f"Direct register PWM enabled: range={reg_range}")
+            
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Direct register PWM unavailable: {e}")
+    
     def set_brightness(self, brightness: float, fade: bool = False) -> bool:
         """
         LED明度設定
@@ -196,12 +426,16 @@ class LEDController:
             return False
         
         try:
+            # 呼吸波形の送出中は停止してから明度を設定
+            self.stop_pulse()
+            
             # 明度を制限範囲内にクランプ
-            brightness = max(self.settings.min_brightness, 
-                           min(self.settings.max_brightness, brightness))
+            brightness = (self._min_b if brightness < self._min_b
+                          else self._max_b if brightness > self._max_b else brightness)
             
-            # 熱保護チェック
-            if self.settings.thermal_protection and self._check_thermal_protection(brightness):
+            # 熱保護チェック（温度はバックグラウンド更新済みの値を参照）
+            if (brightness > 0.0 and self._thermal_protection
+                    and self._temp_cached > self._max_temperature):
                 self.logger.warning("Thermal protection active - brightness limited")
                 brightness = 0.0
             
@@ -209,6 +443,8 @@ class LEDController:
             if fade and abs(brightness - self.status.current_brightness) > 0.1:
                 self._fade_to_brightness(brightness)
             else:
+                # 実行中のフェード・パルス・点滅が後から明度を上書きしないよう先に停止
+                self._cancel_running_effect()
                 self._set_brightness_direct(brightness)
             
             # 状態更新
@@ -216,13 +452,15 @@ class LEDController:
             self.status.is_on = brightness > 0.0
             
             # 点灯時間トラッキング開始/停止
-            if self.status.is_on and self.start_time is None:
-                self.start_time = time.time()
-            elif not self.status.is_on and self.start_time is not None:
-                self.status.total_on_time += time.time() - self.start_time
-                self.start_time = None
+            with self._lock:
+                if self.status.is_on and self._start_ns is None:
+                    self._start_ns = time.perf_counter_ns()
+                elif not self.status.is_on and self._start_ns is not None:
+                    self._total_on_ns += time.perf_counter_ns() - self._start_ns
+                    self._start_ns = None
             
-            self.logger.debug(f"LED brightness set to {brightness:.2f}")
+            if self._dbg:
+                self.logger.debug("LED brightness set to %.2f", brightness)
             return True
             
         except Exception as e:
@@ -235,47 +473,222 @@ class LEDController:
         """直接明度設定"""
         duty_cycle = brightness * 100.0  # 0-100%
         
-        if self.hat_controller is not None:
-            # HAT制御
-            # self.hat_controller.set_brightness(brightness)
-            pass
-        elif self.pwm is not None:
-            # GPIO PWM制御
-            self.pwm.ChangeDutyCycle(duty_cycle)
-        
-        self.status.current_brightness = brightness
+        with self._lock:
+            if self.hat_controller is not None:
+                # HAT制御
+                # self.hat_controller.set_brightness(brightness)
+                pass
+            elif self._pwm_regs is not None and not self._pwm_released:
+                # PWMデータレジスタへ直接書き込み（システムコールなし）
+                struct.pack_into("<I", self._pwm_regs, self._pwm_dat_offset,
+                                 int(brightness * self._pwm_reg_range))
+            elif self._fast_pwm is not None:
+                # pigpio PWM制御（Cythonカーネル、GIL解放中に書き込み）
+                self._fast_pwm.set_duty(brightness)
+                self._pwm_released = False
+            elif self._pigpio_pwm is not None:
+                # pigpio PWM制御（ハードウェアPWM/DMA PWM）
+                self._pigpio_pwm.set_brightness(brightness)
+                self._pwm_released = False
+            elif self.pwm is not None:
+                # GPIO PWM制御
+                self.pwm.ChangeDutyCycle(duty_cycle)
+            
+            self.status.current_brightness = brightness
     
     def _fade_to_brightness(self, target_brightness: float) -> None:
-        """フェード効果で明度変更"""
-        if self.fade_thread is not None and self.fade_thread.is_alive():
-            # 既存のフェードを停止
-            self.fade_thread.join(timeout=0.1)
-        
-        # フェードスレッド開始
-        self.fade_thread = threading.Thread(
-            target=self._fade_worker,
-            args=(target_brightness,),
-            daemon=True
-        )
-        self.fade_thread.start()
-    
-    def _fade_worker(self, target_brightness: float) -> None:
-        """フェードワーカースレッド"""
+        """フェード効果で明度変更（実行中のフェードは中断して新しい目標へ）"""
+        self._submit_effect(self._afade(target_brightness))
+    
+    def _effect_loop(self) -> asyncio.AbstractEventLoop:
+        """点灯効果用イベントループ取得（未開始ならループスレッドを開始）"""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(target=self._loop.run_forever,
+                                                     name="led-effects", daemon=True)
+                self._loop_thread.start()
+            return self._loop
+    
+    def _submit_effect(self, coro) -> concurrent.futures.Future:
+        """点灯効果をイベントループに投入"""
+        return asyncio.run_coroutine_threadsafe(self._run_effect(coro),
+                                                self._effect_loop())
+    
+    def _run_effect_sync(self, coro) -> None:
+        """点灯効果を投入し完了まで待機（他の効果で中断された場合はそのまま戻る）"""
+        try:
+            self._submit_effect(coro).result()
+        except concurrent.futures.CancelledError:
+            pass
+    
+    def _cancel_running_effect(self) -> None:
+        """実行中の点灯効果を停止（効果内からの呼び出しでは何もしない）"""
+        with self._loop_lock:
+            loop, loop_thread = self._loop, self._loop_thread
+        if loop is None or threading.current_thread() is loop_thread:
+            return
+        asyncio.run_coroutine_threadsafe(self._cancel_effect(), loop).result(timeout=2.0)
+    
+    async def _run_effect(self, coro) -> Any:
+        """実行中の効果をキャンセルしてから効果を実行"""
+        previous, self._effect_task = self._effect_task, asyncio.current_task()
+        try:
+            await self._wait_cancelled(previous)
+            return await coro
+        finally:
+            coro.close()  # 開始前にキャンセルされた場合
+            if self._effect_task is asyncio.current_task():
+                self._effect_task = None
+    
+    async def _cancel_effect(self) -> None:
+        """実行中の効果をキャンセルし、終了まで待機"""
+        task, self._effect_task = self._effect_task, None
+        await self._wait_cancelled(task)
+    
+    @staticmethod
+    async def _wait_cancelled(task: Optional[asyncio.Task]) -> None:
+        """タスクをキャンセルし終了を待機（待機側のキャンセルは伝播）"""
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.wait([task])
+    
+    async def _afade(self, target_brightness: float) -> None:
+        """フェード効果"""
         try:
             start_brightness = self.status.current_brightness
-            steps = int(self.settings.fade_duration * 50)  # 50 FPS
-            step_size = (target_brightness - start_brightness) / steps
             
-            for i in range(steps + 1):
-                current = start_brightness + (step_size * i)
-                self._set_brightness_direct(current)
-                time.sleep(self.settings.fade_duration / steps)
+            # pigpio利用時はDMA波形でフェード（Pythonのスリープ精度に依存しない）
+            if self.pi is not None:
+                await self._awave_fade(start_brightness, target_brightness)
+                self._set_brightness_direct(target_brightness)
+                return
+            
+            schedule = self._fade_schedule(start_brightness, target_brightness,
+                                           self._fade_steps)
+            await self._play_schedule(schedule, self._fade_dt)
             
             # 最終値を確実に設定
             self._set_brightness_direct(target_brightness)
             
         except Exception as e:
             self.logger.error(f"Fade operation failed: {e}")
+            # 波形出力用にPWMを止めたままにしないよう目標明度を直接設定
+            try:
+                self._set_brightness_direct(target_brightness)
+            except Exception as restore_error:
+                self.logger.error(
+                    f"Failed to restore brightness after fade: {restore_error}")
+    
+    @staticmethod
+    def _fade_schedule(start_brightness: float, target_brightness: float,
+                       steps: int) -> np.ndarray:
+        """
+        フェード明度列の作成（知覚明度で等間隔、_GAMMA_LUTで明度に変換）
+        
+        Args:
+            start_brightness: 開始明度
+            target_brightness: 目標明度
+            steps: 段階数
+            
+        Returns:
+            np.ndarray: steps + 1 個の明度列（float32）
+        """
+        start_idx, target_idx = np.rint(
+            np.power((start_brightness, target_brightness), 1.0 / FADE_GAMMA) * 255.0)
+        indices = np.rint(np.linspace(start_idx, target_idx, steps + 1)).astype(np.intp)
+        return _GAMMA_LUT[indices]
+    
+    async def _play_schedule(self, schedule: np.ndarray, interval: float) -> None:
+        """
+        明度スケジュールを一定間隔で出力
+        
+        各ステップの出力時刻を開始時刻からの絶対時刻で管理し、
+        処理時間やスリープの誤差がステップ毎に累積しないようにする。
+        
+        Args:
+            schedule: 明度列
+            interval: ステップ間隔（秒）
+        """
+        step_ns = int(interval * _NS)
+        deadline_ns = time.perf_counter_ns()
+        for brightness in schedule.tolist():
+            deadline_ns += step_ns
+            self._set_brightness_direct(brightness)
+            await asyncio.sleep(max(0, deadline_ns - time.perf_counter_ns()) / _NS)
+    
+    async def _awave_fade(self, start_brightness: float, target_brightness: float) -> None:
+        """
+        pigpio波形によるフェード出力
+        
+        フェードを最大 WAVE_FADE_MAX_STEPS 段階（知覚明度で等間隔）に分け、
+        各段階のデューティ比のPWM 1周期分を波形として作成し、wave_chainで
+        各波形を段階の長さ分だけ繰り返し送出する（DMAで時間制御）。
+        
+        Args:
+            start_brightness: 開始明度
+            target_brightness: 目標明度
+        """
+        frequency = self.status.pwm_frequency or self.settings.pwm_frequency
+        period_us = 1_000_000 // frequency
+        steps = min(self._fade_steps, WAVE_FADE_MAX_STEPS)
+        repeats = min(max(1, round(self.settings.fade_duration / steps * frequency)),
+                      0xFFFF)
+        
+        self._release_pin_for_wave()
+        
+        schedule = self._fade_schedule(start_brightness, target_brightness, steps)
+        on_times = (schedule[1:] * period_us).astype(np.int64).tolist()
+        
+        wave_ids = []
+        chain = []
+        try:
+            for on_us in on_times:
+                wave_id = self._create_period_wave(on_us, period_us)
+                wave_ids.append(wave_id)
+                # ループ開始, 波形, ループ終了(repeats回)
+                chain += [255, 0, wave_id, 255, 1, repeats & 0xFF, repeats >> 8]
+            
+            await self._send_wave_chain(chain)
+        finally:
+            for wave_id in wave_ids:
+                self.pi.wave_delete(wave_id)
+    
+    def _create_period_wave(self, on_us: int, period_us: int) -> int:
+        """
+        1周期分（on_us点灯 + 残り消灯）のpigpio波形作成
+        
+        Args:
+            on_us: 点灯時間（µs）
+            period_us: 周期（µs）
+            
+        Returns:
+            int: 波形ID
+        """
+        mask = 1 << self.settings.pin
+        pulses = []
+        if on_us > 0:
+            pulses.append(pigpio.pulse(mask, 0, on_us))
+        if on_us < period_us:
+            pulses.append(pigpio.pulse(0, mask, period_us - on_us))
+        self.pi.wave_add_generic(pulses)
+        return self.pi.wave_create()
+    
+    async def _send_wave_chain(self, chain: List[int]) -> None:
+        """波形チェーンを送出し完了まで待機（キャンセル時は送出停止）"""
+        self.pi.wave_chain(chain)
+        try:
+            while self.pi.wave_tx_busy():
+                await asyncio.sleep(0.01)
+        except asyncio.CancelledError:
+            self.pi.wave_tx_stop()
+            raise
+    
+    def _release_pin_for_wave(self) -> None:
+        """PWM出力を止めて波形出力に切り替え（次の明度設定でPWMに復帰）"""
+        self._pigpio_pwm.release()
+        self._pwm_released = self._hardware_pwm  # 停止中はレジスタ直接書き込みを行わない
+        self.pi.wave_clear()
     
     def turn_on(self, brightness: Optional[float] = None, fade: bool = True) -> bool:
         """
@@ -308,6 +721,9 @@ class LEDController:
         """
         パルス点灯（呼吸効果）
         
+        pigpio利用時は1周期分の波形を繰り返し送出し、即座に戻る（stop_pulseで停止）。
+        それ以外は1周期分をブロッキングで出力する。
+        
         Args:
             duration: パルス周期（秒）
             min_brightness: 最小明度
@@ -317,24 +733,75 @@ class LEDController:
             return
         
         try:
-            steps = int(duration * 20)  # 20 FPS
-            half_steps = steps // 2
-            
-            # フェードイン
-            for i in range(half_steps):
-                brightness = min_brightness + (max_brightness - min_brightness) * (i / half_steps)
-                self._set_brightness_direct(brightness)
-                time.sleep(duration / steps)
-            
-            # フェードアウト
-            for i in range(half_steps):
-                brightness = max_brightness - (max_brightness - min_brightness) * (i / half_steps)
-                self._set_brightness_direct(brightness)
-                time.sleep(duration / steps)
-            
+            self._run_effect_sync(self._apulse(duration, min_brightness, max_brightness))
         except Exception as e:
             self.logger.error(f"Pulse operation failed: {e}")
     
+    async def _apulse(self, duration: float, min_brightness: float,
+                      max_brightness: float) -> None:
+        """パルス点灯効果"""
+        if self.pi is not None:
+            self.stop_pulse()
+            pulses = self._build_breathing_wave(min_brightness, max_brightness, duration)
+            self._release_pin_for_wave()
+            self.pi.wave_add_generic(pulses)
+            self._pulse_wave_id = self.pi.wave_create()
+            self.pi.wave_send_repeat(self._pulse_wave_id)
+            return
+        
+        steps = max(2, int(duration * 20))  # 20 FPS
+        half_steps = steps // 2
+        
+        # フェードイン → フェードアウト（余弦カーブ）
+        schedule = _pulse_schedule(float(min_brightness), float(max_brightness), half_steps)
+        await self._play_schedule(schedule, duration / steps)
+    
+    def stop_pulse(self) -> None:
+        """呼吸波形の繰り返し送出を停止"""
+        if self._pulse_wave_id is None or self.pi is None:
+            return
+        
+        self.pi.wave_tx_stop()
+        self.pi.wave_delete(self._pulse_wave_id)
+        self._pulse_wave_id = None
+        # 波形停止後はソフトウェアPWMで直前の明度を維持
+        self._set_brightness_direct(self.status.current_brightness)
+    
+    def _build_breathing_wave(self, min_brightness: float, max_brightness: float,
+                              duration: float) -> List[Any]:
+        """
+        呼吸効果1周期分のpigpioパルス列作成
+        
+        PWM 1周期毎のデューティ比を余弦カーブ（最小→最大→最小）で求める。
+        パルス数が波形の上限を超える場合はPWM周期を延ばして収める。
+        
+        Args:
+            min_brightness: 最小明度
+            max_brightness: 最大明度
+            duration: パルス周期（秒）
+            
+        Returns:
+            List[Any]: pigpio.pulseのリスト
+        """
+        mask = 1 << self.settings.pin
+        frequency = self.status.pwm_frequency or self.settings.pwm_frequency
+        periods = max(200, min(int(duration * frequency),
+                               self.pi.wave_get_max_pulses() // 2))
+        period_us = max(2, int(duration * 1_000_000 / periods))
+        
+        phase = np.linspace(0.0, 2.0 * np.pi, periods, endpoint=False)
+        levels = (min_brightness
+                  + (max_brightness - min_brightness) * (1.0 - np.cos(phase)) / 2.0)
+        on_times = np.rint(levels * period_us).astype(np.int64).tolist()
+        
+        pulses = []
+        for on_us in on_times:
+            if on_us > 0:
+                pulses.append(pigpio.pulse(mask, 0, on_us))
+            if on_us < period_us:
+                pulses.append(pigpio.pulse(0, mask, period_us - on_us))
+        return pulses
+    
     def blink(self, count: int = 3, on_time: float = 0.5, off_time: float = 0.5) -> None:
         """
         点滅
@@ -347,65 +814,141 @@ class LEDController:
         if not self.status.is_initialized:
             return
         
-        original_brightness = self.status.current_brightness
-        
         try:
-            for _ in range(count):
-                self.turn_on(fade=False)
-                time.sleep(on_time)
-                self.turn_off(fade=False)
-                time.sleep(off_time)
-            
-            # 元の明度に復帰
-            self.set_brightness(original_brightness, fade=False)
-            
+            self._run_effect_sync(self._ablink(count, on_time, off_time))
         except Exception as e:
             self.logger.error(f"Blink operation failed: {e}")
     
-    def _check_thermal_protection(self, target_brightness: float) -> bool:
+    async def _ablink(self, count: int, on_time: float, off_time: float) -> None:
+        """点滅効果"""
+        original_brightness = self.status.current_brightness
+        
+        if self.pi is not None:
+            await self._awave_blink(count, on_time, off_time)
+            self.set_brightness(original_brightness, fade=False)
+            return
+        
+        for _ in range(count):
+            self.turn_on(fade=False)
+            await asyncio.sleep(on_time)
+            self.turn_off(fade=False)
+            await asyncio.sleep(off_time)
+        
+        # 元の明度に復帰
+        self.set_brightness(original_brightness, fade=False)
+    
+    async def _awave_blink(self, count: int, on_time: float, off_time: float) -> None:
         """
-        熱保護チェック
+        pigpio波形による点滅出力
+        
+        点灯区間はデフォルト明度のPWM 1周期分の波形の繰り返し、消灯区間は
+        1パルスの波形とし、点滅回数分のループをwave_chainでまとめて送出する。
         
         Args:
-            target_brightness: 目標明度
-            
-        Returns:
-            bool: 保護動作が必要かどうか
+            count: 点滅回数
+            on_time: 点灯時間（秒）
+            off_time: 消灯時間（秒）
         """
-        if not self.settings.thermal_protection:
-            return False
+        self.stop_pulse()
         
+        frequency = self.status.pwm_frequency or self.settings.pwm_frequency
+        period_us = 1_000_000 // frequency
+        brightness = min(self._max_b, max(self._min_b, self.settings.default_brightness))
+        on_periods = max(1, round(on_time * frequency))
+        off_us = max(1, int(off_time * 1_000_000))
+        
+        self._release_pin_for_wave()
+        
+        wave_ids = []
         try:
-            # 温度取得（簡易実装）
-            # 実際のシステムでは温度センサーからの値を使用
-            temp = self._get_led_temperature()
-            self.status.temperature = temp
-            
-            if temp > self.settings.max_temperature:
-                self.status.thermal_protection_active = True
-                return True
+            on_wave = self._create_period_wave(int(period_us * brightness), period_us)
+            wave_ids.append(on_wave)
+            self.pi.wave_add_generic([pigpio.pulse(0, 1 << self.settings.pin, off_us)])
+            off_wave = self.pi.wave_create()
+            wave_ids.append(off_wave)
             
-            self.status.thermal_protection_active = False
-            return False
+            # (点灯波形 × on_periods, 消灯波形) × count
+            chain = [255, 0,
+                     255, 0, on_wave, 255, 1, on_periods & 0xFF, on_periods >> 8,
+                     off_wave,
+                     255, 1, count & 0xFF, count >> 8]
+            await self._send_wave_chain(chain)
+        finally:
+            for wave_id in wave_ids:
+                self.pi.wave_delete(wave_id)
+    
+    def _start_temp_polling(self) -> None:
+        """熱保護用温度の定期更新開始（熱保護有効時のみ、開始済みなら何もしない）"""
+        if not self._thermal_protection:
+            return
+        if self._temp_thread is not None and self._temp_thread.is_alive():
+            return
+        self._temp_stop.clear()
+        self._temp_thread = threading.Thread(target=self._poll_temperature,
+                                             name="led-temp-poll", daemon=True)
+        self._temp_thread.start()
+    
+    def _stop_temp_polling(self) -> None:
+        """熱保護用温度の定期更新停止（更新スレッドの終了まで待機）"""
+        self._temp_stop.set()
+        if self._temp_thread is not None:
+            self._temp_thread.join(timeout=2.0)
+            self._temp_thread = None
+    
+    def _poll_temperature(self) -> None:
+        """
+        熱保護用温度の更新ループ（TEMP_POLL_INTERVAL 毎、更新スレッドで実行）
+        
+        set_brightnessはここで更新した値との比較のみを行い、
+        明度変更毎に温度取得処理を呼び出さない。
+        熱保護が無効化されるか停止要求があると終了する。
+        """
+        while self._thermal_protection:
+            try:
+                # 温度取得（センサー値、無い環境では推定値）
+                temp = self._get_led_temperature()
+                with self._lock:
+                    self._temp_cached = temp
+                    self.status.temperature = temp
+                    self.status.thermal_protection_active = (
+                        self._thermal_protection and temp > self._max_temperature)
+            except Exception as e:
+                self.logger.error(f"Thermal protection check failed: {e}")
             
-        except Exception as e:
-            self.logger.error(f"Thermal protection check failed: {e}")
-            return False
+            if self._temp_stop.wait(TEMP_POLL_INTERVAL):
+                break
     
     def _get_led_temperature(self) -> float:
         """
-        LED温度取得（プレースホルダー）
+        LED温度取得（_TEMP_CACHE_TTL_NS の間はキャッシュを返す）
+        
+        温度センサー（thermal_zone0）の値を使用し、センサーが無い環境では
+        使用率に基づく簡易推定値を返す。
         
         Returns:
-            float: 推定温度（℃）
+            float: 温度（℃）
         """
-        # 実際の実装では温度センサーまたは推定アルゴリズムを使用
-        # 現在は使用率に基づく簡易推定
-        base_temp = 25.0  # 室温
-        brightness_factor = self.status.current_brightness * 30.0  # 明度による発熱
-        time_factor = min(10.0, self.status.total_on_time / 60.0)  # 時間による蓄熱
+        now_ns = time.perf_counter_ns()
+        cached_ns, cached_temp = self._temp_cache
+        if now_ns - cached_ns < _TEMP_CACHE_TTL_NS:
+            return cached_temp
+        
+        if self._temp_fd is not None:
+            temp = int(os.pread(self._temp_fd, 16, 0)) / 1000.0
+        else:
+            # 使用率に基づく簡易推定
+            base_temp = 25.0  # 室温
+            brightness_factor = self.status.current_brightness * 30.0  # 明度による発熱
+            time_factor = min(10.0, self.total_on_time / 60.0)  # 時間による蓄熱
+            temp = base_temp + brightness_factor + time_factor
         
-        return base_temp + brightness_factor + time_factor
+        self._temp_cache = (now_ns, temp)
+        return temp
+    
+    @property
+    def total_on_time(self) -> float:
+        """累積点灯時間（秒）"""
+        return self._total_on_ns / _NS
     
     def get_status(self) -> LEDStatus:
         """
@@ -414,15 +957,8 @@ class LEDController:
         Returns:
             LEDStatus: 現在の状態
         """
-        # 点灯時間更新
-        if self.status.is_on and self.start_time is not None:
-            current_session = time.time() - self.start_time
-        else:
-            current_session = 0.0
-        
-        # 温度更新
-        if self.settings.thermal_protection:
-            self.status.temperature = self._get_led_temperature()
+        # 点灯時間更新（温度はバックグラウンドで更新済み）
+        self.status.total_on_time = self.total_on_time
         
         return self.status
     
@@ -431,10 +967,14 @@ class LEDController:
         詳細状態情報取得
         
         Returns:
-            Dict[str, Any]: 詳細状態情報
+            Dict[str, Any]: 詳細状態情報（呼び出し毎に新しい辞書）
         """
         status = self.get_status()
         
+        control_method = ("HAT" if self.hat_controller
+                          else "pigpio-hardware" if self._hardware_pwm
+                          else "pigpio" if self.pi is not None
+                          else "GPIO")
         return {
             "led_status": {
                 "available": status.is_available,
@@ -447,18 +987,8 @@ class LEDController:
                 "error_count": status.error_count,
                 "thermal_protection_active": status.thermal_protection_active
             },
-            "settings": {
-                "pin": self.settings.pin,
-                "pwm_frequency": self.settings.pwm_frequency,
-                "max_brightness": self.settings.max_brightness,
-                "thermal_protection": self.settings.thermal_protection,
-                "max_temperature": self.settings.max_temperature
-            },
-            "system_info": {
-                "gpio_available": GPIO_AVAILABLE,
-                "hat_available": HAT_AVAILABLE,
-                "control_method": "HAT" if self.hat_controller else "GPIO"
-            }
+            "settings": dict(self._settings_dict),
+            "system_info": dict(_SYSTEM_INFO[control_method])
         }
     
     def test_led(self) -> bool:
@@ -509,36 +1039,67 @@ class LEDController:
     def cleanup(self) -> None:
         """リソース解放"""
         try:
-            # LED消灯
+            # 点灯効果停止（消灯後にフェードが明度を上書きしないよう先に停止）
+            with self._loop_lock:
+                loop, loop_thread = self._loop, self._loop_thread
+                self._loop = self._loop_thread = None
+            if loop is not None:
+                asyncio.run_coroutine_threadsafe(self._cancel_effect(),
+                                                 loop).result(timeout=2.0)
+                loop.call_soon_threadsafe(loop.stop)
+                loop_thread.join(timeout=2.0)
+                loop.close()
+            
+            # 呼吸波形停止・LED消灯
+            self.stop_pulse()
             if self.status.is_initialized:
                 self.turn_off(fade=False)
                 time.sleep(0.1)
             
-            # フェードスレッド停止
-            if self.fade_thread is not None and self.fade_thread.is_alive():
-                self.fade_thread.join(timeout=1.0)
-            
-            # PWM停止
-            if self.pwm is not None:
-                self.pwm.stop()
+            with self._lock:
+                # PWM停止
+                if self._pwm_started:
+                    self.pwm.stop()
+                    self._pwm_started = False
                 self.pwm = None
-            
-            # GPIO クリーンアップ
-            if GPIO_AVAILABLE:
-                try:
+                
+                # pigpio接続解放 / GPIO クリーンアップ
+                if self._pwm_regs is not None:
+                    self._pwm_regs.close()
+                    self._pwm_regs = None
+                if self._fast_pwm is not None:
+                    self._fast_pwm.close()
+                    self._fast_pwm = None
+                if self._pigpio_pwm is not None:
+                    self.pi.wave_tx_stop()
+                    self._pigpio_pwm.close()
+                    self._pigpio_pwm = None
+                    self.pi = None
+                    self._hardware_pwm = False
+                elif self._gpio_setup_done:
                     GPIO.cleanup(self.settings.pin)
-                except:
-                    pass  # GPIO cleanup errors are not critical
+                    self._gpio_setup_done = False
             
             # HAT クリーンアップ
             if self.hat_controller is not None:
                 # self.hat_controller.cleanup()
                 self.hat_controller = None
             
+            # 温度更新停止・温度読み取り用ディスクリプタを閉じる
+            self._stop_temp_polling()
+            if self._temp_fd is not None:
+                try:
+                    os.close(self._temp_fd)
+                except OSError as e:
+                    self.logger.error(f"Thermal fd close failed: {e}")
+                self._temp_fd = None
+            
             # 統計更新
-            if self.start_time is not None:
-                self.status.total_on_time += time.time() - self.start_time
-                self.start_time = None
+            with self._lock:
+                if self._start_ns is not None:
+                    self._total_on_ns += time.perf_counter_ns() - self._start_ns
+                    self._start_ns = None
+            self.status.total_on_time = self.total_on_time
             
             self.status.is_initialized = False
             self.status.is_on = False
@@ -0,0 +1,71 @@
+# cython: language_level=3
+# distutils: libraries = pigpiod_if2
+"""
+LED PWM出力カーネル（Cython実装）
+
+led_controller のデューティ比書き込みを pigpiod_if2 のC APIで直接行う。
+pigpiodへの専用接続を保持し、GILを解放して書き込むため、フェード中も
+監視スレッド等が停止しない。pigpio利用環境向けの任意ビルド:
+
+    cythonize -i led_controller_cy.pyx
+"""
+
+
+cdef extern from "pigpiod_if2.h" nogil:
+    int pigpio_start(const char *addrStr, const char *portStr)
+    void pigpio_stop(int pi)
+    int set_PWM_dutycycle(int pi, unsigned user_gpio, unsigned dutycycle)
+    int hardware_PWM(int pi, unsigned gpio, unsigned PWMfreq, unsigned PWMduty)
+
+
+cdef class FastPWM:
+    """pigpiodへのデューティ比書き込み（明度 0.0-1.0 を指定）"""
+
+    cdef int handle
+    cdef unsigned gpio
+    cdef unsigned pwm_range
+    cdef unsigned frequency
+    cdef bint hardware
+
+    def __cinit__(self):
+        self.handle = -1
+
+    def __init__(self, unsigned gpio, unsigned pwm_range, unsigned frequency,
+                 bint hardware):
+        """
+        Args:
+            gpio: 出力ピン（BCM番号）
+            pwm_range: DMA PWMのデューティ比分解能（set_PWM_rangeの設定値）
+            frequency: ハードウェアPWM周波数（Hz）
+            hardware: ハードウェアPWMで出力するか
+        """
+        self.gpio = gpio
+        self.pwm_range = pwm_range
+        self.frequency = frequency
+        self.hardware = hardware
+        self.handle = pigpio_start(NULL, NULL)
+        if self.handle < 0:
+            raise RuntimeError(f"pigpio_start failed: {self.handle}")
+
+    cpdef void set_duty(self, double brightness):
+        """デューティ比書き込み（GIL解放中に実行）"""
+        cdef int result
+        with nogil:
+            if self.hardware:
+                result = hardware_PWM(self.handle, self.gpio, self.frequency,
+                                      <unsigned>(brightness * 1000000))
+            else:
+                result = set_PWM_dutycycle(self.handle, self.gpio,
+                                           <unsigned>(brightness * self.pwm_range))
+        if result < 0:
+            raise RuntimeError(f"PWM write failed: {result}")
+
+    def close(self):
+        """pigpiod接続解放"""
+        if self.handle >= 0:
+            pigpio_stop(self.handle)
+            self.handle = -1
+
+    def __dealloc__(self):
+        if self.handle >= 0:
+            pigpio_stop(self.handle)
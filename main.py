@@ -9,39 +9,118 @@
 - システム状態監視
 """
 
+import _thread
+import ctypes
 import logging
+import logging.handlers
+import os
+import queue
+import select
+import struct
 import time
 import signal
 import sys
 import threading
-from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, Any, Optional, TYPE_CHECKING
+from dataclasses import dataclass, asdict, is_dataclass
 from pathlib import Path
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 import argparse
+import atexit
+import collections
 import json
+import random
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # プロジェクト内モジュール
+# torch/OpenCV/matplotlib等を読み込むモジュールは使用箇所で遅延importする
+# （分析モード等で不要なモジュールの読み込み時間・メモリを省く）
 from config.config_manager import ConfigManager
-from hardware_controller import HardwareController
-from insect_detector import InsectDetector, DetectionSettings
-from detection_processor import DetectionProcessor, ProcessingSettings
-from activity_calculator import ActivityCalculator, CalculationSettings
-from data_processor import DataProcessor, ProcessingSettings as DataProcessingSettings
-from visualization import Visualizer, VisualizationSettings
-from model_manager import ModelManager
-from system_controller import SystemController
 from scheduler import SchedulerManager
 from error_handler import ErrorHandler, ErrorSeverity, ErrorCategory, ErrorContext, error_handler_decorator
 from monitoring import SystemMonitor
 
+if TYPE_CHECKING:
+    from hardware_controller import HardwareController, HardwareStatus
+    from insect_detector import InsectDetector
+    from detection_processor import DetectionProcessor
+    from activity_calculator import ActivityCalculator
+    from data_processor import DataProcessor
+    from visualization import Visualizer
+    from model_manager import ModelManager
+    from system_controller import SystemController
+
+# inotify（設定ファイル更新の検知）
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+_INOTIFY_EVENT = struct.Struct("iIII")  # wd, mask, cookie, len（後続にname）
+
+# 終了要求シグナル（専用スレッドでsigwaitにより受信）
+_SHUTDOWN_SIGNALS = {signal.SIGINT, signal.SIGTERM}
+
+# ログファイルの保持日数（日次ローテーション）
+LOG_BACKUP_DAYS = 14
+
+# 検出周期毎にログを出力するモジュールのロガー
+_HIGH_RATE_LOGGERS = ("insect_detector", "detection_processor", "hardware_controller")
+
+# setup_logging で開始したログ書き込みスレッド
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+# 設定再読み込み時に差分を確認するセクション
+_CONFIG_SECTIONS = ("system", "hardware", "detection", "paths")
+
+# メインループのヘルスチェック間隔（秒）
+HEALTH_CHECK_INTERVAL = 10.0
+
+# システム監視（温度・モジュール状態）の間隔（秒）
+MONITORING_INTERVAL = 30.0
+
+# メインループのエラー復旧（指数バックオフ）
+ERROR_WINDOW_SIZE = 32          # 保持するエラー発生時刻の数
+ERROR_BACKOFF_WINDOW = 60.0     # バックオフ算出に数える直近期間（秒）
+ERROR_BACKOFF_BASE = 0.5        # 初回待機時間（秒）
+ERROR_BACKOFF_MAX = 60.0        # 最大待機時間（秒）
+ERROR_MAX_CONSECUTIVE = 10      # 正常な周期を挟まずにこの回数連続で失敗したら停止
+
 
-@dataclass
+class _ShutdownEvent(threading.Event):
+    """
+    select() で待機できる終了イベント
+    
+    set() 時にパイプへ書き込むため、設定ファイル監視（inotify）等の
+    ディスクリプタと同時に待機できる。
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._read_fd, self._write_fd = os.pipe()
+        os.set_blocking(self._write_fd, False)
+    
+    def fileno(self) -> int:
+        return self._read_fd
+    
+    def set(self) -> None:
+        super().set()
+        try:
+            os.write(self._write_fd, b'\0')
+        except BlockingIOError:
+            pass  # 通知済み（パイプに未読データあり）
+
+
+@dataclass(slots=True)
 class SystemStatus:
     """システム状態情報"""
     is_running: bool = False
     start_time: str = ""
-    uptime_seconds: float = 0.0
     total_detections: int = 0
     total_images_processed: int = 0
     last_detection_time: str = ""
@@ -71,40 +150,59 @@ class InsectObserverSystem:
             config_path: 設定ファイルパス
         """
         self.logger = logging.getLogger(__name__ + '.InsectObserverSystem')
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)  # 検出周期毎のデバッグログ
         
-        # 設定管理
-        self.config_manager = ConfigManager(config_path)
-        self.config = self.config_manager.load_config()
-        
-        # システム状態
-        self.status = SystemStatus()
-        self.shutdown_requested = False
-        
-        # エラーハンドリング・監視機能
-        error_config = self.config.system.get('error_handling', {})
-        self.error_handler = ErrorHandler(error_config)
-        
-        monitoring_config = self.config.system.get('monitoring', {})
-        self.system_monitor = SystemMonitor(monitoring_config)
-        
-        # 各モジュール
-        self.hardware_controller: Optional[HardwareController] = None
-        self.model_manager: Optional[ModelManager] = None
-        self.detector: Optional[InsectDetector] = None
-        self.detection_processor: Optional[DetectionProcessor] = None
-        self.activity_calculator: Optional[ActivityCalculator] = None
-        self.data_processor: Optional[DataProcessor] = None
-        self.visualizer: Optional[Visualizer] = None
-        self.system_controller: Optional[SystemController] = None
-        self.scheduler: Optional[SchedulerManager] = None
-        
-        # スレッド管理
-        self.main_thread: Optional[threading.Thread] = None
-        self.monitoring_thread: Optional[threading.Thread] = None
-        
-        # シグナルハンドラ設定
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGTERM, self._signal_handler)
+        # 終了シグナルをブロック（以降に生成されるスレッドにも継承され、
+        # シグナル待機スレッドのみが受信する）
+        old_sigmask = signal.pthread_sigmask(signal.SIG_BLOCK, _SHUTDOWN_SIGNALS)
+        try:
+            # 設定管理
+            self.config_manager = ConfigManager(config_path)
+            self.config = self.config_manager.load_config()
+            
+            # システム状態
+            self.status = SystemStatus()
+            self._start_monotonic: Optional[float] = None
+            self._shutdown_event = _ShutdownEvent()
+            self._main_loop_started = False  # 開始後の終了シグナルはイベントのみで通知
+            self._error_window: collections.deque = collections.deque(
+                maxlen=ERROR_WINDOW_SIZE)
+            self._consecutive_errors = 0  # 正常な周期で0に戻す
+            
+            # エラーハンドリング・監視機能
+            error_config = self.config.system.get('error_handling', {})
+            self.error_handler = ErrorHandler(error_config)
+            
+            monitoring_config = self.config.system.get('monitoring', {})
+            self.system_monitor = SystemMonitor(monitoring_config)
+            
+            # 各モジュール
+            self.hardware_controller: Optional["HardwareController"] = None
+            self.model_manager: Optional["ModelManager"] = None
+            self.detector: Optional["InsectDetector"] = None
+            self.detection_processor: Optional["DetectionProcessor"] = None
+            self.activity_calculator: Optional["ActivityCalculator"] = None
+            self.data_processor: Optional["DataProcessor"] = None
+            self.visualizer: Optional["Visualizer"] = None
+            self.system_controller: Optional["SystemController"] = None
+            self.scheduler: Optional[SchedulerManager] = None
+            
+            # スレッド管理
+            self.main_thread: Optional[threading.Thread] = None
+            
+            # 設定ファイル更新監視（変更時のみイベントが届くためstatのポーリング不要）
+            self._config_path = Path(self.config_manager.config_path)
+            self._config_name = os.fsencode(self._config_path.name)
+            self._config_watch_fd = self._open_config_watch()
+            
+            # シグナル待機スレッド
+            self._signal_thread = threading.Thread(target=self._sigwait_loop,
+                                                   name="signal-wait", daemon=True)
+            self._signal_thread.start()
+        except BaseException:
+            # 初期化失敗時は受信者がいないためブロックを解除
+            signal.pthread_sigmask(signal.SIG_SETMASK, old_sigmask)
+            raise
         
         self.logger.info("Insect Observer System initialized")
     
@@ -123,39 +221,35 @@ class InsectObserverSystem:
         try:
             self.logger.info("Starting system initialization...")
             
+            from insect_detector import InsectDetector, DetectionSettings
+            from system_controller import SystemController
+            
             # 監視開始
             self.system_monitor.start_monitoring()
             
-            # 1. モデル管理器初期化
-            self.model_manager = ModelManager(
-                model_dir=self.config.paths.weights_dir,
-                config_manager=self.config_manager
-            )
+            # 1-2, 4-7. 相互に依存しないモジュールを並列に初期化
+            # （カメラ・モデルファイル等の待ち時間を重ねる）
+            with ThreadPoolExecutor(
+                max_workers=4, thread_name_prefix="init"
+            ) as executor:
+                model_future = executor.submit(self._initialize_model_manager)
+                hardware_future = executor.submit(self._initialize_hardware)
+                processor_future = executor.submit(self._initialize_detection_processor)
+                analysis_future = executor.submit(self._initialize_analysis_modules)
+                
+                model_ready = model_future.result()
+                hardware_ready = hardware_future.result()
+                processor_future.result()
+                analysis_future.result()
             
-            # モデル自動セットアップ
-            if not self.model_manager.auto_setup():
+            if not model_ready:
                 self.logger.error("Model setup failed")
                 return False
-            
-            # 2. ハードウェア制御器初期化
-            hardware_config = {
-                'camera': {
-                    'resolution': self.config.hardware.camera.resolution,
-                    'exposure_time': self.config.hardware.camera.exposure_time,
-                    'analogue_gain': self.config.hardware.camera.analogue_gain
-                },
-                'led': {
-                    'led_pin': self.config.hardware.ir_led.pin,
-                    'brightness': self.config.hardware.ir_led.brightness
-                }
-            }
-            
-            self.hardware_controller = HardwareController(hardware_config)
-            if not self.hardware_controller.initialize_hardware():
+            if not hardware_ready:
                 self.logger.error("Hardware initialization failed")
                 return False
             
-            # 3. 検出器初期化
+            # 3. 検出器初期化（モデル・ハードウェアの準備完了後）
             detection_settings = DetectionSettings(
                 model_path=self.model_manager.get_model_path(),
                 confidence_threshold=self.config.detection.confidence_threshold,
@@ -172,48 +266,6 @@ class InsectObserverSystem:
                 self.logger.error("Detector initialization failed")
                 return False
             
-            # 4. データ処理モジュール初期化
-            processing_settings = ProcessingSettings(
-                min_confidence=self.config.detection.confidence_threshold,
-                enable_duplicate_filter=True,
-                save_filtered_data=True
-            )
-            
-            self.detection_processor = DetectionProcessor(
-                settings=processing_settings,
-                output_dir=self.config.paths.log_dir
-            )
-            
-            # 5. 活動量算出器初期化
-            calculation_settings = CalculationSettings(
-                movement_threshold=self.config.analysis.movement_threshold,
-                time_window_minutes=self.config.analysis.time_window // 60,
-                outlier_threshold=self.config.analysis.outlier_threshold
-            )
-            
-            self.activity_calculator = ActivityCalculator(
-                settings=calculation_settings,
-                data_dir=self.config.paths.log_dir
-            )
-            
-            # 6. データ処理器初期化
-            data_processing_settings = DataProcessingSettings(
-                outlier_detection_method="zscore",
-                apply_smoothing=True,
-                feature_scaling=True
-            )
-            
-            self.data_processor = DataProcessor(data_processing_settings)
-            
-            # 7. 可視化器初期化
-            viz_settings = VisualizationSettings(
-                output_dir=self.config.paths.output_dir,
-                output_format="png",
-                interactive_mode=True
-            )
-            
-            self.visualizer = Visualizer(viz_settings)
-            
             # 8. システム制御器初期化
             self.system_controller = SystemController(
                 config=self.config,
@@ -227,7 +279,8 @@ class InsectObserverSystem:
             # 9. スケジューラー初期化
             self.scheduler = SchedulerManager(
                 detection_interval=self.config.system.detection_interval,
-                analysis_time=self.config.system.daily_analysis_time
+                analysis_time=self.config.system.daily_analysis_time,
+                shutdown_event=self._shutdown_event
             )
             
             # スケジュール設定
@@ -236,6 +289,7 @@ class InsectObserverSystem:
             
             # システム状態更新
             self.status.start_time = datetime.now().isoformat()
+            self._start_monotonic = time.monotonic()
             
             self.logger.info("System initialization completed successfully")
             return True
@@ -250,45 +304,135 @@ class InsectObserverSystem:
             self.logger.error(f"System initialization failed: {e}")
             return False
     
+    def _initialize_model_manager(self) -> bool:
+        """モデル管理器初期化・モデル自動セットアップ"""
+        from model_manager import ModelManager
+        
+        self.model_manager = ModelManager(
+            model_dir=self.config.paths.weights_dir,
+            config_manager=self.config_manager
+        )
+        return self.model_manager.auto_setup()
+    
+    def _initialize_hardware(self) -> bool:
+        """ハードウェア制御器初期化"""
+        from hardware_controller import HardwareController
+        
+        hardware_config = {
+            'camera': {
+                'resolution': self.config.hardware.camera.resolution,
+                'exposure_time': self.config.hardware.camera.exposure_time,
+                'analogue_gain': self.config.hardware.camera.analogue_gain
+            },
+            'led': {
+                'led_pin': self.config.hardware.ir_led.pin,
+                'brightness': self.config.hardware.ir_led.brightness
+            }
+        }
+        
+        self.hardware_controller = HardwareController(hardware_config)
+        return self.hardware_controller.initialize_hardware()
+    
+    def _initialize_detection_processor(self) -> None:
+        """検出結果処理器初期化"""
+        from detection_processor import DetectionProcessor, ProcessingSettings
+        
+        processing_settings = ProcessingSettings(
+            min_confidence=self.config.detection.confidence_threshold,
+            enable_duplicate_filter=True,
+            save_filtered_data=True
+        )
+        
+        self.detection_processor = DetectionProcessor(
+            settings=processing_settings,
+            output_dir=self.config.paths.log_dir
+        )
+    
+    def _initialize_analysis_modules(self) -> None:
+        """分析用モジュール（活動量算出器・データ処理器・可視化器）初期化"""
+        from activity_calculator import ActivityCalculator, CalculationSettings
+        from data_processor import DataProcessor, ProcessingSettings as DataProcessingSettings
+        from visualization import Visualizer, VisualizationSettings
+        
+        # 活動量算出器初期化
+        calculation_settings = CalculationSettings(
+            movement_threshold=self.config.analysis.movement_threshold,
+            time_window_minutes=self.config.analysis.time_window // 60,
+            outlier_threshold=self.config.analysis.outlier_threshold
+        )
+        
+        self.activity_calculator = ActivityCalculator(
+            settings=calculation_settings,
+            data_dir=self.config.paths.log_dir
+        )
+        
+        # データ処理器初期化
+        data_processing_settings = DataProcessingSettings(
+            outlier_detection_method="zscore",
+            apply_smoothing=True,
+            feature_scaling=True
+        )
+        
+        self.data_processor = DataProcessor(data_processing_settings)
+        
+        # 可視化器初期化
+        viz_settings = VisualizationSettings(
+            output_dir=self.config.paths.output_dir,
+            output_format="png",
+            interactive_mode=True
+        )
+        
+        self.visualizer = Visualizer(viz_settings)
+    
     def run_main_loop(self) -> None:
         """メインループ実行"""
         try:
             self.logger.info("Starting main system loop...")
+            self._main_loop_started = True
             self.status.is_running = True
             self.status.current_mode = "detecting"
             
-            # 監視スレッド開始
-            self.monitoring_thread = threading.Thread(
-                target=self._system_monitoring_loop,
-                daemon=True
-            )
-            self.monitoring_thread.start()
-            
             # スケジューラー開始
             if self.scheduler:
                 self.scheduler.start()
             
-            # メインループ
-            while not self.shutdown_requested:
+            # メインループ（次のヘルスチェック・システム監視まで待機し、
+            # 設定ファイル更新・終了要求で即座に復帰）
+            # ループ内で使うメソッド・オブジェクトを事前に束縛（毎周期の属性参照を省く）
+            shutdown_event = self._shutdown_event
+            check_config_updates = self._check_config_updates
+            perform_monitoring = self._perform_system_monitoring
+            perform_health_check = (self.system_controller.perform_health_check
+                                    if self.system_controller else None)
+            monotonic = time.monotonic
+            wait_fds = [shutdown_event]
+            if self._config_watch_fd is not None:
+                wait_fds.append(self._config_watch_fd)
+            
+            next_health_check = next_monitoring = monotonic()
+            while not shutdown_event.is_set():
                 try:
-                    # システム状態更新
-                    self._update_system_status()
-                    
                     # 設定更新チェック
-                    self._check_config_updates()
+                    check_config_updates()
                     
                     # 定期ヘルスチェック
-                    if self.system_controller:
-                        health_status = self.system_controller.perform_health_check()
+                    now = monotonic()
+                    if now >= next_health_check and perform_health_check:
+                        health_status = perform_health_check()
                         if not health_status.get('overall_healthy', True):
                             self.logger.warning(f"Health check issues: {health_status}")
+                    if now >= next_health_check:
+                        next_health_check = now + HEALTH_CHECK_INTERVAL
                     
-                    # 短時間待機
-                    time.sleep(1.0)
+                    # 定期システム監視
+                    if now >= next_monitoring:
+                        perform_monitoring()
+                        next_monitoring = now + MONITORING_INTERVAL
+                    
+                    next_wakeup = min(next_health_check, next_monitoring)
+                    select.select(wait_fds, [], [], max(0.0, next_wakeup - monotonic()))
+                    self._consecutive_errors = 0
                     
-                except KeyboardInterrupt:
-                    self.logger.info("Shutdown requested by user")
-                    break
                 except Exception as e:
                     context = ErrorContext(
                         module_name=__name__,
@@ -306,12 +450,12 @@ class InsectObserverSystem:
                     self.status.error_count += 1
                     self.status.last_error = str(e)
                     
-                    # エラー復旧試行
-                    if self.status.error_count < 5:
-                        time.sleep(5.0)  # 短時間待機後に継続
-                    else:
+                    # エラー復旧試行（連続して失敗し続ける場合のみ停止、一時的な集中は待機して継続）
+                    backoff = self._error_backoff()
+                    if backoff is None:
                         self.logger.critical("Too many errors, shutting down")
                         break
+                    self._shutdown_event.wait(backoff)
             
             self.logger.info("Main loop ended")
             
@@ -321,6 +465,29 @@ class InsectObserverSystem:
             self.status.is_running = False
             self.status.current_mode = "shutdown"
     
+    def _error_backoff(self) -> Optional[float]:
+        """
+        エラー発生を記録し、復旧までの待機時間を算出
+        
+        待機時間は直近ERROR_BACKOFF_WINDOW秒のエラー数に応じて倍増する。
+        正常な周期を挟まずにERROR_MAX_CONSECUTIVE回連続で失敗した場合
+        （カメラ・モデルの恒久的な故障等、待機の合計は約4分）は復旧不能として停止する。
+        
+        Returns:
+            Optional[float]: 待機時間（秒、ジッター付き指数バックオフ）。
+                連続失敗が上限に達した場合はNone（停止）
+        """
+        now = time.monotonic()
+        self._error_window.append(now)
+        self._consecutive_errors += 1
+        
+        if self._consecutive_errors >= ERROR_MAX_CONSECUTIVE:
+            return None
+        
+        recent = sum(1 for t in self._error_window if now - t < ERROR_BACKOFF_WINDOW)
+        backoff = min(ERROR_BACKOFF_MAX, ERROR_BACKOFF_BASE * 2 ** recent)
+        return backoff + random.random() * 0.1
+    
     def _perform_detection_cycle(self) -> Dict[str, Any]:
         """
         検出サイクル実行
@@ -328,9 +495,11 @@ class InsectObserverSystem:
         Returns:
             Dict[str, Any]: 検出結果
         """
+        status = self.status
         try:
-            self.status.current_mode = "detecting"
-            self.logger.debug("Starting detection cycle")
+            status.current_mode = "detecting"
+            if self._debug_enabled:
+                self.logger.debug("Starting detection cycle")
             
             if not self.detector or not self.detection_processor:
                 return {"error": "Detector not initialized"}
@@ -338,7 +507,8 @@ class InsectObserverSystem:
             # 検出実行
             detection_record = self.detector.detect_single_image(
                 use_ir_led=True,
-                save_result=True
+                save_result=True,
+                cancel_event=self._shutdown_event
             )
             
             if detection_record is None:
@@ -348,28 +518,30 @@ class InsectObserverSystem:
             processed_record = self.detection_processor.process_detection_record(detection_record)
             
             # 統計更新
-            self.status.total_detections += processed_record.detection_count
-            self.status.total_images_processed += 1
+            detection_count = processed_record.detection_count
+            status.total_detections += detection_count
+            status.total_images_processed += 1
             
-            if processed_record.detection_count > 0:
-                self.status.last_detection_time = processed_record.timestamp
+            if detection_count > 0:
+                status.last_detection_time = processed_record.timestamp
             
             result = {
                 "success": True,
                 "timestamp": processed_record.timestamp,
-                "detection_count": processed_record.detection_count,
+                "detection_count": detection_count,
                 "processing_time_ms": processed_record.processing_time_ms
             }
             
-            self.logger.debug(f"Detection cycle completed: {result}")
+            if self._debug_enabled:
+                self.logger.debug("Detection cycle completed: %s", result)
             return result
             
         except Exception as e:
             self.logger.error(f"Detection cycle failed: {e}")
-            self.status.error_count += 1
+            status.error_count += 1
             return {"error": str(e)}
         finally:
-            self.status.current_mode = "idle"
+            status.current_mode = "idle"
     
     def _perform_daily_analysis(self) -> None:
         """日次分析処理実行"""
@@ -423,33 +595,36 @@ class InsectObserverSystem:
         finally:
             self.status.current_mode = "idle"
     
-    def _system_monitoring_loop(self) -> None:
-        """システム監視ループ"""
+    def _perform_system_monitoring(self) -> None:
+        """システム監視（メインループから定期実行）"""
         try:
-            while self.status.is_running and not self.shutdown_requested:
-                try:
-                    # システムリソース監視
-                    self._monitor_system_resources()
-                    
-                    # モジュール健全性チェック
-                    self._check_module_health()
-                    
-                    # 長期間待機
-                    time.sleep(30.0)
-                    
-                except Exception as e:
-                    self.logger.error(f"System monitoring error: {e}")
-                    time.sleep(10.0)
-                    
+            # 状態取得は1周期1回（sysfs・カメラ状態の読み出しを共有）
+            hw_status = None
+            det_status = None
+            if self.hardware_controller:
+                hw_status = self.hardware_controller.get_system_status()
+            if self.detector:
+                det_status = self.detector.get_detailed_status()
+            
+            # システムリソース監視
+            self._monitor_system_resources(hw_status)
+            
+            # モジュール健全性チェック
+            self._check_module_health(hw_status, det_status)
+            
         except Exception as e:
-            self.logger.error(f"System monitoring loop failed: {e}")
+            self.logger.error(f"System monitoring error: {e}")
     
-    def _monitor_system_resources(self) -> None:
-        """システムリソース監視"""
+    def _monitor_system_resources(self, hw_status: Optional["HardwareStatus"]) -> None:
+        """
+        システムリソース監視
+        
+        Args:
+            hw_status: ハードウェア状態（未初期化時はNone）
+        """
         try:
             # CPU温度チェック
-            if self.hardware_controller:
-                hw_status = self.hardware_controller.get_system_status()
+            if hw_status is not None:
                 if hw_status.temperature > 80.0:  # 80℃以上で警告
                     self.logger.warning(f"High CPU temperature: {hw_status.temperature}°C")
                     
@@ -461,18 +636,23 @@ class InsectObserverSystem:
         except Exception as e:
             self.logger.error(f"Resource monitoring failed: {e}")
     
-    def _check_module_health(self) -> None:
-        """モジュール健全性チェック"""
+    def _check_module_health(self, hw_status: Optional["HardwareStatus"],
+                             det_status: Optional[Dict[str, Any]]) -> None:
+        """
+        モジュール健全性チェック
+        
+        Args:
+            hw_status: ハードウェア状態（未初期化時はNone）
+            det_status: 検出器詳細状態（未初期化時はNone）
+        """
         try:
             # 各モジュールの状態確認
             modules_status = {}
             
-            if self.hardware_controller:
-                hw_status = self.hardware_controller.get_system_status()
+            if hw_status is not None:
                 modules_status['hardware'] = hw_status.camera_initialized and hw_status.led_available
             
-            if self.detector:
-                det_status = self.detector.get_detailed_status()
+            if det_status is not None:
                 modules_status['detector'] = det_status['detector_status']['initialized']
             
             # 問題のあるモジュールがあれば警告
@@ -483,28 +663,73 @@ class InsectObserverSystem:
         except Exception as e:
             self.logger.error(f"Module health check failed: {e}")
     
-    def _update_system_status(self) -> None:
-        """システム状態更新"""
+    @property
+    def shutdown_requested(self) -> bool:
+        """終了要求の有無"""
+        return self._shutdown_event.is_set()
+    
+    @property
+    def uptime_seconds(self) -> float:
+        """稼働時間（秒、初期化完了からの経過時間）"""
+        if self._start_monotonic is None:
+            return 0.0
+        return time.monotonic() - self._start_monotonic
+    
+    def _open_config_watch(self) -> Optional[int]:
+        """
+        設定ファイル更新監視の開始（inotify）
+        
+        エディタの置き換え保存にも対応するため、設定ファイルのあるディレクトリを
+        監視し、イベントのファイル名で絞り込む。
+        
+        Returns:
+            Optional[int]: inotifyディスクリプタ（利用できない場合はNone）
+        """
         try:
-            if self.status.start_time:
-                start_datetime = datetime.fromisoformat(self.status.start_time)
-                self.status.uptime_seconds = (datetime.now() - start_datetime).total_seconds()
-                
-        except Exception as e:
-            self.logger.error(f"Status update failed: {e}")
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd < 0:
+                raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+            
+            config_dir = os.fsencode(self._config_path.parent)
+            if libc.inotify_add_watch(fd, config_dir, IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+                errno = ctypes.get_errno()
+                os.close(fd)
+                raise OSError(errno, "inotify_add_watch failed")
+            return fd
+            
+        except (OSError, AttributeError) as e:
+            self.logger.warning(f"Config file watch unavailable, "
+                                f"hot reload disabled: {e}")
+            return None
     
     def _check_config_updates(self) -> None:
-        """設定更新チェック"""
+        """設定更新チェック（inotifyイベントがある場合のみ読み出し）"""
+        if self._config_watch_fd is None:
+            return
+        
         try:
-            # 設定ファイルの更新時刻チェック（簡易実装）
-            config_file = Path(self.config_manager.config_path)
-            if config_file.exists():
-                current_mtime = config_file.stat().st_mtime
-                if hasattr(self, '_last_config_mtime'):
-                    if current_mtime > self._last_config_mtime:
-                        self.logger.info("Configuration file updated, reloading...")
-                        self._reload_configuration()
-                self._last_config_mtime = current_mtime
+            readable, _, _ = select.select([self._config_watch_fd], [], [], 0)
+            if not readable:
+                return
+            
+            updated = False
+            while True:
+                try:
+                    data = os.read(self._config_watch_fd, 4096)
+                except BlockingIOError:
+                    break
+                offset = 0
+                while offset < len(data):
+                    _, _, _, name_len = _INOTIFY_EVENT.unpack_from(data, offset)
+                    offset += _INOTIFY_EVENT.size
+                    name = data[offset:offset + name_len].rstrip(b'\0')
+                    offset += name_len
+                    updated = updated or name == self._config_name
+            
+            if updated:
+                self.logger.info("Configuration file updated, reloading...")
+                self._reload_configuration()
             
         except Exception as e:
             self.logger.error(f"Config update check failed: {e}")
@@ -514,8 +739,21 @@ class InsectObserverSystem:
         try:
             new_config = self.config_manager.load_config()
             
+            # 変更のあったセクションのみ反映（設定データクラスは値で比較）
+            changed_sections = [
+                name for name in _CONFIG_SECTIONS
+                if getattr(new_config, name, None) != getattr(self.config, name, None)
+            ]
+            if not changed_sections:
+                self.config = new_config
+                self.logger.info("Configuration reloaded, no runtime sections changed")
+                return
+            self.logger.info("Configuration sections changed: %s",
+                             ", ".join(changed_sections))
+            
             # 検出器設定更新
-            if self.detector:
+            if self.detector and new_config.detection != self.config.detection:
+                from insect_detector import DetectionSettings
                 detection_settings = DetectionSettings(
                     model_path=self.model_manager.get_model_path(),
                     confidence_threshold=new_config.detection.confidence_threshold,
@@ -525,8 +763,9 @@ class InsectObserverSystem:
                 self.detector.update_settings(detection_settings)
             
             # スケジューラー設定更新
-            if self.scheduler:
-                self.scheduler.update_detection_interval(new_config.system.detection_interval)
+            new_interval = new_config.system.detection_interval
+            if self.scheduler and new_interval != self.config.system.detection_interval:
+                self.scheduler.update_detection_interval(new_interval)
             
             self.config = new_config
             self.logger.info("Configuration reloaded successfully")
@@ -534,10 +773,22 @@ class InsectObserverSystem:
         except Exception as e:
             self.logger.error(f"Configuration reload failed: {e}")
     
-    def _signal_handler(self, signum, frame):
-        """シグナルハンドラ"""
-        self.logger.info(f"Received signal {signum}, initiating shutdown...")
-        self.shutdown_requested = True
+    def _sigwait_loop(self) -> None:
+        """
+        シグナル待機ループ（終了シグナル受信で終了要求を通知）
+        
+        メインループはイベントで終了する。メインループ外（初期化・単発検出・
+        分析モード）ではメインスレッドにKeyboardInterruptを送り、実行中の処理を
+        中断する。終了処理中に届いたシグナルは無視する。
+        """
+        while True:
+            signum = signal.sigwait(_SHUTDOWN_SIGNALS)
+            if self._shutdown_event.is_set():
+                continue
+            self.logger.info(f"Received signal {signum}, initiating shutdown...")
+            self._shutdown_event.set()
+            if not self._main_loop_started:
+                _thread.interrupt_main()
     
     def run_single_detection(self) -> Dict[str, Any]:
         """
@@ -564,8 +815,7 @@ class InsectObserverSystem:
         """
         try:
             if not self.activity_calculator or not self.visualizer:
-                if not self.initialize_system():
-                    return False
+                self._initialize_analysis_modules()
             
             # データ読み込み
             detection_data = self.activity_calculator.load_detection_data(date)
@@ -592,19 +842,9 @@ class InsectObserverSystem:
     
     def get_system_status(self) -> Dict[str, Any]:
         """システム状態取得"""
-        status_dict = {
-            "system_status": {
-                "is_running": self.status.is_running,
-                "start_time": self.status.start_time,
-                "uptime_seconds": self.status.uptime_seconds,
-                "current_mode": self.status.current_mode,
-                "total_detections": self.status.total_detections,
-                "total_images_processed": self.status.total_images_processed,
-                "last_detection_time": self.status.last_detection_time,
-                "error_count": self.status.error_count,
-                "last_error": self.status.last_error
-            }
-        }
+        system_status = asdict(self.status)
+        system_status["uptime_seconds"] = self.uptime_seconds
+        status_dict = {"system_status": system_status}
         
         # 各モジュールの状態
         if self.hardware_controller:
@@ -622,30 +862,35 @@ class InsectObserverSystem:
         """システム終了処理"""
         try:
             self.logger.info("Starting system shutdown...")
-            self.shutdown_requested = True
+            self._shutdown_event.set()
             self.status.current_mode = "shutdown"
             
             # スケジューラー停止
             if self.scheduler:
                 self.scheduler.stop()
             
-            # 各モジュールのクリーンアップ
+            # 各モジュールのクリーンアップ（相互に独立したものは並列に実行）
             modules = [
-                self.visualizer,
-                self.data_processor,
-                self.activity_calculator,
-                self.detection_processor,
-                self.detector,
-                self.hardware_controller,
-                self.model_manager
+                module for module in (
+                    self.visualizer,
+                    self.data_processor,
+                    self.activity_calculator,
+                    self.detection_processor,
+                    self.detector,
+                    self.model_manager,
+                    self.system_controller
+                )
+                if module and hasattr(module, 'cleanup')
             ]
+            if modules:
+                with ThreadPoolExecutor(
+                    max_workers=len(modules), thread_name_prefix="cleanup"
+                ) as executor:
+                    list(executor.map(self._cleanup_module, modules))
             
-            for module in modules:
-                if module and hasattr(module, 'cleanup'):
-                    try:
-                        module.cleanup()
-                    except Exception as e:
-                        self.logger.error(f"Module cleanup error: {e}")
+            # ハードウェアは検出器（IR LED消灯）の後に、呼び出し元スレッドで解放
+            if self.hardware_controller:
+                self._cleanup_module(self.hardware_controller)
             
             # 設定保存
             try:
@@ -653,28 +898,123 @@ class InsectObserverSystem:
             except Exception as e:
                 self.logger.error(f"Config save error: {e}")
             
+            # 設定ファイル監視終了
+            if self._config_watch_fd is not None:
+                os.close(self._config_watch_fd)
+                self._config_watch_fd = None
+            
+            # エラーハンドラー停止（保留中のエラーファイル・ログを書き出してから）
+            self.error_handler.cleanup()
+            
             self.status.is_running = False
             self.logger.info("System shutdown completed")
             
         except Exception as e:
             self.logger.error(f"System shutdown error: {e}")
+    
+    def _cleanup_module(self, module: Any) -> None:
+        """モジュールのクリーンアップ（失敗しても他のモジュールを妨げない）"""
+        try:
+            module.cleanup()
+        except Exception as e:
+            self.logger.error(f"Module cleanup error: {e}")
 
 
-def setup_logging(log_level: str = "INFO") -> None:
-    """ログ設定"""
+def setup_logging(log_level: str = "INFO", console_stream=None) -> None:
+    """
+    ログ設定
+    
+    ログファイルは日付が変わるとローテーションする（system.log.YYYY-MM-DD）。
+    ファイル・コンソールへの書き込みはQueueListenerのスレッドで行い、
+    SDカードの書き込み遅延が検出処理等の呼び出し元スレッドを止めないようにする。
+    
+    Args:
+        log_level: ログレベル
+        console_stream: コンソールログの出力先（省略時は標準出力）
+    """
+    global _log_listener
+    
+    # basicConfig同様、2回目以降の呼び出しでは何もしない
+    if _log_listener is not None:
+        return
+    
     log_dir = Path("./logs")
     log_dir.mkdir(exist_ok=True)
     
-    log_file = log_dir / f"system_{datetime.now().strftime('%Y%m%d')}.log"
-    
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
+    formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.handlers.TimedRotatingFileHandler(
+        log_dir / "system.log",
+        when='midnight',
+        backupCount=LOG_BACKUP_DAYS,
+        encoding='utf-8'
     )
+    stream_handler = logging.StreamHandler(console_stream or sys.stdout)
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler)
+    
+    # ログスレッドには終了シグナルを配送させない（シグナル待機スレッドが受信する）
+    old_mask = signal.pthread_sigmask(signal.SIG_BLOCK, _SHUTDOWN_SIGNALS)
+    try:
+        _log_listener.start()
+    finally:
+        signal.pthread_sigmask(signal.SIG_SETMASK, old_mask)
+    atexit.register(_stop_log_listener)
+    
+    # 書式化は書き込みスレッド側のハンドラーで行う
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    # log_level は呼び出し元の選択肢で大文字のレベル名に限定済み
+    logging.basicConfig(level=log_level, handlers=[queue_handler])
+    
+    # 検出周期毎に出力するロガーはルートまで辿らず直接キューへ渡す
+    for name in _HIGH_RATE_LOGGERS:
+        high_rate_logger = logging.getLogger(name)
+        high_rate_logger.addHandler(queue_handler)
+        high_rate_logger.propagate = False
+
+
+def _stop_log_listener() -> None:
+    """ログ書き込みスレッド停止（キューに残ったログを書き出してから終了）"""
+    global _log_listener
+    
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    JSON標準型以外の値の変換（orjson・jsonで同じ出力になるようにする）
+    
+    日時はISO 8601文字列、dataclassは辞書、numpy配列・スカラーはPythonの値、
+    その他は文字列とする。
+    """
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    return str(obj)
+
+
+def _dumps_result_line(result: Dict[str, Any]) -> bytes:
+    """検出結果をNDJSONの1行（UTF-8バイト列）に変換"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            result,
+            default=_json_default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                   | orjson.OPT_APPEND_NEWLINE,
+        )
+    return (json.dumps(result, ensure_ascii=False, separators=(',', ':'),
+                       default=_json_default) + "\n").encode('utf-8')
 
 
 def main():
@@ -707,7 +1047,9 @@ def main():
     args = parser.parse_args()
     
     # ログ設定
-    setup_logging(args.log_level)
+    # 単発検出モードでは標準出力を結果（NDJSON）専用とし、ログは標準エラーへ出す
+    setup_logging(args.log_level,
+                  sys.stderr if args.mode == 'single' else sys.stdout)
     logger = logging.getLogger(__name__)
     
     try:
@@ -727,8 +1069,12 @@ def main():
                 
         elif args.mode == 'single':
             # 単発検出モード
+            # 結果はNDJSON（1行1オブジェクト）で標準出力へ（スクリプトからの解析用）
             result = system.run_single_detection()
-            logger.info(f"Single detection result: {result}")
+            logger.debug("Single detection result: %s", result)
+            sys.stdout.flush()
+            sys.stdout.buffer.write(_dumps_result_line(result))
+            sys.stdout.buffer.flush()
             
         elif args.mode == 'analysis':
             # 分析モード
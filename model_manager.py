@@ -11,19 +11,44 @@ YOLOv8モデルの管理・ダウンロード・検証を行う。
 
 import logging
 import hashlib
+import importlib.util
 import json
+import mmap
+import os
 from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from datetime import datetime
 import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
 from urllib.parse import urlparse
 
+# Hugging Face 高速ダウンロードバックエンド
+# hf_transfer: 複数接続によるRust実装の並列転送（環境変数はhuggingface_hubの
+#   読み込み時に参照されるため、import前に有効化する）
+# hf_xet: 導入済みならhuggingface_hubがXet対応リポジトリで自動的に使用
+HF_TRANSFER_AVAILABLE = importlib.util.find_spec("hf_transfer") is not None
+HF_XET_AVAILABLE = importlib.util.find_spec("hf_xet") is not None
+if HF_TRANSFER_AVAILABLE:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 # Hugging Face Hub
 try:
+    import huggingface_hub
+    from huggingface_hub import constants as hf_constants
     from huggingface_hub import hf_hub_download, list_repo_files
+    from huggingface_hub.utils import (
+        EntryNotFoundError, HfHubHTTPError, RepositoryNotFoundError
+    )
     HF_HUB_AVAILABLE = True
+    # 0.23以降は中断したダウンロード（.incomplete）を常に再開し、
+    # resume_download 引数は非推奨のため旧バージョンでのみ指定する
+    _HF_HUB_VERSION = tuple(int(part) for part in
+                            huggingface_hub.__version__.split('.')[:2])
+    HF_RESUME_KWARGS = {} if _HF_HUB_VERSION >= (0, 23) else {'resume_download': True}
 except ImportError:
     HF_HUB_AVAILABLE = False
     logging.warning("huggingface_hub not available. Install with: pip install huggingface_hub")
@@ -40,6 +65,18 @@ except ImportError:
 # プロジェクト内モジュール
 from config.config_manager import ConfigManager
 
+# ETag取得（メタデータ問い合わせ）のタイムアウト（秒）
+DEFAULT_ETAG_TIMEOUT = 10.0
+
+# ハッシュ計算の読み込み単位（バイト）
+HASH_CHUNK_SIZE = 4 << 20
+
+# ダウンロード失敗時の再試行（待機時間は 2**試行回数 秒）
+HF_DOWNLOAD_MAX_ATTEMPTS = 5
+
+# 複数形式の並列ダウンロード数の上限（環境変数 HF_PARALLEL_DOWNLOADING_WORKERS で変更可）
+DEFAULT_DOWNLOAD_WORKERS = 8
+
 
 @dataclass
 class ModelInfo:
@@ -104,13 +141,19 @@ class ModelManager:
         # レジストリファイル
         self.registry_file = self.model_dir / "model_registry.json"
         
-        # モデルレジストリ
+        # モデルレジストリ（並列ダウンロード時の登録・保存を排他）
         self.registry = self._load_registry()
+        self._registry_lock = threading.Lock()
         
         # Hugging Face設定
         self.hf_repo_id = "Murasan/beetle-detection-yolov8"
         self.available_formats = ["pytorch", "onnx", "tflite"]
         
+        # ダウンロード設定（system.model_download で上書き可能）
+        download_config = self._get_download_config()
+        self.hf_etag_timeout = float(
+            download_config.get('etag_timeout', DEFAULT_ETAG_TIMEOUT))
+        
         # 可用性チェック
         self.available = YOLO_AVAILABLE
         self.hf_available = HF_HUB_AVAILABLE
@@ -118,8 +161,20 @@ class ModelManager:
         if not self.available:
             self.logger.error("YOLO not available for model management")
         
+        if self.hf_available:
+            if HF_XET_AVAILABLE:
+                self.logger.debug("hf_xet available for Hugging Face downloads")
+            if hf_constants.HF_HUB_ENABLE_HF_TRANSFER:
+                self.logger.debug("hf_transfer enabled for Hugging Face downloads")
+        
         self.logger.info("Model manager initialized")
     
+    def _get_download_config(self) -> Dict[str, Any]:
+        """ダウンロード設定取得（設定ファイルの system.model_download）"""
+        if self.config_manager is None or self.config_manager.config is None:
+            return {}
+        return self.config_manager.config.system.get('model_download', {})
+    
     def _load_registry(self) -> ModelRegistry:
         """モデルレジストリ読み込み"""
         try:
@@ -148,17 +203,19 @@ class ModelManager:
     def _save_registry(self) -> None:
         """モデルレジストリ保存"""
         try:
-            # データを辞書形式に変換
-            registry_data = {
-                'models': {name: asdict(info) for name, info in self.registry.models.items()},
-                'default_model': self.registry.default_model,
-                'last_updated': datetime.now().isoformat()
-            }
-            
-            with open(self.registry_file, 'w', encoding='utf-8') as f:
-                json.dump(registry_data, f, indent=2, ensure_ascii=False)
-            
-            self.registry.last_updated = datetime.now().isoformat()
+            with self._registry_lock:
+                # データを辞書形式に変換
+                registry_data = {
+                    'models': {name: asdict(info)
+                               for name, info in self.registry.models.items()},
+                    'default_model': self.registry.default_model,
+                    'last_updated': datetime.now().isoformat()
+                }
+                
+                with open(self.registry_file, 'w', encoding='utf-8') as f:
+                    json.dump(registry_data, f, indent=2, ensure_ascii=False)
+                
+                self.registry.last_updated = datetime.now().isoformat()
             self.logger.debug("Model registry saved")
             
         except Exception as e:
@@ -166,13 +223,16 @@ class ModelManager:
     
     def download_from_huggingface(self, 
                                  model_format: str = "pytorch",
-                                 force_download: bool = False) -> Optional[str]:
+                                 force_download: bool = False,
+                                 save_registry: bool = True) -> Optional[str]:
         """
         Hugging Faceからモデルダウンロード
         
         Args:
             model_format: モデル形式 ("pytorch", "onnx", "tflite")
             force_download: 強制再ダウンロード
+            save_registry: 登録後にレジストリを保存するか
+                （複数形式をまとめて取得する場合は呼び出し元で一度だけ保存）
             
         Returns:
             Optional[str]: ダウンロード済みモデルパス
@@ -205,12 +265,7 @@ class ModelManager:
                     return str(existing_path)
             
             # ダウンロード実行
-            downloaded_path = hf_hub_download(
-                repo_id=self.hf_repo_id,
-                filename=filename,
-                local_dir=str(self.model_dir),
-                force_download=force_download
-            )
+            downloaded_path = self._hf_download(filename, force_download)
             
             # モデル情報作成・登録
             model_info = self._create_model_info(
@@ -221,13 +276,16 @@ class ModelManager:
             )
             
             if model_info:
-                self.registry.models[model_name] = model_info
+                with self._registry_lock:
+                    self.registry.models[model_name] = model_info
+                    
+                    # デフォルトモデル設定（PyTorchモデルを優先）
+                    if (model_format.lower() == "pytorch"
+                            or not self.registry.default_model):
+                        self.registry.default_model = model_name
                 
-                # デフォルトモデル設定（PyTorchモデルを優先）
-                if model_format.lower() == "pytorch" or not self.registry.default_model:
-                    self.registry.default_model = model_name
-                
-                self._save_registry()
+                if save_registry:
+                    self._save_registry()
                 
                 self.logger.info(f"Model downloaded and registered: {downloaded_path}")
                 return downloaded_path
@@ -238,6 +296,106 @@ class ModelManager:
             self.logger.error(f"Hugging Face download failed: {e}")
             return None
     
+    def download_all_formats(self,
+                             formats: Optional[List[str]] = None,
+                             force_download: bool = False) -> Dict[str, Optional[str]]:
+        """
+        複数形式のモデルを並列ダウンロード
+        
+        Args:
+            formats: モデル形式のリスト（Noneの場合は全形式）
+            force_download: 強制再ダウンロード
+            
+        Returns:
+            Dict[str, Optional[str]]: 形式別のダウンロード済みモデルパス（失敗時はNone）
+        """
+        if formats is None:
+            formats = self.available_formats
+        if not formats:
+            return {}
+        
+        max_workers = min(len(formats), int(os.environ.get(
+            "HF_PARALLEL_DOWNLOADING_WORKERS", DEFAULT_DOWNLOAD_WORKERS)))
+        
+        results: Dict[str, Optional[str]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers,
+                                thread_name_prefix="model-download") as executor:
+            futures = {
+                executor.submit(self.download_from_huggingface,
+                                model_format, force_download, False): model_format
+                for model_format in formats
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        # レジストリ保存は全形式の登録後に一度だけ
+        if any(results.values()):
+            self._save_registry()
+        
+        return results
+    
+    def _hf_download(self, filename: str, force_download: bool) -> str:
+        """
+        hf_hub_download 実行（通信障害時は指数バックオフで再試行）
+        
+        中断したダウンロードは model_dir 内の .incomplete ファイルとして残り、
+        再試行・次回実行時にその続きから再開する（削除しないこと）。
+        
+        Args:
+            filename: リポジトリ内のファイル名
+            force_download: 強制再ダウンロード
+            
+        Returns:
+            str: ダウンロード済みファイルパス
+        """
+        download_kwargs = dict(
+            repo_id=self.hf_repo_id,
+            filename=filename,
+            local_dir=str(self.model_dir),
+            force_download=force_download,
+            etag_timeout=self.hf_etag_timeout,
+            **HF_RESUME_KWARGS
+        )
+        
+        for attempt in range(1, HF_DOWNLOAD_MAX_ATTEMPTS + 1):
+            try:
+                return self._hf_download_once(download_kwargs)
+            except (requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout,
+                    HfHubHTTPError) as e:
+                if attempt == HF_DOWNLOAD_MAX_ATTEMPTS or not self._is_retryable(e):
+                    raise
+                delay = 2 ** attempt
+                self.logger.warning(f"Download of {filename} failed "
+                                    f"(attempt {attempt}/{HF_DOWNLOAD_MAX_ATTEMPTS}), "
+                                    f"retrying in {delay}s: {e}")
+                time.sleep(delay)
+    
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """再試行で回復しうる通信エラーか（存在しないファイル・クライアントエラーは除く）"""
+        if isinstance(error, (RepositoryNotFoundError, EntryNotFoundError)):
+            return False
+        if isinstance(error, HfHubHTTPError):
+            response = getattr(error, 'response', None)
+            status = getattr(response, 'status_code', None)
+            return status is None or status == 429 or status >= 500
+        return True
+    
+    def _hf_download_once(self, download_kwargs: Dict[str, Any]) -> str:
+        """hf_hub_download 1回分（hf_transfer失敗時は通常のHTTP転送で再試行）"""
+        try:
+            return hf_hub_download(**download_kwargs)
+        except RuntimeError as e:
+            if not hf_constants.HF_HUB_ENABLE_HF_TRANSFER:
+                raise
+            # hf_transferはネットワーク障害に弱いため、以降は通常転送を使用
+            self.logger.warning(f"hf_transfer download failed, "
+                                f"retrying with standard HTTP: {e}")
+            hf_constants.HF_HUB_ENABLE_HF_TRANSFER = False
+            os.environ.pop("HF_HUB_ENABLE_HF_TRANSFER", None)
+            return hf_hub_download(**download_kwargs)
+    
     def add_local_model(self, 
                        model_path: str,
                        model_name: Optional[str] = None,
@@ -335,12 +493,22 @@ class ModelManager:
             return None
     
     def _calculate_file_hash(self, file_path: Path) -> str:
-        """ファイルハッシュ計算"""
+        """ファイルハッシュ計算（メモリマップ上の大きな区間を直接ハッシュに渡す）"""
         try:
             sha256_hash = hashlib.sha256()
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(chunk)
+                try:
+                    mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (ValueError, OSError):
+                    # 空ファイル・mmap非対応のファイルシステム（FUSE等）は逐次読み込み
+                    buffer = bytearray(HASH_CHUNK_SIZE)
+                    view = memoryview(buffer)
+                    while size := f.readinto(buffer):
+                        sha256_hash.update(view[:size])
+                else:
+                    with mapped, memoryview(mapped) as view:
+                        for offset in range(0, len(view), HASH_CHUNK_SIZE):
+                            sha256_hash.update(view[offset:offset + HASH_CHUNK_SIZE])
             return sha256_hash.hexdigest()
         except Exception as e:
             self.logger.error(f"Hash calculation failed: {e}")
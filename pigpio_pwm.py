@@ -0,0 +1,96 @@
+"""
+pigpio PWM出力モジュール
+
+IR LEDのPWM調光に使うpigpio出力（LED制御・ハードウェア制御で共通）。
+- ハードウェアPWM対応ピンではハードウェアPWM（デューティ変更は周期境界で反映）
+- その他のピンはpigpiodのDMAタイミングPWM
+"""
+
+from typing import Any, Optional
+
+# pigpioデーモン経由のDMAタイミングPWM（任意）
+try:
+    import pigpio
+    PIGPIO_AVAILABLE = True
+except ImportError:
+    pigpio = None
+    PIGPIO_AVAILABLE = False
+
+# pigpio PWMの分解能（デューティ比を0.1%刻みで指定）
+PIGPIO_PWM_RANGE = 1000
+
+# ハードウェアPWM対応ピン（PWM0: GPIO12/18, PWM1: GPIO13/19）
+HARDWARE_PWM_PINS = frozenset({12, 13, 18, 19})
+# ハードウェアPWMのデューティ比分解能（100万分率）
+HARDWARE_PWM_RANGE = 1_000_000
+
+
+class PigpioPWM:
+    """
+    pigpioによるPWM出力（ハードウェアPWM対応ピンではハードウェアPWM）
+    
+    デューティ比は明度（0.0-1.0）で指定し、出力方式の分解能へ変換して設定する。
+    """
+    
+    name = "pigpio"
+    
+    def __init__(self, pi: Any, pin: int, frequency: int):
+        """
+        PWM出力開始（デューティ比0%）
+        
+        Args:
+            pi: 接続済みのpigpio.pi
+            pin: GPIOピン番号（BCM）
+            frequency: PWM周波数（Hz）
+        """
+        self.pi = pi
+        self.pin = pin
+        self.hardware_pwm = pin in HARDWARE_PWM_PINS
+        if self.hardware_pwm:
+            pi.hardware_PWM(pin, frequency, 0)
+            self.frequency = frequency
+        else:
+            pi.set_mode(pin, pigpio.OUTPUT)
+            pi.set_PWM_frequency(pin, frequency)
+            pi.set_PWM_range(pin, PIGPIO_PWM_RANGE)
+            pi.set_PWM_dutycycle(pin, 0)
+            # DMA PWMはサンプリング周期で決まる近い周波数に丸められる
+            self.frequency = pi.get_PWM_frequency(pin)
+    
+    @classmethod
+    def connect(cls, pin: int, frequency: int) -> Optional['PigpioPWM']:
+        """
+        pigpiodへ接続してPWM出力開始
+        
+        Returns:
+            Optional[PigpioPWM]: PWM出力（pigpiod未起動時はNone）
+        """
+        pi = pigpio.pi()
+        if not pi.connected:
+            pi.stop()
+            return None
+        return cls(pi, pin, frequency)
+    
+    def set_brightness(self, brightness: float) -> None:
+        """デューティ比設定（0.0-1.0）"""
+        if self.hardware_pwm:
+            self.pi.hardware_PWM(self.pin, self.frequency,
+                                 int(brightness * HARDWARE_PWM_RANGE))
+        else:
+            self.pi.set_PWM_dutycycle(self.pin, int(brightness * PIGPIO_PWM_RANGE))
+    
+    def release(self) -> None:
+        """PWM出力停止（ピンは出力モードのまま、次のset_brightnessで再開）"""
+        if self.hardware_pwm:
+            self.pi.hardware_PWM(self.pin, 0, 0)
+            self.pi.set_mode(self.pin, pigpio.OUTPUT)
+        else:
+            self.pi.set_PWM_dutycycle(self.pin, 0)
+    
+    def close(self) -> None:
+        """PWM停止と接続解放"""
+        if self.hardware_pwm:
+            self.pi.hardware_PWM(self.pin, 0, 0)
+        else:
+            self.pi.set_PWM_dutycycle(self.pin, 0)
+        self.pi.stop()
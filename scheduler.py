@@ -73,13 +73,16 @@ class SchedulerManager:
     
     def __init__(self, 
                  detection_interval: int = 300,  # 5分間隔
-                 analysis_time: str = "23:00"):  # 23時に日次分析
+                 analysis_time: str = "23:00",  # 23時に日次分析
+                 shutdown_event: Optional[threading.Event] = None):
         """
         スケジューラー初期化
         
         Args:
             detection_interval: 検出間隔 (秒)
             analysis_time: 日次分析時刻 (HH:MM)
+            shutdown_event: 呼び出し元と共有する終了イベント
+                （セットされるとスケジューラーループ・待機処理が即座に復帰）
         """
         self.logger = logging.getLogger(__name__ + '.SchedulerManager')
         
@@ -99,7 +102,8 @@ class SchedulerManager:
         
         # スレッド管理
         self.scheduler_thread: Optional[threading.Thread] = None
-        self.shutdown_event = threading.Event()
+        self._owns_shutdown_event = shutdown_event is None
+        self.shutdown_event = shutdown_event or threading.Event()
         
         # 実行時間履歴
         self.execution_times: List[float] = []
@@ -243,7 +247,9 @@ class SchedulerManager:
             
             self.running = True
             self.start_time = datetime.now()
-            self.shutdown_event.clear()
+            # 共有イベントは呼び出し元の終了要求を消さないようクリアしない
+            if self._owns_shutdown_event:
+                self.shutdown_event.clear()
             
             # スケジューラースレッド開始
             self.scheduler_thread = threading.Thread(
@@ -297,7 +303,8 @@ class SchedulerManager:
                 
                 # 自動再開タスク
                 def resume_detection():
-                    time.sleep(duration_seconds)
+                    if self.shutdown_event.wait(duration_seconds):
+                        return
                     if "detection_task" in self.tasks:
                         self.tasks["detection_task"].enabled = True
                         self.logger.info("Detection resumed automatically")
@@ -340,12 +347,12 @@ class SchedulerManager:
                     # 統計更新
                     self._update_stats()
                     
-                    # 短時間待機
-                    time.sleep(1.0)
+                    # 短時間待機（終了要求で即座に復帰）
+                    self.shutdown_event.wait(1.0)
                     
                 except Exception as e:
                     self.logger.error(f"Scheduler loop error: {e}")
-                    time.sleep(5.0)  # エラー時は少し長く待機
+                    self.shutdown_event.wait(5.0)  # エラー時は少し長く待機
                     
         except Exception as e:
             self.logger.error(f"Scheduler loop failed: {e}")
@@ -446,22 +453,13 @@ class SchedulerManager:
     def _wait_for_tasks_completion(self, timeout: int = 30) -> None:
         """実行中タスクの完了待機"""
         try:
-            start_time = time.time()
+            deadline = time.monotonic() + timeout
             
-            while self.task_threads and (time.time() - start_time) < timeout:
-                # 完了したスレッドを削除
-                completed_threads = []
-                for task_id, thread in self.task_threads.items():
-                    if not thread.is_alive():
-                        completed_threads.append(task_id)
-                
-                for task_id in completed_threads:
-                    del self.task_threads[task_id]
-                
-                if self.task_threads:
-                    time.sleep(1.0)
-                else:
-                    break
+            # 各タスクの終了をjoinで待機（完了次第すぐに復帰）
+            for task_id, thread in list(self.task_threads.items()):
+                thread.join(timeout=max(0.0, deadline - time.monotonic()))
+                if not thread.is_alive():
+                    self.task_threads.pop(task_id, None)
             
             # タイムアウト時の強制終了
             if self.task_threads:
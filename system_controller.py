@@ -649,6 +649,9 @@ class SystemController:
             self.detection_history.clear()
             self.performance_history.clear()
             
+            # 保留中のエラーファイル書き込み・ログ出力を完了させて停止
+            self.error_handler.cleanup()
+            
             self.logger.info("System controller cleaned up successfully")
             
         except Exception as e: